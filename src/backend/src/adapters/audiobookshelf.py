@@ -1,5 +1,7 @@
 """Audiobookshelf audiobook/podcast server adapter."""
 
+import asyncio
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -11,6 +13,12 @@ from .base import (
     TokenAuthAdapter,
 )
 
+# How long the library list is reused before it is fetched again (seconds)
+LIBRARIES_TTL_SECONDS = 300.0
+
+# Maximum number of library searches sent at once
+MAX_CONCURRENT_LIBRARY_SEARCHES = 4
+
 
 class AudiobookshelfAdapter(TokenAuthAdapter):
     """Adapter for Audiobookshelf audiobook/podcast server.
@@ -18,6 +26,11 @@ class AudiobookshelfAdapter(TokenAuthAdapter):
     Uses Bearer token authentication via API token.
     """
 
+    def __init__(self, service_config, *args, **kwargs):
+        super().__init__(service_config, *args, **kwargs)
+        # (expires_at, libraries); pooled adapters reuse the list between tool calls
+        self._libraries_cache: Optional[tuple] = None
+
     @property
     def service_type(self) -> str:
         return "audiobookshelf"
@@ -68,10 +81,10 @@ class AudiobookshelfAdapter(TokenAuthAdapter):
         url = f"{self.base_url.rstrip('/')}{endpoint}"
         headers = self._get_auth_header()
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(method, url, params=params, json=json, headers=headers)
-            response.raise_for_status()
-            return response
+        await self._ensure_client()
+        response = await self._send_request(method, url, params=params, json=json, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response
 
     async def test_connection(self) -> ConnectionTestResult:
         """Test connection to Audiobookshelf."""
@@ -161,14 +174,21 @@ class AudiobookshelfAdapter(TokenAuthAdapter):
         except Exception as e:
             return {"service": "audiobookshelf", "version": "unknown", "status": "error", "error": str(e)}
 
-    async def get_libraries(self) -> List[Dict[str, Any]]:
-        """Get list of libraries."""
+    async def get_libraries(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get list of libraries (cached for ``LIBRARIES_TTL_SECONDS``).
+
+        Args:
+            refresh: Bypass the cached list
+        """
+        if not refresh and self._libraries_cache and self._libraries_cache[0] > time.monotonic():
+            return list(self._libraries_cache[1])
+
         try:
             response = await self._make_request("GET", "/api/libraries")
             data = response.json()
             libraries = data.get("libraries", [])
 
-            return [
+            formatted = [
                 {
                     "id": lib.get("id"),
                     "name": lib.get("name"),
@@ -184,6 +204,8 @@ class AudiobookshelfAdapter(TokenAuthAdapter):
                 }
                 for lib in libraries
             ]
+            self._libraries_cache = (time.monotonic() + LIBRARIES_TTL_SECONDS, formatted)
+            return list(formatted)
         except Exception as e:
             self.logger.error(f"Failed to get libraries: {e}")
             return []
@@ -342,6 +364,25 @@ class AudiobookshelfAdapter(TokenAuthAdapter):
             self.logger.error(f"Failed to search: {e}")
             return {"book": [], "podcast": [], "authors": [], "series": []}
 
+    async def search_libraries(self, library_ids: List[str], query: str, limit: int = 25) -> List[Dict[str, Any]]:
+        """Search several libraries concurrently.
+
+        Args:
+            library_ids: Libraries to search
+            query: Search query
+            limit: Maximum results per library
+
+        Returns:
+            Search results of each library, in the order of ``library_ids``
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LIBRARY_SEARCHES)
+
+        async def search_library(library_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search(library_id, query, limit=limit)
+
+        return list(await asyncio.gather(*(search_library(library_id) for library_id in library_ids)))
+
     async def get_users(self) -> List[Dict[str, Any]]:
         """Get list of users (admin only)."""
         try:
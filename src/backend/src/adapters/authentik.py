@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
@@ -13,6 +13,7 @@ from .base import (
     ServiceCapability,
     TokenAuthAdapter,
 )
+from .pagination import Page
 
 
 class UserStatus(Enum):
@@ -163,24 +164,7 @@ class AuthentikAdapter(TokenAuthAdapter):
             data = response.json()
 
             # Process users
-            users = []
-            for user in data.get("results", []):
-                users.append(
-                    {
-                        "pk": user.get("pk"),
-                        "username": user.get("username"),
-                        "name": user.get("name"),
-                        "email": user.get("email"),
-                        "is_active": user.get("is_active"),
-                        "is_superuser": user.get("is_superuser"),
-                        "is_staff": user.get("is_staff"),
-                        "date_joined": user.get("date_joined"),
-                        "last_login": user.get("last_login"),
-                        "groups": user.get("groups", []),
-                        "avatar": user.get("avatar"),
-                        "attributes": user.get("attributes", {}),
-                    }
-                )
+            users = [self._format_user(user) for user in data.get("results", [])]
 
             return {
                 "users": users,
@@ -198,6 +182,58 @@ class AuthentikAdapter(TokenAuthAdapter):
             self.logger.error(f"Failed to get users: {e}")
             return {"users": [], "pagination": {"page": page, "page_size": page_size, "count": 0}}
 
+    def iter_users(
+        self,
+        page_size: int = 100,
+        search: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every Authentik user, fetching the next pages concurrently.
+
+        Args:
+            page_size: Users requested per page
+            search: Optional search filter
+            is_active: Optional active status filter
+            max_items: Stop after this many users
+
+        Returns:
+            Async iterator over users (formatted like ``get_users``)
+        """
+        params = {"page_size": str(page_size)}
+        if search:
+            params["search"] = search
+        if is_active is not None:
+            params["is_active"] = str(is_active).lower()
+
+        async def fetch_page(index: int) -> Page:
+            response = await self._make_request("GET", "/api/v3/core/users/", params={**params, "page": str(index + 1)})
+            data = response.json()
+            return Page(
+                [self._format_user(user) for user in data.get("results", [])],
+                data.get("pagination", {}).get("count"),
+            )
+
+        return self.iter_pages(fetch_page, page_size, max_items=max_items)
+
+    @staticmethod
+    def _format_user(user: Dict[str, Any]) -> Dict[str, Any]:
+        """Format an Authentik user."""
+        return {
+            "pk": user.get("pk"),
+            "username": user.get("username"),
+            "name": user.get("name"),
+            "email": user.get("email"),
+            "is_active": user.get("is_active"),
+            "is_superuser": user.get("is_superuser"),
+            "is_staff": user.get("is_staff"),
+            "date_joined": user.get("date_joined"),
+            "last_login": user.get("last_login"),
+            "groups": user.get("groups", []),
+            "avatar": user.get("avatar"),
+            "attributes": user.get("attributes", {}),
+        }
+
     async def get_user_by_id(self, user_pk: int) -> Optional[Dict[str, Any]]:
         """Get a specific user by ID."""
         try:
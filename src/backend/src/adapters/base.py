@@ -4,16 +4,29 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence
 
 import httpx
 
+from ..services.circuit_breaker import CircuitBreaker, get_service_breaker
+from .conditional_cache import conditional_response_cache
+from .json_payloads import decode_json_response
+from .pagination import DEFAULT_MAX_BUFFERED_ITEMS, DEFAULT_PREFETCH_PAGES, PageFetcher, iter_pages
+from .pool import http_client_pool, service_config_fingerprint
+
 if TYPE_CHECKING:
     from src.models.service_config import ServiceConfig
 
 logger = logging.getLogger(__name__)
 
 
+def service_base_url(base_url: str, port: Optional[int] = None) -> str:
+    """Base URL of a service instance, with its configured port unless the URL already has one."""
+    if port and ":" not in base_url.split("://", 1)[-1]:
+        return f"{base_url}:{port}"
+    return base_url
+
+
 class ConnectionTestResult:
     """Result of a service connection test."""
 
@@ -71,31 +84,57 @@ class BaseServiceAdapter(ABC):
         await self.close()
 
     async def _ensure_client(self):
-        """Ensure HTTP client is initialized."""
-        if self._client is None:
+        """Ensure HTTP client is initialized.
+
+        Clients come from the shared pool so connections are kept alive and
+        reused across adapter instances with the same configuration.
+        """
+        if self._client is None or self._client.is_closed:
             headers = self.get_auth_headers()
-            self._client = httpx.AsyncClient(
+            options = self._client_options()
+            config_hash = service_config_fingerprint(
+                self.service_config, self.base_url, headers, self.timeout, self.verify_ssl, sorted(options)
+            )
+            self._client = http_client_pool.get_client(
+                self.pool_key,
+                config_hash,
                 base_url=self.base_url,
                 headers=headers,
                 timeout=self.timeout,
                 verify=self.verify_ssl,
                 follow_redirects=True,
+                **options,
             )
 
+    def _client_options(self) -> Dict[str, Any]:
+        """Extra ``httpx.AsyncClient`` arguments for adapters that need them."""
+        return {}
+
+    @property
+    def pool_key(self) -> str:
+        """Identifier of this service in the shared HTTP client pool."""
+        service_id = getattr(self.service_config, "id", None)
+        if service_id:
+            return str(service_id)
+        return f"{self.service_type}:{self.base_url}"
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Breaker guarding the calls to this service instance (None when breakers are disabled)."""
+        return get_service_breaker(self.service_type, self.base_url, is_service_failure)
+
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client.
+
+        Pooled clients stay open for reuse; they are closed on shutdown, or
+        shortly after the service is updated, disabled or deleted.
+        """
+        self._client = None
 
     @property
     def base_url(self) -> str:
         """Get the base URL for the service."""
-        url = self.service_config.base_url
-        if self.service_config.port:
-            if ":" not in url.split("://", 1)[1]:  # No port specified
-                url = f"{url}:{self.service_config.port}"
-        return url
+        return service_base_url(self.service_config.base_url, self.service_config.port)
 
     @property
     def public_url(self) -> str:
@@ -150,12 +189,13 @@ class BaseServiceAdapter(ABC):
         Raises:
             httpx.RequestError: For network errors
             httpx.HTTPStatusError: For HTTP errors
+            CircuitBreakerError: When the service's circuit breaker is open
         """
         await self._ensure_client()
 
         start_time = datetime.utcnow()
         try:
-            response = await self._client.request(method, endpoint, **kwargs)
+            response = await self._send_request(method, endpoint, **kwargs)
             response.raise_for_status()
 
             end_time = datetime.utcnow()
@@ -172,6 +212,91 @@ class BaseServiceAdapter(ABC):
             self.logger.error(f"HTTP error: {method} {endpoint} - " f"{e.response.status_code} {e.response.text}")
             raise
 
+    async def _send_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a request on the pooled client, revalidating GETs against a stored response.
+
+        GET responses with an ``ETag`` or ``Last-Modified`` validator are stored;
+        the next identical GET is sent as a conditional request and a
+        ``304 Not Modified`` answer is replaced by the stored response. If that
+        response was evicted in the meantime, the request is sent again
+        without validators.
+
+        Requests go through the service's circuit breaker: network errors,
+        timeouts and 5xx answers count as failures, and while the circuit is
+        open requests fail fast with ``CircuitBreakerError``.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint or URL
+            **kwargs: Additional arguments for httpx request
+
+        Returns:
+            HTTP response (status is not checked)
+        """
+        cache_key = None
+        validators = {}
+        if conditional_response_cache.enabled and method.upper() == "GET":
+            headers = kwargs.get("headers") or {}
+            cache_key = conditional_response_cache.make_key(
+                self.pool_key, self.base_url, endpoint, kwargs.get("params"), headers
+            )
+            validators = conditional_response_cache.conditional_headers(cache_key)
+            if validators:
+                kwargs["headers"] = {**headers, **validators}
+
+        response = await self._guarded_request(method, endpoint, **kwargs)
+        if cache_key is not None:
+            if response.status_code == 304:
+                stored = conditional_response_cache.not_modified(cache_key, response)
+                if stored is not None:
+                    return stored
+                if validators:
+                    # The stored response was evicted while the request was in flight
+                    kwargs["headers"] = headers
+                    response = await self._guarded_request(method, endpoint, **kwargs)
+            if response.is_success:
+                conditional_response_cache.store(cache_key, response)
+        return response
+
+    async def _guarded_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a request on the pooled client through the service's circuit breaker."""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._client.request(method, endpoint, **kwargs)
+
+        async def send() -> httpx.Response:
+            response = await self._client.request(method, endpoint, **kwargs)
+            if response.status_code >= 500:
+                raise ServerErrorResponse(response)
+            return response
+
+        try:
+            return await breaker.call(send)
+        except ServerErrorResponse as e:
+            # Recorded as a failure; callers still get the response to handle as before
+            return e.response
+
+    async def _request_json(self, method: str, endpoint: str, fields: Optional[Sequence[str]] = None, **kwargs) -> Any:
+        """Make an HTTP request and decode its JSON body.
+
+        Large bodies are decoded in a worker thread instead of on the event loop.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (will be appended to base_url)
+            fields: When the body is an array, fields kept in each item (None keeps everything)
+            **kwargs: Additional arguments for httpx request
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            httpx.RequestError: For network errors
+            httpx.HTTPStatusError: For HTTP errors
+        """
+        response = await self._make_request(method, endpoint, **kwargs)
+        return await decode_json_response(response, fields)
+
     async def _safe_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Make a safe HTTP request that returns None on error.
 
@@ -184,6 +309,49 @@ class BaseServiceAdapter(ABC):
             self.logger.warning(f"Safe request failed: {method} {endpoint} - {e}")
             return None
 
+    def iter_pages(
+        self,
+        fetch_page: PageFetcher,
+        page_size: int,
+        max_items: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH_PAGES,
+        max_buffered_items: int = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a paginated endpoint, prefetching the next pages.
+
+        Args:
+            fetch_page: Coroutine function fetching a page by zero-based index
+            page_size: Items requested per page
+            max_items: Stop after this many items
+            prefetch: Pages fetched ahead of the one being consumed
+            max_buffered_items: Upper bound of items held in prefetched pages
+
+        Returns:
+            Async iterator over the items, in upstream order
+        """
+        return iter_pages(
+            fetch_page,
+            page_size,
+            prefetch=prefetch,
+            max_items=max_items,
+            max_buffered_items=max_buffered_items,
+        )
+
+    async def iter_users(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the users of the service.
+
+        Adapters with paginated user endpoints override this; the default
+        wraps ``get_users()`` for adapters that return every user at once.
+        """
+        get_users = getattr(self, "get_users", None)
+        if get_users is None:
+            return
+        users = await get_users()
+        if isinstance(users, dict):
+            users = users.get("users", [])
+        for user in users or []:
+            yield user
+
     def has_capability(self, capability: ServiceCapability) -> bool:
         """Check if this adapter supports a specific capability."""
         return capability in self.supported_capabilities
@@ -305,6 +473,19 @@ class BasicAuthAdapter(AuthenticatedAdapter):
             return False
 
 
+def is_service_failure(error: BaseException) -> bool:
+    """Whether an exception raised by a request means the service is unavailable."""
+    return isinstance(error, (httpx.TransportError, ServerErrorResponse))
+
+
+class ServerErrorResponse(Exception):
+    """A 5xx answer, raised inside the circuit breaker so it counts as a failure."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"{response.status_code} {response.reason_phrase}")
+        self.response = response
+
+
 # Exception classes for adapters
 class AdapterError(Exception):
     """Base exception for adapter errors."""
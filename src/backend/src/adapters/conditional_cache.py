@@ -0,0 +1,185 @@
+"""HTTP conditional-request cache for service adapters.
+
+Adapters re-downloaded unchanged resources in full on every call. Successful
+GET responses carrying an ``ETag`` or ``Last-Modified`` validator are now kept
+per service, endpoint and parameters; the next identical request is sent with
+``If-None-Match`` / ``If-Modified-Since`` and a ``304 Not Modified`` answer is
+served from the stored body. Stored bodies are bounded by a memory budget and
+evicted least recently used first.
+"""
+
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional
+
+import httpx
+
+# Response headers kept with a cached body
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and its validators."""
+
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+
+class ConditionalResponseCache:
+    """Memory-bounded LRU store of GET responses revalidated with conditional requests."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: int = 8 * 1024 * 1024):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for stored bodies and headers
+            max_entry_bytes: Larger responses are not stored
+        """
+        self.enabled = True
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {"revalidated": 0, "modified": 0, "stored": 0, "evictions": 0}
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+    ) -> None:
+        """Update cache settings."""
+        if enabled is not None:
+            self.enabled = enabled
+            if not enabled:
+                self.clear()
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if max_entry_bytes is not None:
+            self.max_entry_bytes = max_entry_bytes
+        self._evict()
+
+    @staticmethod
+    def make_key(
+        service_key: str, base_url: str, endpoint: str, params: Any, headers: Optional[Dict[str, str]] = None
+    ) -> Hashable:
+        """Build the key of a GET request (per-request headers may change the response)."""
+        if isinstance(params, dict):
+            params = json.dumps(params, sort_keys=True, default=str)
+        elif params is not None:
+            params = json.dumps(params, default=str)
+        if headers:
+            headers = json.dumps(dict(headers), sort_keys=True, default=str)
+        return (service_key, base_url, endpoint, params, headers or None)
+
+    def conditional_headers(self, key: Hashable) -> Dict[str, str]:
+        """Get the validators to send with a request, if a response is stored for it."""
+        if not self.enabled:
+            return {}
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def not_modified(self, key: Hashable, response: httpx.Response) -> Optional[httpx.Response]:
+        """Rebuild the stored response after a ``304 Not Modified`` answer.
+
+        Returns:
+            The stored response, or None if nothing is stored for the request
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self._stats["revalidated"] += 1
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=response.request,
+        )
+
+    def store(self, key: Hashable, response: httpx.Response) -> None:
+        """Store a successful response if it carries a validator and fits the budget."""
+        if not self.enabled:
+            return
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            # Nothing to revalidate with; drop an entry the server no longer validates
+            self._discard(key)
+            return
+
+        if key in self._entries:
+            self._stats["modified"] += 1
+        self._discard(key)
+
+        # The body is stored decoded, so Content-Encoding is not kept
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        entry = CachedResponse(response.status_code, headers, response.content, etag, last_modified)
+        if entry.size > min(self.max_entry_bytes, self.max_bytes):
+            return
+
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._stats["stored"] += 1
+        self._evict()
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and self._bytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats["evictions"] += 1
+
+    def invalidate(self, service_key: Optional[str] = None) -> int:
+        """Drop stored responses of one service (by pool key) or of every service.
+
+        Returns:
+            Number of entries removed
+        """
+        if service_key is None:
+            count = len(self._entries)
+            self.clear()
+            return count
+        keys = [key for key in self._entries if key[0] == service_key]
+        for key in keys:
+            self._discard(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Global instance
+conditional_response_cache = ConditionalResponseCache()
@@ -1,10 +1,12 @@
 """Deluge torrent client adapter."""
 
+import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from ..services.circuit_breaker import CircuitBreakerError
 from .base import (
     AdapterError,
     AuthenticationError,
@@ -12,15 +14,41 @@ from .base import (
     ConnectionTestResult,
     ServiceCapability,
 )
+from .json_payloads import decode_json_response
+
+# Deluge Web JSON-RPC error code for calls made without a valid session
+RPC_NOT_AUTHENTICATED = 1
+
+TORRENT_FIELDS = [
+    "name",
+    "state",
+    "progress",
+    "download_payload_rate",
+    "upload_payload_rate",
+    "eta",
+    "total_size",
+    "total_done",
+    "ratio",
+    "num_seeds",
+    "num_peers",
+    "time_added",
+]
 
 
 class DelugeAdapter(BaseServiceAdapter):
-    """Adapter for Deluge BitTorrent client."""
+    """Adapter for Deluge BitTorrent client.
 
-    def __init__(self, service_config):
-        super().__init__(service_config)
+    The Deluge Web session cookie lives in the cookie jar of the pooled HTTP
+    client, so every adapter sharing that client reuses one authenticated
+    session. Login happens on first use and again only when Deluge reports
+    that the session is no longer valid.
+    """
+
+    def __init__(self, service_config, *args, **kwargs):
+        super().__init__(service_config, *args, **kwargs)
         self._request_id = 0
         self._session_cookie = None
+        self._auth_lock = asyncio.Lock()
 
     @property
     def service_type(self) -> str:
@@ -44,7 +72,7 @@ class DelugeAdapter(BaseServiceAdapter):
         return self._request_id
 
     async def _auth(self) -> bool:
-        """Authenticate with Deluge Web API."""
+        """Authenticate with Deluge Web API (the session cookie is kept by the pooled client)."""
         try:
             # Try password field first, then api_key as fallback
             password = (
@@ -55,50 +83,115 @@ class DelugeAdapter(BaseServiceAdapter):
                 or ""
             )
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/json",
-                    json={"method": "auth.login", "params": [password], "id": self._get_next_request_id()},
-                    headers={"Content-Type": "application/json"},
-                )
+            await self._ensure_client()
+            response = await self._send_request(
+                "POST",
+                "/json",
+                json={"method": "auth.login", "params": [password], "id": self._get_next_request_id()},
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("result"):
-                        # Store session cookie
-                        self._session_cookie = response.cookies.get("_session_id")
-                        return True
-                return False
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("result"):
+                    self._session_cookie = self._client.cookies.get("_session_id")
+                    return True
+            return False
+        except CircuitBreakerError:
+            raise
         except Exception as e:
             self.logger.error(f"Authentication failed: {e}")
             return False
 
+    async def _ensure_session(self, force: bool = False) -> None:
+        """Log in unless the pooled client already holds a session cookie.
+
+        Args:
+            force: Log in again even if a session cookie is present (it was rejected)
+        """
+        await self._ensure_client()
+        rejected_cookie = self._client.cookies.get("_session_id") if force else None
+
+        async with self._auth_lock:
+            cookie = self._client.cookies.get("_session_id")
+            # Another call may have logged in again while we were waiting
+            if cookie and cookie != rejected_cookie:
+                self._session_cookie = cookie
+                return
+            if not await self._auth():
+                raise AuthenticationError("Failed to authenticate with Deluge")
+
+    async def _post_rpc(self, method: str, params: List) -> Dict[str, Any]:
+        """Send one JSON-RPC request and return the decoded response."""
+        try:
+            response = await self._make_request(
+                "POST", "/json", json={"method": method, "params": params, "id": self._get_next_request_id()}
+            )
+        except httpx.HTTPStatusError as e:
+            raise AdapterError(f"HTTP error: {e.response.status_code}") from e
+        # Torrent lists of large seedboxes are decoded off the event loop
+        return await decode_json_response(response)
+
+    @staticmethod
+    def _is_auth_error(error: Any) -> bool:
+        if isinstance(error, dict):
+            return (
+                error.get("code") == RPC_NOT_AUTHENTICATED
+                or "not authenticated" in str(error.get("message", "")).lower()
+            )
+        return "not authenticated" in str(error).lower()
+
     async def _rpc_call(self, method: str, params: Optional[List] = None) -> Any:
-        """Make a JSON-RPC call to Deluge."""
+        """Make a JSON-RPC call to Deluge, logging in again once if the session expired."""
         if params is None:
             params = []
 
-        # Ensure we're authenticated
-        if not self._session_cookie:
-            if not await self._auth():
-                raise AuthenticationError("Failed to authenticate with Deluge")
+        await self._ensure_session()
+        data = await self._post_rpc(method, params)
 
-        cookies = {"_session_id": self._session_cookie} if self._session_cookie else {}
+        if data.get("error") and self._is_auth_error(data["error"]):
+            await self._ensure_session(force=True)
+            data = await self._post_rpc(method, params)
 
-        async with httpx.AsyncClient(timeout=30.0, cookies=cookies) as client:
-            response = await client.post(
-                f"{self.base_url}/json",
-                json={"method": method, "params": params, "id": self._get_next_request_id()},
-                headers={"Content-Type": "application/json"},
-            )
+        if data.get("error"):
+            raise AdapterError(f"RPC error: {data['error']}")
+        return data.get("result")
 
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("error"):
-                    raise AdapterError(f"RPC error: {data['error']}")
-                return data.get("result")
-            else:
-                raise AdapterError(f"HTTP error: {response.status_code}")
+    async def _rpc_batch(self, calls: List[Tuple[str, Optional[List]]]) -> List[Any]:
+        """Make several JSON-RPC calls in one pipelined burst.
+
+        Deluge Web does not accept JSON-RPC batch arrays, so the calls are sent
+        concurrently over the pooled keep-alive connections after a single
+        session check.
+
+        Args:
+            calls: ``(method, params)`` pairs
+
+        Returns:
+            Results in the order of ``calls``
+
+        Raises:
+            AdapterError: If any call fails
+        """
+        await self._ensure_session()
+        return list(await asyncio.gather(*(self._rpc_call(method, params) for method, params in calls)))
+
+    @staticmethod
+    def _format_torrent(torrent_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": torrent_id,
+            "name": data.get("name"),
+            "state": data.get("state"),
+            "progress": round(data.get("progress", 0), 2),
+            "download_speed": data.get("download_payload_rate", 0),
+            "upload_speed": data.get("upload_payload_rate", 0),
+            "eta": data.get("eta"),
+            "total_size": data.get("total_size", 0),
+            "total_done": data.get("total_done", 0),
+            "ratio": round(data.get("ratio", 0), 2),
+            "seeds": data.get("num_seeds", 0),
+            "peers": data.get("num_peers", 0),
+            "added": data.get("time_added"),
+        }
 
     async def test_connection(self) -> ConnectionTestResult:
         """Test connection to Deluge."""
@@ -133,8 +226,7 @@ class DelugeAdapter(BaseServiceAdapter):
     async def get_service_info(self) -> Dict[str, Any]:
         """Get Deluge service information."""
         try:
-            version = await self._rpc_call("daemon.info")
-            config = await self._rpc_call("core.get_config")
+            version, config = await self._rpc_batch([("daemon.info", None), ("core.get_config", None)])
 
             return {
                 "service": "deluge",
@@ -150,45 +242,8 @@ class DelugeAdapter(BaseServiceAdapter):
     async def get_torrents(self) -> List[Dict[str, Any]]:
         """Get list of torrents."""
         try:
-            # Get torrent list with specific fields
-            fields = [
-                "name",
-                "state",
-                "progress",
-                "download_payload_rate",
-                "upload_payload_rate",
-                "eta",
-                "total_size",
-                "total_done",
-                "ratio",
-                "num_seeds",
-                "num_peers",
-                "time_added",
-            ]
-
-            torrents = await self._rpc_call("core.get_torrents_status", [{}, fields])
-
-            result = []
-            for torrent_id, data in (torrents or {}).items():
-                result.append(
-                    {
-                        "id": torrent_id,
-                        "name": data.get("name"),
-                        "state": data.get("state"),
-                        "progress": round(data.get("progress", 0), 2),
-                        "download_speed": data.get("download_payload_rate", 0),
-                        "upload_speed": data.get("upload_payload_rate", 0),
-                        "eta": data.get("eta"),
-                        "total_size": data.get("total_size", 0),
-                        "total_done": data.get("total_done", 0),
-                        "ratio": round(data.get("ratio", 0), 2),
-                        "seeds": data.get("num_seeds", 0),
-                        "peers": data.get("num_peers", 0),
-                        "added": data.get("time_added"),
-                    }
-                )
-
-            return result
+            torrents = await self._rpc_call("core.get_torrents_status", [{}, TORRENT_FIELDS])
+            return [self._format_torrent(torrent_id, data) for torrent_id, data in (torrents or {}).items()]
         except Exception as e:
             self.logger.error(f"Failed to get torrents: {e}")
             return []
@@ -316,10 +371,13 @@ class DelugeAdapter(BaseServiceAdapter):
     async def get_statistics(self) -> Dict[str, Any]:
         """Get Deluge statistics."""
         try:
-            torrents = await self.get_torrents()
-            session_status = await self._rpc_call(
-                "core.get_session_status", [["download_rate", "upload_rate", "dht_nodes"]]
+            torrents_status, session_status = await self._rpc_batch(
+                [
+                    ("core.get_torrents_status", [{}, TORRENT_FIELDS]),
+                    ("core.get_session_status", [["download_rate", "upload_rate", "dht_nodes"]]),
+                ]
             )
+            torrents = [self._format_torrent(torrent_id, data) for torrent_id, data in (torrents_status or {}).items()]
 
             downloading = sum(1 for t in torrents if t.get("state") == "Downloading")
             seeding = sum(1 for t in torrents if t.get("state") == "Seeding")
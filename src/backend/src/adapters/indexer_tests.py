@@ -0,0 +1,123 @@
+"""Concurrent indexer testing for Radarr, Sonarr, Prowlarr and Jackett.
+
+``test_all_indexers`` used to test indexers one after another, so a tool call
+took the sum of every test (minutes with a few dozen indexers). Tests now run
+concurrently, bounded by a semaphore, each with its own timeout, and results
+are reported as soon as each test completes.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+IndexerTest = Callable[[Any], Awaitable[Dict[str, Any]]]
+ResultCallback = Callable[[Dict[str, Any]], Any]
+
+
+class IndexerTestRunner:
+    """Runs indexer tests with bounded parallelism and per-indexer timeouts."""
+
+    def __init__(self, concurrency: int = 5, timeout: float = 60.0):
+        """Initialize the runner.
+
+        Args:
+            concurrency: Maximum number of indexer tests running at once
+            timeout: Seconds after which a single indexer test is reported as failed
+        """
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+    def configure(self, concurrency: Optional[int] = None, timeout: Optional[float] = None) -> None:
+        """Update parallelism and per-indexer timeout."""
+        if concurrency is not None:
+            self.concurrency = max(1, concurrency)
+        if timeout is not None:
+            self.timeout = timeout
+
+    async def iter_results(self, indexers: List[Dict[str, Any]], test: IndexerTest) -> AsyncIterator[Dict[str, Any]]:
+        """Test indexers concurrently and yield each result as soon as it completes.
+
+        Args:
+            indexers: Indexers to test (dicts with ``id`` and ``name``)
+            test: Coroutine function testing one indexer by id
+
+        Yields:
+            Test results, in completion order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        timeout = self.timeout
+
+        async def run_one(indexer: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(test(indexer["id"]), timeout=timeout)
+                except asyncio.TimeoutError:
+                    result = {
+                        "success": False,
+                        "indexer_id": indexer["id"],
+                        "error": f"Test timed out after {timeout:g}s",
+                        "timed_out": True,
+                    }
+                except Exception as e:
+                    result = {"success": False, "indexer_id": indexer["id"], "error": str(e)}
+                result["indexer_name"] = indexer.get("name")
+                result["duration_ms"] = int((time.monotonic() - started) * 1000)
+                return result
+
+        tasks = [asyncio.create_task(run_one(indexer)) for indexer in indexers]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early or was cancelled
+            for task in tasks:
+                task.cancel()
+
+    async def run(
+        self,
+        indexers: List[Dict[str, Any]],
+        test: IndexerTest,
+        on_result: Optional[ResultCallback] = None,
+    ) -> Dict[str, Any]:
+        """Test indexers concurrently and summarize the results.
+
+        Args:
+            indexers: Indexers to test (dicts with ``id`` and ``name``)
+            test: Coroutine function testing one indexer by id
+            on_result: Called with each result as soon as its test completes
+
+        Returns:
+            Summary with per-indexer results in the order of ``indexers``
+        """
+        started = time.monotonic()
+        results: Dict[Any, Dict[str, Any]] = {}
+
+        async for result in self.iter_results(indexers, test):
+            results[result["indexer_id"]] = result
+            logger.debug(
+                f"Indexer '{result.get('indexer_name')}' tested in {result['duration_ms']}ms: "
+                f"{'ok' if result.get('success') else result.get('error')}"
+            )
+            if on_result is not None:
+                outcome = on_result(result)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+
+        ordered = [results[indexer["id"]] for indexer in indexers if indexer["id"] in results]
+        success_count = sum(1 for r in ordered if r.get("success"))
+        return {
+            "total_tested": len(ordered),
+            "success_count": success_count,
+            "failed_count": len(ordered) - success_count,
+            "timed_out_count": sum(1 for r in ordered if r.get("timed_out")),
+            "duration_ms": int((time.monotonic() - started) * 1000),
+            "results": ordered,
+        }
+
+
+# Global instance
+indexer_test_runner = IndexerTestRunner()
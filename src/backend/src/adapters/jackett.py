@@ -10,6 +10,7 @@ from .base import (
     ServiceCapability,
     TokenAuthAdapter,
 )
+from .indexer_tests import ResultCallback, indexer_test_runner
 
 
 class JackettAdapter(TokenAuthAdapter):
@@ -31,19 +32,9 @@ class JackettAdapter(TokenAuthAdapter):
         """Format Jackett API key - uses query parameter instead of header."""
         return {"Content-Type": "application/json", "Accept": "application/json"}
 
-    async def _ensure_client(self):
-        """Ensure HTTP client is initialized with cookie support for Jackett."""
-        if self._client is None:
-            headers = self.get_auth_headers()
-            # Jackett requires cookies for its anti-bot protection
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=headers,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-                follow_redirects=True,
-                cookies=httpx.Cookies(),  # Enable cookie jar
-            )
+    def _client_options(self) -> Dict[str, Any]:
+        """Jackett requires cookies for its anti-bot protection."""
+        return {"cookies": httpx.Cookies()}  # Enable cookie jar
 
     async def _make_request(
         self,
@@ -268,23 +259,17 @@ class JackettAdapter(TokenAuthAdapter):
         except Exception as e:
             return {"success": False, "indexer_id": indexer_id, "error": str(e)}
 
-    async def test_all_indexers(self) -> Dict[str, Any]:
-        """Test all configured indexers."""
+    async def test_all_indexers(self, on_result: Optional[ResultCallback] = None) -> Dict[str, Any]:
+        """Test all configured indexers.
+
+        Indexers are tested concurrently (see ``indexer_test_runner``).
+
+        Args:
+            on_result: Called with each indexer result as soon as its test completes
+        """
         indexers = await self.get_configured_indexers()
 
-        results = []
-        for indexer in indexers:
-            result = await self.test_indexer(indexer["id"])
-            result["indexer_name"] = indexer.get("name")
-            results.append(result)
-
-        success_count = sum(1 for r in results if r.get("success"))
-        return {
-            "total_tested": len(results),
-            "success_count": success_count,
-            "failed_count": len(results) - success_count,
-            "results": results,
-        }
+        return await indexer_test_runner.run(indexers, self.test_indexer, on_result=on_result)
 
     async def get_statistics(self) -> Dict[str, Any]:
         """Get Jackett statistics."""
@@ -0,0 +1,78 @@
+"""Decoding of large upstream JSON payloads.
+
+Radarr ``/movie``, Sonarr ``/series``, Tautulli history and Deluge torrent
+lists can weigh tens of MB. ``response.json()`` decodes them on the event loop,
+stalling every other request, and keeps the whole object tree alive even when
+the adapter only needs a few fields per item. Bodies above a size threshold are
+now decoded in a worker thread, and callers may declare the fields they keep so
+that each array item is reduced to them. When the optional ``ijson`` package is
+installed, declared fields are extracted item by item, so the full tree is never
+built.
+"""
+
+import asyncio
+import io
+import json
+import logging
+from typing import Any, Optional, Sequence
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Bodies larger than this are decoded in a worker thread
+JSON_OFFLOAD_THRESHOLD_BYTES = 1024 * 1024
+
+
+def _project(item: Any, fields: Sequence[str]) -> Any:
+    if not isinstance(item, dict):
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+def decode_json(content: bytes, fields: Optional[Sequence[str]] = None) -> Any:
+    """Decode a JSON body, keeping only the declared fields of top-level array items.
+
+    Args:
+        content: Raw response body
+        fields: Fields kept in each item when the body is an array (None keeps everything)
+
+    Returns:
+        Decoded payload
+    """
+    if fields is None or not content.lstrip().startswith(b"["):
+        return json.loads(content)
+
+    if IJSON_AVAILABLE:
+        return [_project(item, fields) for item in ijson.items(io.BytesIO(content), "item", use_float=True)]
+    return [_project(item, fields) for item in json.loads(content)]
+
+
+async def decode_json_response(
+    response: httpx.Response,
+    fields: Optional[Sequence[str]] = None,
+    threshold: int = JSON_OFFLOAD_THRESHOLD_BYTES,
+) -> Any:
+    """Decode a response body, in a worker thread when it is larger than ``threshold``.
+
+    Args:
+        response: Upstream response
+        fields: Fields kept in each item when the body is an array (None keeps everything)
+        threshold: Body size in bytes above which decoding leaves the event loop
+
+    Returns:
+        Decoded payload
+    """
+    content = response.content
+    if len(content) < threshold:
+        return decode_json(content, fields)
+
+    logger.debug(f"Decoding {len(content)} bytes of JSON from {response.url.path} in a worker thread")
+    return await asyncio.to_thread(decode_json, content, fields)
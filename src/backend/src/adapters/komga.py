@@ -2,7 +2,7 @@
 
 import base64
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
@@ -11,6 +11,7 @@ from .base import (
     ServiceCapability,
     TokenAuthAdapter,
 )
+from .pagination import Page
 
 
 class KomgaAdapter(TokenAuthAdapter):
@@ -87,10 +88,10 @@ class KomgaAdapter(TokenAuthAdapter):
         url = f"{self.base_url.rstrip('/')}{endpoint}"
         headers = self._get_auth_header()
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(method, url, params=params, json=json, headers=headers)
-            response.raise_for_status()
-            return response
+        await self._ensure_client()
+        response = await self._send_request(method, url, params=params, json=json, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response
 
     async def test_connection(self) -> ConnectionTestResult:
         """Test connection to Komga."""
@@ -188,25 +189,51 @@ class KomgaAdapter(TokenAuthAdapter):
             response = await self._make_request("GET", "/api/v1/series", params=params)
             data = response.json()
 
-            return [
-                {
-                    "id": series.get("id"),
-                    "name": series.get("metadata", {}).get("title", series.get("name")),
-                    "library_id": series.get("libraryId"),
-                    "books_count": series.get("booksCount", 0),
-                    "books_read_count": series.get("booksReadCount", 0),
-                    "books_unread_count": series.get("booksUnreadCount", 0),
-                    "status": series.get("metadata", {}).get("status"),
-                    "publisher": series.get("metadata", {}).get("publisher"),
-                    "genres": series.get("metadata", {}).get("genres", []),
-                    "url": self._get_series_url(series.get("id")),
-                }
-                for series in data.get("content", [])
-            ]
+            return [self._format_series(series) for series in data.get("content", [])]
         except Exception as e:
             self.logger.error(f"Failed to get series: {e}")
             return []
 
+    def iter_series(
+        self, library_id: Optional[str] = None, page_size: int = 200, max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every series, fetching the next pages concurrently.
+
+        Args:
+            library_id: Optional library filter
+            page_size: Series requested per page
+            max_items: Stop after this many series
+
+        Returns:
+            Async iterator over series (formatted like ``get_series``)
+        """
+
+        async def fetch_page(index: int) -> Page:
+            params = {"page": index, "size": page_size, "sort": "metadata.titleSort,asc"}
+            if library_id:
+                params["library_id"] = library_id
+
+            response = await self._make_request("GET", "/api/v1/series", params=params)
+            data = response.json()
+            return Page([self._format_series(series) for series in data.get("content", [])], data.get("totalElements"))
+
+        return self.iter_pages(fetch_page, page_size, max_items=max_items)
+
+    def _format_series(self, series: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a Komga series."""
+        return {
+            "id": series.get("id"),
+            "name": series.get("metadata", {}).get("title", series.get("name")),
+            "library_id": series.get("libraryId"),
+            "books_count": series.get("booksCount", 0),
+            "books_read_count": series.get("booksReadCount", 0),
+            "books_unread_count": series.get("booksUnreadCount", 0),
+            "status": series.get("metadata", {}).get("status"),
+            "publisher": series.get("metadata", {}).get("publisher"),
+            "genres": series.get("metadata", {}).get("genres", []),
+            "url": self._get_series_url(series.get("id")),
+        }
+
     async def get_books(self, series_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Get list of books."""
         try:
@@ -327,15 +354,18 @@ class KomgaAdapter(TokenAuthAdapter):
         """Get Komga statistics."""
         try:
             libraries = await self.get_libraries()
-            series = await self.get_series(limit=10000)
 
-            total_books = sum(s.get("books_count", 0) for s in series)
-            total_read = sum(s.get("books_read_count", 0) for s in series)
-            total_unread = sum(s.get("books_unread_count", 0) for s in series)
+            # Stream series page by page instead of loading the whole catalog at once
+            total_series = total_books = total_read = total_unread = 0
+            async for s in self.iter_series():
+                total_series += 1
+                total_books += s.get("books_count", 0)
+                total_read += s.get("books_read_count", 0)
+                total_unread += s.get("books_unread_count", 0)
 
             return {
                 "total_libraries": len(libraries),
-                "total_series": len(series),
+                "total_series": total_series,
                 "total_books": total_books,
                 "books_read": total_read,
                 "books_unread": total_unread,
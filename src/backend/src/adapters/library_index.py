@@ -0,0 +1,281 @@
+"""In-memory index of Radarr and Sonarr libraries.
+
+Title lookups used to download the whole ``/api/v3/movie`` or ``/api/v3/series``
+payload (several MB on large libraries) and scan it on every call. Each adapter
+instance now keeps its library in memory, indexed by normalized title
+(including alternate titles) and external ids. Lookups are served from memory;
+once the index is older than the refresh interval a background task refetches
+only the items that appear in the upstream history since the last sync, with a
+periodic full resync to catch changes made outside MCParr. The adapter's own
+add/update/delete methods update the index directly.
+"""
+
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+if TYPE_CHECKING:
+    from .base import BaseServiceAdapter
+
+logger = logging.getLogger(__name__)
+
+# Age after which a lookup triggers a background refresh
+REFRESH_INTERVAL_SECONDS = 60.0
+
+# Age after which the background refresh reloads the whole library
+FULL_SYNC_INTERVAL_SECONDS = 900.0
+
+# Above this many changed items an incremental refresh becomes a full one
+MAX_INCREMENTAL_ITEMS = 50
+
+# History dates come from the upstream clock, so look back a little further
+HISTORY_CLOCK_SKEW = timedelta(minutes=2)
+
+_PUNCTUATION = re.compile(r"[^a-z0-9\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Normalize a title for exact lookups.
+
+    Case, accents and punctuation are ignored, so "Spider-Man: No Way Home"
+    matches "spiderman no way home".
+    """
+    if not title:
+        return ""
+    text = unicodedata.normalize("NFKD", title.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub("", text)).strip()
+
+
+class LibraryIndex:
+    """Library items of one *arr instance, indexed by id, title and external ids."""
+
+    def __init__(
+        self,
+        adapter: "BaseServiceAdapter",
+        endpoint: str,
+        history_id_key: str,
+        external_id_keys: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]] = None,
+    ):
+        """Initialize the index.
+
+        Args:
+            adapter: Adapter used to query the upstream service
+            endpoint: Library endpoint (e.g. ``/api/v3/movie``)
+            history_id_key: Item id field of history records (e.g. ``movieId``)
+            external_id_keys: Item fields indexed as external ids (e.g. ``tmdbId``)
+            fields: Item fields kept from full library loads (None keeps everything)
+        """
+        self._adapter = adapter
+        self.endpoint = endpoint
+        self.history_id_key = history_id_key
+        self.external_id_keys = external_id_keys
+        self.fields = fields
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._titles: Dict[int, Tuple[str, ...]] = {}
+        self._by_title: Dict[str, Set[int]] = {}
+        self._by_external_id: Dict[Tuple[str, Any], int] = {}
+        self._loaded = False
+        self._synced_at = 0.0
+        self._full_synced_at = 0.0
+        self._history_since: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Local changes made while a sync is running, replayed once it completes
+        self._changes_during_sync: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._stats = {"full_syncs": 0, "incremental_syncs": 0, "items_refreshed": 0, "refresh_errors": 0}
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the library was loaded at least once."""
+        return self._loaded
+
+    async def ensure_fresh(self) -> None:
+        """Load the library on first use, or schedule a background refresh when it is stale.
+
+        Raises:
+            httpx.HTTPError: If the initial load fails
+        """
+        if not self._loaded:
+            async with self._lock:
+                if not self._loaded:
+                    await self._full_sync()
+            return
+
+        refreshing = self._refresh_task is not None and not self._refresh_task.done()
+        if not refreshing and time.monotonic() - self._synced_at >= REFRESH_INTERVAL_SECONDS:
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """Refresh the index incrementally, or fully when a resync is due."""
+        try:
+            async with self._lock:
+                full_sync_due = time.monotonic() - self._full_synced_at >= FULL_SYNC_INTERVAL_SECONDS
+                if full_sync_due or self._history_since is None:
+                    await self._full_sync()
+                else:
+                    await self._incremental_sync()
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            # Keep serving the current index and retry after the next interval
+            self._synced_at = time.monotonic()
+            logger.warning(f"Failed to refresh {self._adapter.service_type} library index: {e}")
+
+    async def _full_sync(self) -> None:
+        """Reload every library item."""
+        started = datetime.utcnow()
+        # Libraries can weigh tens of MB: decode off the event loop and keep only the used fields
+        items = await self._adapter._request_json("GET", self.endpoint, fields=self.fields)
+
+        self._items.clear()
+        self._titles.clear()
+        self._by_title.clear()
+        self._by_external_id.clear()
+        for item in items:
+            self._add(item)
+        self._replay_changes()
+
+        now = time.monotonic()
+        self._loaded = True
+        self._synced_at = now
+        self._full_synced_at = now
+        self._history_since = started
+        self._stats["full_syncs"] += 1
+        logger.debug(f"{self._adapter.service_type} library index loaded ({len(self._items)} items)")
+
+    async def _incremental_sync(self) -> None:
+        """Refetch the items that appear in the upstream history since the last sync."""
+        started = datetime.utcnow()
+        since = (self._history_since - HISTORY_CLOCK_SKEW).strftime("%Y-%m-%dT%H:%M:%SZ")
+        response = await self._adapter._make_request("GET", "/api/v3/history/since", params={"date": since})
+        changed_ids = {record.get(self.history_id_key) for record in response.json()} - {None, 0}
+
+        if len(changed_ids) > MAX_INCREMENTAL_ITEMS:
+            await self._full_sync()
+            return
+
+        if changed_ids:
+            await asyncio.gather(*(self._refresh_item(item_id) for item_id in changed_ids))
+        self._replay_changes()
+
+        self._synced_at = time.monotonic()
+        self._history_since = started
+        self._stats["incremental_syncs"] += 1
+
+    async def _refresh_item(self, item_id: int) -> None:
+        """Refetch one item, removing it if it no longer exists."""
+        try:
+            response = await self._adapter._make_request("GET", f"{self.endpoint}/{item_id}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            self._remove(item_id)
+            return
+        self._remove(item_id)
+        self._add(response.json())
+        self._stats["items_refreshed"] += 1
+
+    def _replay_changes(self) -> None:
+        """Apply local changes made while a sync was fetching older data."""
+        for item_id, item in self._changes_during_sync.items():
+            self._remove(item_id)
+            if item is not None:
+                self._add(item)
+        self._changes_during_sync.clear()
+
+    def _add(self, item: Dict[str, Any]) -> None:
+        item_id = item.get("id")
+        if item_id is None:
+            return
+
+        titles = [normalize_title(item.get("title"))]
+        titles.extend(normalize_title(alt.get("title")) for alt in item.get("alternateTitles") or [])
+        titles = tuple(dict.fromkeys(t for t in titles if t))
+
+        self._items[item_id] = item
+        self._titles[item_id] = titles
+        for title in titles:
+            self._by_title.setdefault(title, set()).add(item_id)
+        for key in self.external_id_keys:
+            value = item.get(key)
+            if value:
+                self._by_external_id[(key, value)] = item_id
+
+    def _remove(self, item_id: int) -> None:
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return
+        for title in self._titles.pop(item_id, ()):
+            ids = self._by_title.get(title)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._by_title[title]
+        for key in self.external_id_keys:
+            value = item.get(key)
+            if value and self._by_external_id.get((key, value)) == item_id:
+                del self._by_external_id[(key, value)]
+
+    def upsert(self, item: Dict[str, Any]) -> None:
+        """Add or replace an item (e.g. after the adapter added or updated it)."""
+        item_id = item.get("id")
+        if item_id is None or (not self._loaded and not self._lock.locked()):
+            return
+        if self._lock.locked():
+            self._changes_during_sync[item_id] = item
+        self._remove(item_id)
+        self._add(item)
+
+    def remove(self, item_id: int) -> None:
+        """Remove an item (e.g. after the adapter deleted it)."""
+        if self._lock.locked():
+            self._changes_during_sync[item_id] = None
+        self._remove(item_id)
+
+    def invalidate(self) -> None:
+        """Force a full resync on the next lookup."""
+        self._synced_at = 0.0
+        self._full_synced_at = 0.0
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Get every library item, in upstream order."""
+        return list(self._items.values())
+
+    def get(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Get an item by its id."""
+        return self._items.get(item_id)
+
+    def get_by_external_id(self, key: str, value: Any) -> Optional[Dict[str, Any]]:
+        """Get an item by an external id (e.g. ``("tmdbId", 603)``)."""
+        item_id = self._by_external_id.get((key, value))
+        return self._items.get(item_id) if item_id is not None else None
+
+    def find_by_title(self, title: str) -> List[Tuple[Dict[str, Any], bool]]:
+        """Get items whose title or an alternate title matches exactly after normalization.
+
+        Returns:
+            ``(item, is_primary_title)`` pairs
+        """
+        normalized = normalize_title(title)
+        return [
+            (self._items[item_id], self._titles[item_id][0] == normalized)
+            for item_id in self._by_title.get(normalized, ())
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            **self._stats,
+            "loaded": self._loaded,
+            "items": len(self._items),
+            "titles": len(self._by_title),
+            "age_seconds": round(time.monotonic() - self._synced_at, 1) if self._loaded else None,
+        }
@@ -1,11 +1,14 @@
 """Overseerr request management adapter."""
 
+import asyncio
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import httpx
 
+from src.utils.cache import TTLCache
+
 from .base import (
     AdapterError,
     AuthenticationError,
@@ -14,6 +17,15 @@ from .base import (
     TokenAuthAdapter,
 )
 
+# TMDB titles practically never change, so they are kept for a day
+MEDIA_TITLE_TTL_SECONDS = 86400.0
+
+# Maximum number of title lookups sent to Overseerr at once
+MAX_CONCURRENT_TITLE_LOOKUPS = 8
+
+# (service, media type, TMDB id) -> title, shared by every Overseerr adapter
+media_title_cache: TTLCache[str] = TTLCache(maxsize=10000, ttl=MEDIA_TITLE_TTL_SECONDS)
+
 
 class RequestStatus(Enum):
     """Overseerr request status."""
@@ -162,21 +174,75 @@ class OverseerrAdapter(TokenAuthAdapter):
         except Exception as e:
             raise AdapterError(f"Failed to get service info: {str(e)}") from e
 
+    @staticmethod
+    def _embedded_title(*objects: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Get a title already present in an API object (some servers embed it in ``media``)."""
+        for obj in objects:
+            if obj:
+                title = obj.get("title") or obj.get("name") or obj.get("originalTitle")
+                if title:
+                    return title
+        return None
+
+    def _title_cache_key(self, media_type: str, tmdb_id: int) -> Tuple[str, str, int]:
+        return (self.pool_key, "movie" if media_type == "movie" else "tv", tmdb_id)
+
     async def _get_media_title(self, media_type: str, tmdb_id: int) -> Optional[str]:
-        """Get media title from TMDB ID by calling Overseerr's media endpoint."""
+        """Get media title from TMDB ID by calling Overseerr's media endpoint (cached)."""
         if not tmdb_id:
             return None
+
+        cache_key = self._title_cache_key(media_type, tmdb_id)
+        title = media_title_cache.get(cache_key)
+        if title is not None:
+            return title
+
         try:
             endpoint = f"/api/v1/{'movie' if media_type == 'movie' else 'tv'}/{tmdb_id}"
             # _safe_request returns JSON dict directly, not an HTTP response
             data = await self._safe_request("GET", endpoint)
             if data:
                 # Movies have 'title', TV shows have 'name'
-                return data.get("title") or data.get("name")
+                title = data.get("title") or data.get("name")
+                if title:
+                    media_title_cache.set(cache_key, title)
+                return title
         except Exception as e:
             self.logger.debug(f"Failed to get media title for {media_type}/{tmdb_id}: {e}")
         return None
 
+    async def _get_media_titles(self, media: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], Optional[str]]:
+        """Resolve the titles of several media at once.
+
+        Cached titles are used directly; the remaining lookups run concurrently,
+        at most ``MAX_CONCURRENT_TITLE_LOOKUPS`` at a time.
+
+        Args:
+            media: ``(media_type, tmdb_id)`` pairs (duplicates are looked up once)
+
+        Returns:
+            Title (or None) per ``(media_type, tmdb_id)``
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TITLE_LOOKUPS)
+
+        async def lookup(media_type: str, tmdb_id: int) -> Optional[str]:
+            async with semaphore:
+                return await self._get_media_title(media_type, tmdb_id)
+
+        titles: Dict[Tuple[str, int], Optional[str]] = {}
+        missing = []
+        for media_type, tmdb_id in dict.fromkeys(media):
+            title = media_title_cache.get(self._title_cache_key(media_type, tmdb_id)) if tmdb_id else None
+            if title is not None or not tmdb_id:
+                titles[(media_type, tmdb_id)] = title
+            else:
+                missing.append((media_type, tmdb_id))
+
+        if missing:
+            results = await asyncio.gather(*(lookup(media_type, tmdb_id) for media_type, tmdb_id in missing))
+            titles.update(zip(missing, results, strict=True))
+        return titles
+
     async def get_requests(
         self,
         take: int = 20,
@@ -208,15 +274,23 @@ class OverseerrAdapter(TokenAuthAdapter):
             response = await self._make_request("GET", "/api/v1/request", params=params)
             data = response.json()
 
+            # Resolve titles of the whole page at once, unless the response already embeds them
+            results = data.get("results", [])
+            titles = await self._get_media_titles(
+                (request.get("type"), (request.get("media") or {}).get("tmdbId"))
+                for request in results
+                if not self._embedded_title(request.get("media"))
+            )
+
             # Process requests to add user-friendly information
             requests = []
-            for request in data.get("results", []):
+            for request in results:
                 media = request.get("media", {})
                 media_type = request.get("type")
                 tmdb_id = media.get("tmdbId")
 
                 # Get title from TMDB ID
-                title = await self._get_media_title(media_type, tmdb_id)
+                title = self._embedded_title(media) or titles.get((media_type, tmdb_id))
 
                 request_id = request.get("id")
                 processed_request = {
@@ -673,14 +747,21 @@ class OverseerrAdapter(TokenAuthAdapter):
             response = await self._make_request("GET", "/api/v1/issue", params=params)
             data = response.json()
 
+            results = data.get("results", [])
+            titles = await self._get_media_titles(
+                ((issue.get("media") or {}).get("mediaType"), (issue.get("media") or {}).get("tmdbId"))
+                for issue in results
+                if not self._embedded_title(issue.get("media"))
+            )
+
             issues = []
-            for issue in data.get("results", []):
+            for issue in results:
                 media = issue.get("media", {})
                 media_type = media.get("mediaType")
                 tmdb_id = media.get("tmdbId")
 
                 # Get title from TMDB
-                title = await self._get_media_title(media_type, tmdb_id)
+                title = self._embedded_title(media) or titles.get((media_type, tmdb_id))
 
                 issue_id = issue.get("id")
                 issues.append({
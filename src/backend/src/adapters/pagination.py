@@ -0,0 +1,114 @@
+"""Paginated enumeration of upstream collections.
+
+Adapters used to expose pagination ad hoc (``page``/``page_size``,
+``start``/``length``, ``size``, ``limit``) and callers either used the first
+page only or walked pages one after another. ``iter_pages`` streams items of
+any page-based endpoint: the next pages are fetched concurrently while the
+current one is consumed, the caller can stop at any time (pending fetches are
+cancelled) and the number of items held in memory is bounded.
+"""
+
+import asyncio
+import logging
+import math
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pages fetched ahead of the one being consumed
+DEFAULT_PREFETCH_PAGES = 2
+
+# Upper bound of items buffered in prefetched pages
+DEFAULT_MAX_BUFFERED_ITEMS = 2000
+
+
+class Page(NamedTuple):
+    """One page of an upstream collection."""
+
+    items: List[Any]
+    # Total number of items of the collection, when the service reports it
+    total: Optional[int] = None
+
+
+# Fetches a page by its zero-based index
+PageFetcher = Callable[[int], Awaitable[Page]]
+
+
+async def iter_pages(
+    fetch_page: PageFetcher,
+    page_size: int,
+    prefetch: int = DEFAULT_PREFETCH_PAGES,
+    max_items: Optional[int] = None,
+    max_buffered_items: int = DEFAULT_MAX_BUFFERED_ITEMS,
+) -> AsyncIterator[Any]:
+    """Stream the items of a paginated collection.
+
+    The first page is fetched alone; it tells whether there are more pages and,
+    when the service reports a total, how many. Afterwards up to ``prefetch``
+    pages are fetched concurrently ahead of the page being consumed. The
+    collection ends with an empty or short page, or once the reported total is
+    reached.
+
+    Callers that may stop early should close the iterator (``contextlib.aclosing``)
+    so pending fetches are cancelled right away.
+
+    Args:
+        fetch_page: Coroutine function fetching a page by zero-based index
+        page_size: Items requested per page
+        prefetch: Pages fetched ahead of the one being consumed
+        max_items: Stop after this many items
+        max_buffered_items: Limits prefetching so buffered pages hold at most this many items
+
+    Yields:
+        Items in upstream order
+    """
+    prefetch = max(0, min(prefetch, max_buffered_items // max(page_size, 1) - 1))
+    page = await fetch_page(0)
+    total_pages = math.ceil(page.total / page_size) if page.total is not None and page_size > 0 else None
+
+    pending: Deque[asyncio.Task] = deque()
+    next_index = 1
+    index = 0
+    yielded = 0
+
+    def schedule(count: int) -> None:
+        nonlocal next_index
+        while (
+            len(pending) < count
+            and (total_pages is None or next_index < total_pages)
+            and (max_items is None or next_index * page_size < max_items)
+        ):
+            pending.append(asyncio.create_task(fetch_page(next_index)))
+            next_index += 1
+
+    try:
+        while True:
+            is_last = len(page.items) < page_size or (total_pages is not None and index + 1 >= total_pages)
+            if not is_last:
+                # Fetch the next pages while this one is consumed
+                schedule(prefetch)
+
+            for item in page.items:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+
+            if is_last:
+                return
+            schedule(1)
+            if not pending:
+                return
+            page = await pending.popleft()
+            index += 1
+            if not page.items:
+                return
+    finally:
+        # The collection ended, the caller stopped early or a fetch failed
+        for task in pending:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Retrieve errors of unused prefetched pages so they are not reported as unhandled
+                task.exception()
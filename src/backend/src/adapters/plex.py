@@ -1,5 +1,6 @@
 """Plex Media Server adapter."""
 
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -13,6 +14,9 @@ from .base import (
     TokenAuthAdapter,
 )
 
+# Maximum number of per-word fallback searches sent to Plex at once
+MAX_CONCURRENT_WORD_SEARCHES = 4
+
 
 class PlexAdapter(TokenAuthAdapter):
     """Adapter for Plex Media Server integration."""
@@ -408,12 +412,53 @@ class PlexAdapter(TokenAuthAdapter):
 
         return data["MediaContainer"].get("Metadata", [])
 
+    async def _search_words(self, words: List[str], media_type: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Search each word concurrently and rank merged results by matching words.
+
+        Stops early once ``limit`` results matching every word are in, since no
+        other result can rank above them.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WORD_SEARCHES)
+
+        async def search_word(word: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self._search_single_query(word, media_type, limit * 2)
+                except Exception as e:
+                    self.logger.warning(f"Failed to search word '{word}': {e}")
+                    return []
+
+        # key -> (matching words, arrival order, item); items without any search word in their title are skipped
+        scored: Dict[Any, tuple] = {}
+        full_matches = 0
+        tasks = [asyncio.create_task(search_word(word)) for word in words]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    key = item.get("ratingKey") or item.get("key")
+                    if not key or key in scored:
+                        continue
+                    title = (item.get("title") or "").lower()
+                    score = sum(1 for w in words if w in title)
+                    if score:
+                        scored[key] = (score, len(scored), item)
+                        if score == len(words):
+                            full_matches += 1
+                if full_matches >= limit:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        ranked = sorted(scored.values(), key=lambda entry: (-entry[0], entry[1]))
+        return [item for _, _, item in ranked]
+
     async def search(self, query: str, media_type: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """Search for content in Plex with optional media type filter.
 
         Uses flexible search strategy:
         1. Try exact query first
-        2. If no results, try searching each word separately and merge results
+        2. If no results, search each word concurrently and merge results
         3. Deduplicates results by ratingKey
 
         Args:
@@ -428,31 +473,9 @@ class PlexAdapter(TokenAuthAdapter):
             metadata = await self._search_single_query(query, media_type, limit)
 
             # If no results and query has multiple words, try each word separately
-            words = [w.lower() for w in query.split() if len(w) >= 3]
+            words = list(dict.fromkeys(w.lower() for w in query.split() if len(w) >= 3))
             if not metadata and len(words) > 1:
-                seen_keys = set()
-                all_word_results = []
-
-                # Search each word and collect all results
-                for word in words:
-                    word_results = await self._search_single_query(word, media_type, limit * 2)
-                    for item in word_results:
-                        key = item.get("ratingKey") or item.get("key")
-                        if key and key not in seen_keys:
-                            seen_keys.add(key)
-                            all_word_results.append(item)
-
-                # Count matching words for each result
-                def count_matching_words(item):
-                    title = (item.get("title") or "").lower()
-                    return sum(1 for w in words if w in title)
-
-                # Filter: only keep results that have at least one search word in title
-                filtered_results = [item for item in all_word_results if count_matching_words(item) > 0]
-
-                # Sort by number of matching words (descending)
-                filtered_results.sort(key=count_matching_words, reverse=True)
-                metadata = filtered_results
+                metadata = await self._search_words(words, media_type, limit)
 
             search_results = []
             for item in metadata[:limit]:  # Respect limit after merging
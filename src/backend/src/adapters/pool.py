@@ -0,0 +1,256 @@
+"""Shared HTTP client and adapter pools for service adapters.
+
+Adapters used to open a fresh ``httpx.AsyncClient`` per tool call, so TCP/TLS
+connections to upstream services were never reused. Clients are now pooled
+per service and configuration hash and kept alive until the configuration
+changes or the application shuts down.
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
+
+import httpx
+
+if TYPE_CHECKING:
+    from .base import BaseServiceAdapter
+
+logger = logging.getLogger(__name__)
+
+AdapterT = TypeVar("AdapterT", bound="BaseServiceAdapter")
+
+# Service config attributes that affect how an adapter talks to its upstream
+FINGERPRINT_ATTRIBUTES = ("id", "base_url", "port", "external_url", "api_key", "username", "password", "config")
+
+# Seconds to keep a replaced client open so in-flight requests can finish
+RETIRE_GRACE_SECONDS = 60.0
+
+
+def service_config_fingerprint(service_config: Any, *extra: Any) -> str:
+    """Compute a stable hash of the connection-relevant parts of a service config.
+
+    Works with both ``ServiceConfig`` models and the lightweight proxies used by
+    MCP tools.
+    """
+    values = {attr: getattr(service_config, attr, None) for attr in FINGERPRINT_ATTRIBUTES}
+    payload = json.dumps([values, list(extra)], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class HttpClientPool:
+    """Pool of persistent ``httpx.AsyncClient`` instances keyed by service and config hash."""
+
+    def __init__(self, max_clients: int = 64):
+        self.max_clients = max_clients
+        self.max_connections = 20
+        self.max_keepalive_connections = 10
+        self.keepalive_expiry = 30.0
+        self.http2 = False
+        self._clients: "OrderedDict[Tuple[int, str, str], httpx.AsyncClient]" = OrderedDict()
+        self._retired: List[Tuple[float, httpx.AsyncClient]] = []
+        # Close tasks of reaped clients, referenced until they finish
+        self._closing: Set[asyncio.Task] = set()
+        self._created = 0
+        self._reused = 0
+
+    def configure(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """Update connection settings used for newly created clients."""
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if max_keepalive_connections is not None:
+            self.max_keepalive_connections = max_keepalive_connections
+        if keepalive_expiry is not None:
+            self.keepalive_expiry = keepalive_expiry
+        if http2 is not None:
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed, falling back to HTTP/1.1")
+                http2 = False
+            self.http2 = http2
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Connection limits applied to pooled clients."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def get_client(self, service_key: str, config_hash: str, **client_kwargs: Any) -> httpx.AsyncClient:
+        """Get a pooled client, creating it on first use.
+
+        Args:
+            service_key: Identifier of the upstream service
+            config_hash: Hash of every setting the client was built from
+            **client_kwargs: Arguments forwarded to ``httpx.AsyncClient``
+
+        Returns:
+            A shared, open HTTP client
+        """
+        self._reap_retired()
+
+        # Clients are bound to the event loop they were first used on
+        key = (id(asyncio.get_running_loop()), service_key, config_hash)
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            self._clients.move_to_end(key)
+            self._reused += 1
+            return client
+
+        client = httpx.AsyncClient(limits=self.limits, http2=self.http2, **client_kwargs)
+        self._clients[key] = client
+        self._created += 1
+
+        while len(self._clients) > self.max_clients:
+            _, evicted = self._clients.popitem(last=False)
+            self._retire(evicted)
+
+        return client
+
+    def release_service(self, service_key: str) -> int:
+        """Retire every client belonging to a service (e.g. after it was updated or deleted)."""
+        keys = [key for key in self._clients if key[1] == service_key]
+        for key in keys:
+            self._retire(self._clients.pop(key))
+        return len(keys)
+
+    def release_all(self) -> int:
+        """Retire every pooled client (e.g. after services were imported or reset)."""
+        count = len(self._clients)
+        for client in self._clients.values():
+            self._retire(client)
+        self._clients.clear()
+        return count
+
+    def _retire(self, client: httpx.AsyncClient) -> None:
+        """Schedule a client for closing once in-flight requests had time to finish."""
+        self._retired.append((time.monotonic(), client))
+
+    def _reap_retired(self) -> None:
+        """Close retired clients whose grace period elapsed."""
+        if not self._retired:
+            return
+        now = time.monotonic()
+        remaining = []
+        for retired_at, client in self._retired:
+            if now - retired_at >= RETIRE_GRACE_SECONDS:
+                task = asyncio.create_task(client.aclose())
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            else:
+                remaining.append((retired_at, client))
+        self._retired = remaining
+
+    async def close_all(self) -> None:
+        """Close every pooled and retired client."""
+        clients = list(self._clients.values()) + [client for _, client in self._retired]
+        self._clients.clear()
+        self._retired.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close pooled HTTP client: {e}")
+        if self._closing:
+            # Clients reaped earlier may still be closing
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled HTTP clients")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "clients": len(self._clients),
+            "retired": len(self._retired),
+            "closing": len(self._closing),
+            "created": self._created,
+            "reused": self._reused,
+            "http2": self.http2,
+            "limits": {
+                "max_connections": self.max_connections,
+                "max_keepalive_connections": self.max_keepalive_connections,
+                "keepalive_expiry": self.keepalive_expiry,
+            },
+        }
+
+
+class AdapterPool:
+    """Pool of long-lived adapter instances keyed by adapter class and config hash."""
+
+    def __init__(self, max_adapters: int = 64):
+        self.max_adapters = max_adapters
+        self._adapters: "OrderedDict[Tuple[str, str], BaseServiceAdapter]" = OrderedDict()
+
+    def get(self, adapter_class: Type[AdapterT], service_config: Any, **kwargs: Any) -> AdapterT:
+        """Get a shared adapter for a service config, creating it on first use.
+
+        Args:
+            adapter_class: Adapter class to instantiate
+            service_config: ServiceConfig model or tool config proxy
+            **kwargs: Extra constructor arguments (e.g. ``timeout``)
+
+        Returns:
+            Adapter instance reused across calls while the config is unchanged
+        """
+        key = (adapter_class.__qualname__, service_config_fingerprint(service_config, sorted(kwargs.items())))
+        adapter = self._adapters.get(key)
+        if adapter is not None:
+            self._adapters.move_to_end(key)
+            return adapter
+
+        adapter = adapter_class(service_config, **kwargs)
+        self._adapters[key] = adapter
+
+        while len(self._adapters) > self.max_adapters:
+            self._adapters.popitem(last=False)
+
+        return adapter
+
+    def clear(self) -> None:
+        """Drop every pooled adapter."""
+        self._adapters.clear()
+
+    def release_service(self, service_key: str) -> int:
+        """Drop the adapters of a service and retire its HTTP clients, after its configuration changed.
+
+        Args:
+            service_key: Pool key of the service (its id)
+
+        Returns:
+            Number of adapters dropped
+        """
+        keys = [key for key, adapter in self._adapters.items() if adapter.pool_key == service_key]
+        for key in keys:
+            del self._adapters[key]
+        http_client_pool.release_service(service_key)
+        return len(keys)
+
+    def release_all(self) -> None:
+        """Drop every pooled adapter and retire every HTTP client, after services were replaced."""
+        self.clear()
+        http_client_pool.release_all()
+
+    async def close_all(self) -> None:
+        """Drop pooled adapters and close every pooled HTTP client."""
+        self.clear()
+        await http_client_pool.close_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {"adapters": len(self._adapters), "http_clients": http_client_pool.get_stats()}
+
+
+# Global instances
+http_client_pool = HttpClientPool()
+adapter_pool = AdapterPool()
@@ -10,6 +10,7 @@ from .base import (
     ServiceCapability,
     TokenAuthAdapter,
 )
+from .indexer_tests import ResultCallback, indexer_test_runner
 
 
 class ProwlarrAdapter(TokenAuthAdapter):
@@ -257,21 +258,15 @@ class ProwlarrAdapter(TokenAuthAdapter):
         except Exception as e:
             return {"success": False, "indexer_id": indexer_id, "error": str(e)}
 
-    async def test_all_indexers(self) -> Dict[str, Any]:
-        """Test all enabled indexers."""
+    async def test_all_indexers(self, on_result: Optional[ResultCallback] = None) -> Dict[str, Any]:
+        """Test all enabled indexers.
+
+        Indexers are tested concurrently (see ``indexer_test_runner``).
+
+        Args:
+            on_result: Called with each indexer result as soon as its test completes
+        """
         indexers = await self.get_indexers()
         enabled_indexers = [i for i in indexers if i.get("enable")]
 
-        results = []
-        for indexer in enabled_indexers:
-            result = await self.test_indexer(indexer["id"])
-            result["indexer_name"] = indexer.get("name")
-            results.append(result)
-
-        success_count = sum(1 for r in results if r.get("success"))
-        return {
-            "total_tested": len(results),
-            "success_count": success_count,
-            "failed_count": len(results) - success_count,
-            "results": results,
-        }
+        return await indexer_test_runner.run(enabled_indexers, self.test_indexer, on_result=on_result)
@@ -1,16 +1,49 @@
 """Radarr movie management adapter."""
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from .base import ConnectionTestResult, ServiceCapability, TokenAuthAdapter
+from .indexer_tests import ResultCallback, indexer_test_runner
+from .library_index import LibraryIndex
+from .reference_data import arr_reference_cache
+
+# Movie fields used by library lookups (the rest of the payload is dropped when the library loads)
+MOVIE_INDEX_FIELDS = (
+    "id",
+    "title",
+    "alternateTitles",
+    "year",
+    "tmdbId",
+    "imdbId",
+    "hasFile",
+    "monitored",
+    "status",
+    "isAvailable",
+    "qualityProfileId",
+    "path",
+    "sizeOnDisk",
+    "added",
+    "movieFile",
+)
 
 
 class RadarrAdapter(TokenAuthAdapter):
     """Adapter for Radarr movie download management."""
 
+    def __init__(self, service_config, *args, **kwargs):
+        super().__init__(service_config, *args, **kwargs)
+        # Pooled adapters keep the library in memory between tool calls
+        self.movie_index = LibraryIndex(
+            self,
+            "/api/v3/movie",
+            history_id_key="movieId",
+            external_id_keys=("tmdbId", "imdbId"),
+            fields=MOVIE_INDEX_FIELDS,
+        )
+
     @property
     def service_type(self) -> str:
         return "radarr"
@@ -116,8 +149,8 @@ class RadarrAdapter(TokenAuthAdapter):
     async def get_movies(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get list of movies in Radarr."""
         try:
-            response = await self._make_request("GET", "/api/v3/movie")
-            movies = response.json()
+            await self.movie_index.ensure_fresh()
+            movies = self.movie_index.items()
 
             return [
                 {
@@ -149,8 +182,14 @@ class RadarrAdapter(TokenAuthAdapter):
         Returns detailed status information about the movie.
         """
         try:
-            response = await self._make_request("GET", "/api/v3/movie")
-            movies = response.json()
+            await self.movie_index.ensure_fresh()
+
+            def year_bonus(movie_year):
+                if year and movie_year == year:
+                    return 30
+                if year and movie_year and abs(movie_year - year) <= 1:
+                    return 10
+                return 0
 
             # Normalize search title
             search_title = title.lower().strip()
@@ -159,46 +198,43 @@ class RadarrAdapter(TokenAuthAdapter):
             best_match = None
             best_score = 0
 
-            for movie in movies:
-                movie_title = (movie.get("title") or "").lower()
-                movie_year = movie.get("year")
-
-                score = 0
-                # Exact match
-                if movie_title == search_title:
-                    score = 100
-                # Title contains search term
-                elif search_title in movie_title:
-                    score = 50
-                # Search term contains title
-                elif movie_title in search_title:
-                    score = 40
-
-                # Year bonus if provided and matches
-                if year and movie_year == year:
-                    score += 30
-                elif year and movie_year and abs(movie_year - year) <= 1:
-                    score += 10
-
+            # Exact title (or alternate title) matches outrank any partial match
+            for movie, is_primary_title in self.movie_index.find_by_title(title):
+                score = (100 if is_primary_title else 90) + year_bonus(movie.get("year"))
                 if score > best_score:
                     best_score = score
                     best_match = movie
 
+            if best_match is None:
+                for movie in self.movie_index.items():
+                    movie_title = (movie.get("title") or "").lower()
+                    movie_year = movie.get("year")
+
+                    score = 0
+                    # Exact match
+                    if movie_title == search_title:
+                        score = 100
+                    # Title contains search term
+                    elif search_title in movie_title:
+                        score = 50
+                    # Search term contains title
+                    elif movie_title in search_title:
+                        score = 40
+
+                    # Year bonus if provided and matches
+                    score += year_bonus(movie_year)
+
+                    if score > best_score:
+                        best_score = score
+                        best_match = movie
+
             if not best_match or best_score < 40:
                 return {"found": False, "message": f"Movie '{title}' not found in Radarr library"}
 
             # Get quality profile name
             quality_profile_id = best_match.get("qualityProfileId")
-            quality_profile_name = None
-            try:
-                profiles_response = await self._make_request("GET", "/api/v3/qualityprofile")
-                profiles = profiles_response.json()
-                for profile in profiles:
-                    if profile.get("id") == quality_profile_id:
-                        quality_profile_name = profile.get("name")
-                        break
-            except Exception:
-                pass
+            quality_profiles = await arr_reference_cache.get_names(self, "quality_profiles")
+            quality_profile_name = quality_profiles.get(quality_profile_id)
 
             return {
                 "found": True,
@@ -314,15 +350,6 @@ class RadarrAdapter(TokenAuthAdapter):
             response = await self._make_request("GET", "/api/v3/release", params={"movieId": movie_id})
             releases = response.json()
 
-            # Get quality profiles for reference
-            quality_profiles = {}
-            try:
-                profiles_response = await self._make_request("GET", "/api/v3/qualityprofile")
-                for profile in profiles_response.json():
-                    quality_profiles[profile.get("id")] = profile.get("name")
-            except Exception:
-                pass
-
             formatted_releases = []
             for release in releases[:50]:  # Limit to 50 releases
                 quality = release.get("quality", {}).get("quality", {})
@@ -508,8 +535,14 @@ class RadarrAdapter(TokenAuthAdapter):
         except Exception as e:
             return {"success": False, "indexer_id": indexer_id, "error": str(e)}
 
-    async def test_all_indexers(self) -> Dict[str, Any]:
-        """Test all enabled indexers."""
+    async def test_all_indexers(self, on_result: Optional[ResultCallback] = None) -> Dict[str, Any]:
+        """Test all enabled indexers.
+
+        Indexers are tested concurrently (see ``indexer_test_runner``).
+
+        Args:
+            on_result: Called with each indexer result as soon as its test completes
+        """
         indexers = await self.get_indexers()
         # Filter enabled indexers - check both 'enable' (v3) and 'enableRss'/'enableAutomaticSearch' fields
         enabled_indexers = [
@@ -520,20 +553,8 @@ class RadarrAdapter(TokenAuthAdapter):
         if not enabled_indexers and indexers:
             enabled_indexers = indexers
 
-        results = []
-        for indexer in enabled_indexers:
-            result = await self.test_indexer(indexer["id"])
-            result["indexer_name"] = indexer.get("name")
-            results.append(result)
-
-        success_count = sum(1 for r in results if r.get("success"))
-        return {
-            "total_tested": len(results),
-            "success_count": success_count,
-            "failed_count": len(results) - success_count,
-            "total_indexers": len(indexers),
-            "results": results,
-        }
+        summary = await indexer_test_runner.run(enabled_indexers, self.test_indexer, on_result=on_result)
+        return {**summary, "total_indexers": len(indexers)}
 
     def _calculate_fuzzy_match_score(self, query: str, target: str) -> int:
         """Calculate fuzzy match score between two strings (0-100).
@@ -725,11 +746,14 @@ class RadarrAdapter(TokenAuthAdapter):
             self.logger.error(f"Failed to check queue match: {e}")
             return {"found": False, "error": str(e)}
 
-    async def get_quality_profiles(self) -> List[Dict[str, Any]]:
-        """Get available quality profiles."""
+    async def get_quality_profiles(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get available quality profiles.
+
+        Args:
+            refresh: Bypass the reference-data cache
+        """
         try:
-            response = await self._make_request("GET", "/api/v3/qualityprofile")
-            profiles = response.json()
+            profiles = await arr_reference_cache.get(self, "quality_profiles", refresh=refresh)
 
             return [
                 {
@@ -749,11 +773,14 @@ class RadarrAdapter(TokenAuthAdapter):
             self.logger.error(f"Failed to get quality profiles: {e}")
             return []
 
-    async def get_root_folders(self) -> List[Dict[str, Any]]:
-        """Get available root folders for movies."""
+    async def get_root_folders(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get available root folders for movies.
+
+        Args:
+            refresh: Bypass the reference-data cache
+        """
         try:
-            response = await self._make_request("GET", "/api/v3/rootfolder")
-            folders = response.json()
+            folders = await arr_reference_cache.get(self, "root_folders", refresh=refresh)
 
             return [
                 {
@@ -828,6 +855,7 @@ class RadarrAdapter(TokenAuthAdapter):
             # Add the movie
             add_response = await self._make_request("POST", "/api/v3/movie", json=payload)
             added_movie = add_response.json()
+            self.movie_index.upsert(added_movie)
 
             return {
                 "success": True,
@@ -868,6 +896,7 @@ class RadarrAdapter(TokenAuthAdapter):
                 "addImportExclusion": str(add_exclusion).lower(),
             }
             await self._make_request("DELETE", f"/api/v3/movie/{movie_id}", params=params)
+            self.movie_index.remove(movie_id)
 
             return {
                 "success": True,
@@ -914,6 +943,7 @@ class RadarrAdapter(TokenAuthAdapter):
             # Save changes
             update_response = await self._make_request("PUT", f"/api/v3/movie/{movie_id}", json=movie)
             updated = update_response.json()
+            self.movie_index.upsert(updated)
 
             return {
                 "success": True,
@@ -0,0 +1,112 @@
+"""Shared cache of *arr reference data (quality profiles, root folders, tags).
+
+Radarr and Sonarr searches, release listings and updates used to request
+``/api/v3/qualityprofile`` (and sometimes ``/api/v3/rootfolder``) on every call
+just to map ids to names. This data barely changes, so it is cached per service
+instance for a long TTL, shared by every adapter of that instance, and can be
+refreshed on demand.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional
+
+from src.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from .base import BaseServiceAdapter
+
+logger = logging.getLogger(__name__)
+
+# Reference resources and their endpoints
+REFERENCE_ENDPOINTS = {
+    "quality_profiles": "/api/v3/qualityprofile",
+    "root_folders": "/api/v3/rootfolder",
+    "tags": "/api/v3/tag",
+}
+
+# Per-resource TTLs in seconds; root folders report free space, so they expire sooner
+REFERENCE_TTLS = {
+    "quality_profiles": 3600.0,
+    "root_folders": 300.0,
+    "tags": 3600.0,
+}
+
+
+class ArrReferenceDataCache:
+    """Reference data of *arr instances, keyed by service and resource."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        self._cache: TTLCache[List[Dict[str, Any]]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._fetches = 0
+
+    @staticmethod
+    def _key(adapter: "BaseServiceAdapter", resource: str) -> Hashable:
+        return (adapter.pool_key, adapter.base_url, resource)
+
+    async def get(self, adapter: "BaseServiceAdapter", resource: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get a reference resource of the adapter's service.
+
+        Args:
+            adapter: Radarr or Sonarr adapter
+            resource: One of ``REFERENCE_ENDPOINTS``
+            refresh: Bypass the cache and refetch the resource
+
+        Returns:
+            Raw upstream items
+
+        Raises:
+            httpx.HTTPError: If the resource has to be fetched and the request fails
+        """
+        key = self._key(adapter, resource)
+        if not refresh:
+            items = self._cache.get(key)
+            if items is not None:
+                return items
+
+        # Concurrent misses share a single upstream request
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if not refresh:
+                items = self._cache.get(key)
+                if items is not None:
+                    return items
+
+            response = await adapter._make_request("GET", REFERENCE_ENDPOINTS[resource])
+            items = response.json()
+            self._cache.set(key, items, ttl=REFERENCE_TTLS.get(resource))
+            self._fetches += 1
+            return items
+
+    async def get_names(self, adapter: "BaseServiceAdapter", resource: str) -> Dict[int, str]:
+        """Map ids of a resource to names, or return an empty map if it cannot be fetched."""
+        try:
+            items = await self.get(adapter, resource)
+        except Exception as e:
+            logger.warning(f"Failed to get {adapter.service_type} {resource}: {e}")
+            return {}
+        name_field = "label" if resource == "tags" else "name"
+        return {item.get("id"): item.get(name_field) for item in items}
+
+    def invalidate(self, service_key: Optional[str] = None) -> int:
+        """Drop cached reference data of one service (by pool key) or of every service.
+
+        Returns:
+            Number of entries removed
+        """
+        if service_key is None:
+            count = len(self._cache)
+            self._cache.clear()
+            return count
+
+        keys = [key for key in self._locks if key[0] == service_key]
+        return sum(1 for key in keys if self._cache.pop(key) is not None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {**self._cache.get_stats(), "fetches": self._fetches}
+
+
+# Global instance
+arr_reference_cache = ArrReferenceDataCache()
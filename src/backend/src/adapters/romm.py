@@ -6,7 +6,7 @@ This adapter supports both Basic Auth (username/password) and Bearer tokens.
 
 import base64
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
@@ -15,6 +15,10 @@ from .base import (
     ServiceCapability,
     TokenAuthAdapter,
 )
+from .pagination import Page
+
+# ROMs requested per page when listing more than a handful
+ROMS_PAGE_SIZE = 100
 
 
 class RommAdapter(TokenAuthAdapter):
@@ -92,10 +96,10 @@ class RommAdapter(TokenAuthAdapter):
         url = f"{self.base_url.rstrip('/')}{endpoint}"
         headers = self._get_auth_header()
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(method, url, params=params, json=json, headers=headers)
-            response.raise_for_status()
-            return response
+        await self._ensure_client()
+        response = await self._send_request(method, url, params=params, json=json, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return response
 
     async def test_connection(self) -> ConnectionTestResult:
         """Test connection to RomM."""
@@ -169,30 +173,65 @@ class RommAdapter(TokenAuthAdapter):
     async def get_roms(self, platform_id: Optional[int] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Get list of ROMs."""
         try:
-            endpoint = f"/api/platforms/{platform_id}/roms" if platform_id else "/api/roms"
-            params = {"limit": limit}
+            page_size = min(limit, ROMS_PAGE_SIZE)
+            return [rom async for rom in self.iter_roms(platform_id, page_size=page_size, max_items=limit)]
+        except Exception as e:
+            self.logger.error(f"Failed to get ROMs: {e}")
+            return []
+
+    def iter_roms(
+        self, platform_id: Optional[int] = None, page_size: int = ROMS_PAGE_SIZE, max_items: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream ROMs, fetching the next pages concurrently.
+
+        Args:
+            platform_id: Optional platform filter
+            page_size: ROMs requested per page
+            max_items: Stop after this many ROMs
+
+        Returns:
+            Async iterator over ROMs (formatted like ``get_roms``)
+        """
+        endpoint = f"/api/platforms/{platform_id}/roms" if platform_id else "/api/roms"
+
+        plain_list = False
+
+        async def fetch_page(index: int) -> Page:
+            nonlocal plain_list
+            if plain_list:
+                # The first page already held every requested ROM
+                return Page([])
 
+            params = {"limit": page_size, "offset": index * page_size}
             response = await self._make_request("GET", endpoint, params=params)
             roms = response.json()
 
-            return [
-                {
-                    "id": rom.get("id"),
-                    "name": rom.get("name"),
-                    "file_name": rom.get("file_name"),
-                    "file_size": rom.get("file_size", 0),
-                    "platform_id": rom.get("platform_id"),
-                    "platform_slug": rom.get("platform_slug"),
-                    "igdb_id": rom.get("igdb_id"),
-                    "summary": rom.get("summary", "")[:200] if rom.get("summary") else None,
-                    "path": rom.get("path"),
-                    "url": self._get_rom_url(rom.get("id")),
-                }
-                for rom in (roms if isinstance(roms, list) else roms.get("items", []))[:limit]
-            ]
-        except Exception as e:
-            self.logger.error(f"Failed to get ROMs: {e}")
-            return []
+            if isinstance(roms, list):
+                # Older RomM versions return a plain list and ignore the offset,
+                # so all requested ROMs are fetched at once
+                plain_list = True
+                if len(roms) >= page_size and (max_items is None or max_items > page_size):
+                    params = {"limit": max_items} if max_items is not None else {}
+                    roms = (await self._make_request("GET", endpoint, params=params)).json()
+                return Page([self._format_rom(rom) for rom in roms], len(roms))
+            return Page([self._format_rom(rom) for rom in roms.get("items", [])], roms.get("total"))
+
+        return self.iter_pages(fetch_page, page_size, max_items=max_items)
+
+    def _format_rom(self, rom: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a RomM ROM."""
+        return {
+            "id": rom.get("id"),
+            "name": rom.get("name"),
+            "file_name": rom.get("file_name"),
+            "file_size": rom.get("file_size", 0),
+            "platform_id": rom.get("platform_id"),
+            "platform_slug": rom.get("platform_slug"),
+            "igdb_id": rom.get("igdb_id"),
+            "summary": rom.get("summary", "")[:200] if rom.get("summary") else None,
+            "path": rom.get("path"),
+            "url": self._get_rom_url(rom.get("id")),
+        }
 
     async def search_roms(
         self, query: str, platform_slug: Optional[str] = None, limit: int = 20
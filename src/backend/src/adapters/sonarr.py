@@ -1,16 +1,51 @@
 """Sonarr TV series management adapter."""
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from .base import ConnectionTestResult, ServiceCapability, TokenAuthAdapter
+from .indexer_tests import ResultCallback, indexer_test_runner
+from .library_index import LibraryIndex
+from .reference_data import arr_reference_cache
+
+# Series fields used by library lookups (the rest of the payload is dropped when the library loads)
+SERIES_INDEX_FIELDS = (
+    "id",
+    "title",
+    "alternateTitles",
+    "year",
+    "tvdbId",
+    "imdbId",
+    "tmdbId",
+    "status",
+    "monitored",
+    "seasonCount",
+    "episodeCount",
+    "episodeFileCount",
+    "statistics",
+    "path",
+    "sizeOnDisk",
+    "network",
+    "qualityProfileId",
+)
 
 
 class SonarrAdapter(TokenAuthAdapter):
     """Adapter for Sonarr TV series download management."""
 
+    def __init__(self, service_config, *args, **kwargs):
+        super().__init__(service_config, *args, **kwargs)
+        # Pooled adapters keep the library in memory between tool calls
+        self.series_index = LibraryIndex(
+            self,
+            "/api/v3/series",
+            history_id_key="seriesId",
+            external_id_keys=("tvdbId", "imdbId", "tmdbId"),
+            fields=SERIES_INDEX_FIELDS,
+        )
+
     @property
     def service_type(self) -> str:
         return "sonarr"
@@ -116,8 +151,8 @@ class SonarrAdapter(TokenAuthAdapter):
     async def get_series(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get list of TV series in Sonarr."""
         try:
-            response = await self._make_request("GET", "/api/v3/series")
-            series_list = response.json()
+            await self.series_index.ensure_fresh()
+            series_list = self.series_index.items()
 
             return [
                 {
@@ -186,13 +221,7 @@ class SonarrAdapter(TokenAuthAdapter):
             results = response.json()
 
             # Get quality profiles for library series
-            quality_profiles = {}
-            try:
-                profiles_response = await self._make_request("GET", "/api/v3/qualityprofile")
-                for profile in profiles_response.json():
-                    quality_profiles[profile.get("id")] = profile.get("name")
-            except Exception:
-                pass
+            quality_profiles = await arr_reference_cache.get_names(self, "quality_profiles")
 
             formatted_results = []
             for series in results[:20]:
@@ -237,40 +266,41 @@ class SonarrAdapter(TokenAuthAdapter):
     async def get_series_by_title(self, title: str, year: int = None) -> Dict[str, Any]:
         """Get a specific series from Sonarr library by title."""
         try:
-            response = await self._make_request("GET", "/api/v3/series")
-            series_list = response.json()
+            await self.series_index.ensure_fresh()
 
             # Get quality profiles
-            quality_profiles = {}
-            try:
-                profiles_response = await self._make_request("GET", "/api/v3/qualityprofile")
-                for profile in profiles_response.json():
-                    quality_profiles[profile.get("id")] = profile.get("name")
-            except Exception:
-                pass
-
-            title.lower().strip()
-            best_match = None
-            best_score = 0
-
-            for series in series_list:
-                series.get("title", "").lower().strip()
-                series_year = series.get("year")
-
-                # Calculate match score
-                score = self._calculate_match_score(title, series.get("title", ""))
+            quality_profiles = await arr_reference_cache.get_names(self, "quality_profiles")
 
-                # Year matching bonus
+            def year_bonus(series_year):
                 if year and series_year:
                     if series_year == year:
-                        score += 10
-                    elif abs(series_year - year) <= 1:
-                        score += 5
+                        return 10
+                    if abs(series_year - year) <= 1:
+                        return 5
+                return 0
 
+            best_match = None
+            best_score = 0
+
+            # Exact title (or alternate title) matches outrank any partial match
+            for series, is_primary_title in self.series_index.find_by_title(title):
+                score = (100 if is_primary_title else 95) + year_bonus(series.get("year"))
                 if score > best_score:
                     best_score = score
                     best_match = series
 
+            if best_match is None:
+                for series in self.series_index.items():
+                    # Calculate match score
+                    score = self._calculate_match_score(title, series.get("title", ""))
+
+                    # Year matching bonus
+                    score += year_bonus(series.get("year"))
+
+                    if score > best_score:
+                        best_score = score
+                        best_match = series
+
             if not best_match or best_score < 50:
                 return {
                     "found": False,
@@ -529,8 +559,14 @@ class SonarrAdapter(TokenAuthAdapter):
         except Exception as e:
             return {"success": False, "indexer_id": indexer_id, "error": str(e)}
 
-    async def test_all_indexers(self) -> Dict[str, Any]:
-        """Test all enabled indexers."""
+    async def test_all_indexers(self, on_result: Optional[ResultCallback] = None) -> Dict[str, Any]:
+        """Test all enabled indexers.
+
+        Indexers are tested concurrently (see ``indexer_test_runner``).
+
+        Args:
+            on_result: Called with each indexer result as soon as its test completes
+        """
         indexers = await self.get_indexers()
         # Filter enabled indexers - check both 'enable' (v3) and 'enableRss'/'enableAutomaticSearch' fields
         enabled_indexers = [
@@ -541,20 +577,8 @@ class SonarrAdapter(TokenAuthAdapter):
         if not enabled_indexers and indexers:
             enabled_indexers = indexers
 
-        results = []
-        for indexer in enabled_indexers:
-            result = await self.test_indexer(indexer["id"])
-            result["indexer_name"] = indexer.get("name")
-            results.append(result)
-
-        success_count = sum(1 for r in results if r.get("success"))
-        return {
-            "total_tested": len(results),
-            "success_count": success_count,
-            "failed_count": len(results) - success_count,
-            "total_indexers": len(indexers),
-            "results": results,
-        }
+        summary = await indexer_test_runner.run(enabled_indexers, self.test_indexer, on_result=on_result)
+        return {**summary, "total_indexers": len(indexers)}
 
     def _calculate_fuzzy_match_score(self, query: str, target: str) -> int:
         """Calculate fuzzy match score between two strings (0-100).
@@ -779,11 +803,14 @@ class SonarrAdapter(TokenAuthAdapter):
             self.logger.error(f"Failed to check queue match: {e}")
             return {"found": False, "error": str(e)}
 
-    async def get_quality_profiles(self) -> List[Dict[str, Any]]:
-        """Get available quality profiles."""
+    async def get_quality_profiles(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get available quality profiles.
+
+        Args:
+            refresh: Bypass the reference-data cache
+        """
         try:
-            response = await self._make_request("GET", "/api/v3/qualityprofile")
-            profiles = response.json()
+            profiles = await arr_reference_cache.get(self, "quality_profiles", refresh=refresh)
 
             return [
                 {
@@ -806,11 +833,14 @@ class SonarrAdapter(TokenAuthAdapter):
             self.logger.error(f"Failed to get quality profiles: {e}")
             return []
 
-    async def get_root_folders(self) -> List[Dict[str, Any]]:
-        """Get available root folders for series."""
+    async def get_root_folders(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get available root folders for series.
+
+        Args:
+            refresh: Bypass the reference-data cache
+        """
         try:
-            response = await self._make_request("GET", "/api/v3/rootfolder")
-            folders = response.json()
+            folders = await arr_reference_cache.get(self, "root_folders", refresh=refresh)
 
             return [
                 {
@@ -907,6 +937,7 @@ class SonarrAdapter(TokenAuthAdapter):
             # Add the series
             response = await self._make_request("POST", "/api/v3/series", json=payload)
             added_series = response.json()
+            self.series_index.upsert(added_series)
 
             return {
                 "success": True,
@@ -961,6 +992,7 @@ class SonarrAdapter(TokenAuthAdapter):
                 "addImportListExclusion": str(add_exclusion).lower(),
             }
             await self._make_request("DELETE", f"/api/v3/series/{series_id}", params=params)
+            self.series_index.remove(series_id)
 
             return {
                 "success": True,
@@ -1017,16 +1049,11 @@ class SonarrAdapter(TokenAuthAdapter):
             # Update the series
             response = await self._make_request("PUT", f"/api/v3/series/{series_id}", json=series)
             updated_series = response.json()
+            self.series_index.upsert(updated_series)
 
             # Get quality profile name
-            profile_name = None
-            try:
-                profiles = await self.get_quality_profiles()
-                profile = next((p for p in profiles if p["id"] == updated_series.get("qualityProfileId")), None)
-                if profile:
-                    profile_name = profile["name"]
-            except Exception:
-                pass
+            quality_profiles = await arr_reference_cache.get_names(self, "quality_profiles")
+            profile_name = quality_profiles.get(updated_series.get("qualityProfileId"))
 
             return {
                 "success": True,
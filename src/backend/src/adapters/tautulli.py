@@ -211,8 +211,7 @@ class TautulliAdapter(TokenAuthAdapter):
             if user:
                 params["user"] = user
 
-            response = await self._make_request("GET", "", params=params)
-            data = response.json()
+            data = await self._request_json("GET", "", params=params)
 
             if data.get("response", {}).get("result") != "success":
                 return {"history": [], "total_duration": 0}
@@ -220,32 +219,7 @@ class TautulliAdapter(TokenAuthAdapter):
             history_data = data.get("response", {}).get("data", {})
             history_items = history_data.get("data", [])
 
-            processed_history = []
-            for item in history_items:
-                processed_history.append(
-                    {
-                        "id": item.get("id"),
-                        "date": item.get("date"),
-                        "started": item.get("started"),
-                        "stopped": item.get("stopped"),
-                        "duration": item.get("duration"),
-                        "watched_status": item.get("watched_status"),
-                        "user": item.get("user"),
-                        "friendly_name": item.get("friendly_name"),
-                        "title": item.get("title"),
-                        "parent_title": item.get("parent_title"),
-                        "grandparent_title": item.get("grandparent_title"),
-                        "media_type": item.get("media_type"),
-                        "rating_key": item.get("rating_key"),
-                        "parent_rating_key": item.get("parent_rating_key"),
-                        "grandparent_rating_key": item.get("grandparent_rating_key"),
-                        "year": item.get("year"),
-                        "player": item.get("player"),
-                        "ip_address": item.get("ip_address"),
-                        "paused_counter": item.get("paused_counter"),
-                        "percent_complete": item.get("percent_complete"),
-                    }
-                )
+            processed_history = [self._format_history_item(item) for item in history_items]
 
             return {
                 "history": processed_history,
@@ -258,6 +232,32 @@ class TautulliAdapter(TokenAuthAdapter):
             self.logger.warning(f"Failed to get history: {e}")
             return {"history": [], "total_duration": 0}
 
+    @staticmethod
+    def _format_history_item(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a Tautulli history item."""
+        return {
+            "id": item.get("id"),
+            "date": item.get("date"),
+            "started": item.get("started"),
+            "stopped": item.get("stopped"),
+            "duration": item.get("duration"),
+            "watched_status": item.get("watched_status"),
+            "user": item.get("user"),
+            "friendly_name": item.get("friendly_name"),
+            "title": item.get("title"),
+            "parent_title": item.get("parent_title"),
+            "grandparent_title": item.get("grandparent_title"),
+            "media_type": item.get("media_type"),
+            "rating_key": item.get("rating_key"),
+            "parent_rating_key": item.get("parent_rating_key"),
+            "grandparent_rating_key": item.get("grandparent_rating_key"),
+            "year": item.get("year"),
+            "player": item.get("player"),
+            "ip_address": item.get("ip_address"),
+            "paused_counter": item.get("paused_counter"),
+            "percent_complete": item.get("percent_complete"),
+        }
+
     async def get_users(self) -> List[Dict[str, Any]]:
         """Get users from Tautulli."""
         try:
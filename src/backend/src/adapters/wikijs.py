@@ -72,17 +72,17 @@ class WikiJSAdapter(TokenAuthAdapter):
 
         payload = {"query": query, "variables": variables or {}}
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            result = response.json()
+        await self._ensure_client()
+        response = await self._send_request("POST", url, json=payload, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        result = response.json()
 
-            # Check for GraphQL errors
-            if "errors" in result and result["errors"]:
-                error_msg = result["errors"][0].get("message", "GraphQL error")
-                raise AdapterError(f"WikiJS API error: {error_msg}")
+        # Check for GraphQL errors
+        if "errors" in result and result["errors"]:
+            error_msg = result["errors"][0].get("message", "GraphQL error")
+            raise AdapterError(f"WikiJS API error: {error_msg}")
 
-            return result.get("data", {})
+        return result.get("data", {})
 
     async def test_connection(self) -> ConnectionTestResult:
         """Test connection to WikiJS."""
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
@@ -13,6 +13,7 @@ from .base import (
     ServiceCapability,
     TokenAuthAdapter,
 )
+from .pagination import Page
 
 
 class TicketState(Enum):
@@ -285,31 +286,50 @@ class ZammadAdapter(TokenAuthAdapter):
             response = await self._make_request("GET", "/api/v1/users", params=params)
             data = response.json()
 
-            users = []
-            for user in data if isinstance(data, list) else []:
-                users.append(
-                    {
-                        "id": user.get("id"),
-                        "email": user.get("email"),
-                        "firstname": user.get("firstname"),
-                        "lastname": user.get("lastname"),
-                        "login": user.get("login"),
-                        "phone": user.get("phone"),
-                        "active": user.get("active"),
-                        "verified": user.get("verified"),
-                        "roles": user.get("roles", []),
-                        "groups": user.get("groups", []),
-                        "created_at": user.get("created_at"),
-                        "updated_at": user.get("updated_at"),
-                    }
-                )
-
-            return users
+            return [self._format_user(user) for user in (data if isinstance(data, list) else [])]
 
         except Exception as e:
             self.logger.warning(f"Failed to get users: {e}")
             return []
 
+    def iter_users(self, per_page: int = 100, max_items: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every Zammad user, fetching the next pages concurrently.
+
+        Args:
+            per_page: Users requested per page
+            max_items: Stop after this many users
+
+        Returns:
+            Async iterator over users (formatted like ``get_users``)
+        """
+
+        async def fetch_page(index: int) -> Page:
+            params = {"page": str(index + 1), "per_page": str(per_page)}
+            response = await self._make_request("GET", "/api/v1/users", params=params)
+            data = response.json()
+            # Zammad does not report a total; a short page ends the listing
+            return Page([self._format_user(user) for user in (data if isinstance(data, list) else [])])
+
+        return self.iter_pages(fetch_page, per_page, max_items=max_items)
+
+    @staticmethod
+    def _format_user(user: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a Zammad user."""
+        return {
+            "id": user.get("id"),
+            "email": user.get("email"),
+            "firstname": user.get("firstname"),
+            "lastname": user.get("lastname"),
+            "login": user.get("login"),
+            "phone": user.get("phone"),
+            "active": user.get("active"),
+            "verified": user.get("verified"),
+            "roles": user.get("roles", []),
+            "groups": user.get("groups", []),
+            "created_at": user.get("created_at"),
+            "updated_at": user.get("updated_at"),
+        }
+
     async def get_groups(self) -> List[Dict[str, Any]]:
         """Get Zammad groups."""
         try:
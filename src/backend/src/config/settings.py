@@ -1,7 +1,7 @@
 """Application settings and configuration."""
 
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +33,21 @@ class Settings(BaseSettings):
     redis_url: str = Field(default="redis://localhost:6379", alias="REDIS_URL")
     cache_ttl: int = Field(default=300, alias="CACHE_TTL")
 
+    # Read-only tool result cache (CACHE_TTL is the default TTL)
+    tool_cache_enabled: bool = Field(default=True, alias="TOOL_CACHE_ENABLED")
+    tool_cache_size: int = Field(default=1024, alias="TOOL_CACHE_SIZE")
+    tool_cache_stale_ttl: int = Field(default=120, alias="TOOL_CACHE_STALE_TTL")
+    tool_cache_ttls: Dict[str, int] = Field(default_factory=dict, alias="TOOL_CACHE_TTLS")
+
+    # Open WebUI user resolution cache
+    user_cache_ttl: int = Field(default=300, alias="USER_CACHE_TTL")
+    user_cache_size: int = Field(default=1024, alias="USER_CACHE_SIZE")
+
+    # Tool chain flow state (pending suggestions per session/user)
+    chain_flow_ttl: int = Field(default=300, alias="CHAIN_FLOW_TTL")
+    chain_flow_max_sessions: int = Field(default=1024, alias="CHAIN_FLOW_MAX_SESSIONS")
+    chain_flow_history_fallback: bool = Field(default=False, alias="CHAIN_FLOW_HISTORY_FALLBACK")
+
     # CORS - Use "*" in development to allow any origin
     cors_origins: List[str] = Field(
         default=["*"],
@@ -70,12 +85,50 @@ class Settings(BaseSettings):
     training_worker_url: str = Field(default="http://192.168.1.60:8088", alias="TRAINING_WORKER_URL")
     training_worker_api_key: str = Field(default="", alias="TRAINING_WORKER_API_KEY")
 
+    # Upstream HTTP connection pool
+    http_max_connections: int = Field(default=20, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=10, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=30.0, alias="HTTP_KEEPALIVE_EXPIRY")
+    http2_enabled: bool = Field(default=False, alias="HTTP2_ENABLED")
+
+    # Conditional-request (ETag / Last-Modified) cache of upstream GET responses, budget in MB
+    http_conditional_cache_enabled: bool = Field(default=True, alias="HTTP_CONDITIONAL_CACHE_ENABLED")
+    http_conditional_cache_max_mb: int = Field(default=64, alias="HTTP_CONDITIONAL_CACHE_MAX_MB")
+
+    # Per-service circuit breakers around upstream calls (probe calls allowed while half-open)
+    circuit_breaker_enabled: bool = Field(default=True, alias="CIRCUIT_BREAKER_ENABLED")
+    circuit_breaker_half_open_max_calls: int = Field(default=1, alias="CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS")
+
+    # MCP request audit writer (write-behind batching)
+    audit_flush_interval: float = Field(default=1.0, alias="AUDIT_FLUSH_INTERVAL")
+    audit_batch_size: int = Field(default=100, alias="AUDIT_BATCH_SIZE")
+    audit_max_pending: int = Field(default=5000, alias="AUDIT_MAX_PENDING")
+    audit_backpressure: str = Field(default="block", alias="AUDIT_BACKPRESSURE")
+
+    # Indexer tests (test_all_indexers): parallel tests and per-indexer timeout in seconds
+    indexer_test_concurrency: int = Field(default=5, alias="INDEXER_TEST_CONCURRENCY")
+    indexer_test_timeout: float = Field(default=60.0, alias="INDEXER_TEST_TIMEOUT")
+
+    # Scheduled health checks: services checked at once, per-check timeout in seconds
+    # and maximum number of checks started per minute across all services
+    health_check_concurrency: int = Field(default=8, alias="HEALTH_CHECK_CONCURRENCY")
+    health_check_timeout: float = Field(default=45.0, alias="HEALTH_CHECK_TIMEOUT")
+    health_check_max_probes_per_minute: int = Field(default=30, alias="HEALTH_CHECK_MAX_PROBES_PER_MINUTE")
+
     # Monitoring
     enable_metrics: bool = Field(default=True, alias="ENABLE_METRICS")
     metrics_port: int = Field(default=9090, alias="METRICS_PORT")
+    # Background system metrics sampling: seconds between samples and samples kept
+    system_metrics_interval: float = Field(default=5.0, alias="SYSTEM_METRICS_INTERVAL")
+    system_metrics_history: int = Field(default=720, alias="SYSTEM_METRICS_HISTORY")
 
     # Docker
     docker_socket: str = Field(default="/var/run/docker.sock", alias="DOCKER_SOCKET")
+    # Background Docker status collection: seconds between inventory and stats refreshes,
+    # and containers whose stats are read at once
+    docker_inventory_interval: float = Field(default=60.0, alias="DOCKER_INVENTORY_INTERVAL")
+    docker_stats_interval: float = Field(default=15.0, alias="DOCKER_STATS_INTERVAL")
+    docker_stats_concurrency: int = Field(default=8, alias="DOCKER_STATS_CONCURRENCY")
 
     # Alerts
     alert_email_enabled: bool = Field(default=False, alias="ALERT_EMAIL_ENABLED")
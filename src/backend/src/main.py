@@ -9,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 
+from src.adapters.pool import adapter_pool, http_client_pool
 from src.config.settings import get_settings
 from src.database.connection import get_db_manager, init_database
 from src.middleware.correlation_id import CorrelationIdMiddleware
@@ -55,6 +56,72 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Setup logging
     setup_logging(settings.log_level)
 
+    # Configure the shared upstream HTTP client pool
+    http_client_pool.configure(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+        http2=settings.http2_enabled,
+    )
+
+    # Configure revalidation of upstream GET responses
+    from src.adapters.conditional_cache import conditional_response_cache
+
+    conditional_response_cache.configure(
+        enabled=settings.http_conditional_cache_enabled,
+        max_bytes=settings.http_conditional_cache_max_mb * 1024 * 1024,
+    )
+
+    # Configure the per-service circuit breakers
+    from src.services.circuit_breaker import circuit_manager
+
+    circuit_manager.configure(
+        enabled=settings.circuit_breaker_enabled,
+        half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+    )
+
+    # Configure the read-only tool result cache
+    from src.mcp.tools.result_cache import tool_result_cache
+
+    tool_result_cache.configure(
+        enabled=settings.tool_cache_enabled,
+        maxsize=settings.tool_cache_size,
+        default_ttl=settings.cache_ttl,
+        stale_ttl=settings.tool_cache_stale_ttl,
+        ttls=settings.tool_cache_ttls,
+    )
+
+    # Configure concurrent indexer tests
+    from src.adapters.indexer_tests import indexer_test_runner
+
+    indexer_test_runner.configure(
+        concurrency=settings.indexer_test_concurrency,
+        timeout=settings.indexer_test_timeout,
+    )
+
+    # Configure scheduled health checks
+    from src.services.health_scheduler import health_scheduler
+
+    health_scheduler.configure(
+        max_concurrent_checks=settings.health_check_concurrency,
+        check_timeout=settings.health_check_timeout,
+        max_probes_per_minute=settings.health_check_max_probes_per_minute,
+    )
+
+    # Configure the Open WebUI user resolution cache
+    from src.services.user_resolution_cache import user_resolution_cache
+
+    user_resolution_cache.configure(maxsize=settings.user_cache_size, ttl=settings.user_cache_ttl)
+
+    # Configure the tool chain flow state store
+    from src.services.chain_flow_store import chain_flow_store
+
+    chain_flow_store.configure(
+        maxsize=settings.chain_flow_max_sessions,
+        ttl=settings.chain_flow_ttl,
+        history_fallback=settings.chain_flow_history_fallback,
+    )
+
     # Initialize database
     db_manager = init_database()
     await db_manager.create_tables()
@@ -70,6 +137,46 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         print(f"⚠️ Failed to cleanup orphan tools: {e}")
 
+    # Build the shared tool registry once; service changes invalidate it
+    try:
+        from src.services.tool_registry_cache import tool_registry_cache
+
+        async with db_manager.session_factory() as session:
+            registry = await tool_registry_cache.get(session)
+            print(f"🧰 Tool registry ready: {len(registry.tools)} tools")
+    except Exception as e:
+        print(f"⚠️ Failed to build tool registry: {e}")
+
+    # Start the write-behind MCP request audit writer
+    from src.services.mcp_audit_writer import mcp_audit_writer
+
+    mcp_audit_writer.configure(
+        flush_interval=settings.audit_flush_interval,
+        batch_size=settings.audit_batch_size,
+        max_pending=settings.audit_max_pending,
+        backpressure=settings.audit_backpressure,
+    )
+    mcp_audit_writer.start()
+
+    # Start the background system metrics sampler
+    from src.services.metrics_sampler import system_metrics_sampler
+
+    system_metrics_sampler.configure(
+        interval=settings.system_metrics_interval,
+        history_size=settings.system_metrics_history,
+    )
+    system_metrics_sampler.start()
+
+    # Start the background Docker status collector
+    from src.services.docker_monitor import docker_status_collector
+
+    docker_status_collector.configure(
+        inventory_interval=settings.docker_inventory_interval,
+        stats_interval=settings.docker_stats_interval,
+        stats_concurrency=settings.docker_stats_concurrency,
+    )
+    docker_status_collector.start()
+
     print(f"🚀 MCParr AI Gateway started on port {settings.api_port}")
     print("📊 Web UI: http://localhost:3000")
     print(f"🔗 API Docs: http://localhost:{settings.api_port}/docs")
@@ -78,6 +185,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Shutdown
+    await docker_status_collector.stop()
+    await system_metrics_sampler.stop()
+    await tool_result_cache.close()
+    await mcp_audit_writer.stop()
+    await adapter_pool.close_all()
     await db_manager.close()
     print("👋 MCParr AI Gateway shutdown complete")
 
@@ -69,10 +69,32 @@ async def main():
     # Initialize the server with service configs
     await server.initialize(service_configs)
 
+    # Sample system metrics in the background for the system tools
+    from src.config.settings import get_settings
+    from src.services.metrics_sampler import system_metrics_sampler
+
+    settings = get_settings()
+    system_metrics_sampler.configure(
+        interval=settings.system_metrics_interval,
+        history_size=settings.system_metrics_history,
+    )
+    system_metrics_sampler.start()
+
     print("MCP Server initialized. Listening on stdio...", file=sys.stderr)
 
     # Run the stdio server
-    await server.run_stdio()
+    try:
+        await server.run_stdio()
+    finally:
+        from src.mcp.tools.result_cache import tool_result_cache
+
+        await system_metrics_sampler.stop()
+        await tool_result_cache.close()
+
+        # Write buffered audit records before exiting
+        from src.services.mcp_audit_writer import mcp_audit_writer
+
+        await mcp_audit_writer.stop()
 
 
 if __name__ == "__main__":
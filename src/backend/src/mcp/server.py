@@ -153,9 +153,9 @@ class MCPServer:
         definition = self.registry.get_definition(tool_name)
 
         # Log the request if we have a database session
-        request_id = None
+        audit_request = None
         if self.db_session_factory:
-            request_id = await self._log_request_start(
+            audit_request = await self._log_request_start(
                 tool_name=tool_name,
                 arguments=arguments,
                 category=definition.category if definition else "unknown",
@@ -182,9 +182,9 @@ class MCPServer:
                 print(f"Failed to enrich result with chains: {e}", file=sys.stderr)
 
         # Log the result (with enriched data)
-        if self.db_session_factory and request_id:
+        if audit_request is not None:
             await self._log_request_complete(
-                request_id=request_id,
+                request=audit_request,
                 result=enriched_result,
                 duration_ms=duration_ms,
             )
@@ -218,27 +218,24 @@ class MCPServer:
         arguments: dict,
         category: str,
         is_mutation: bool,
-    ) -> Optional[str]:
-        """Log the start of an MCP request."""
+    ) -> Optional[Any]:
+        """Queue the audit record for the start of an MCP request."""
         try:
-            from src.models import McpRequest, McpRequestStatus, McpToolCategory
-
-            async with self.db_session_factory() as session:
-                request = McpRequest(
-                    session_id=self._session_id,
-                    tool_name=tool_name,
-                    tool_category=McpToolCategory(category)
-                    if category in [e.value for e in McpToolCategory]
-                    else McpToolCategory.SYSTEM,
-                    input_params=arguments,
-                    status=McpRequestStatus.PROCESSING,
-                    is_mutation=is_mutation,
-                    started_at=datetime.utcnow(),
-                )
-                session.add(request)
-                await session.commit()
-                await session.refresh(request)
-                return str(request.id)
+            from src.models import McpRequest, McpToolCategory
+            from src.services.mcp_audit_writer import mcp_audit_writer
+
+            request = McpRequest(
+                session_id=self._session_id,
+                tool_name=tool_name,
+                tool_category=McpToolCategory(category)
+                if category in [e.value for e in McpToolCategory]
+                else McpToolCategory.SYSTEM,
+                input_params=arguments,
+                is_mutation=is_mutation,
+            )
+            request.mark_started()
+            await mcp_audit_writer.add(request)
+            return request
         except Exception as e:
             # Don't fail the request if logging fails
             print(f"Failed to log MCP request start: {e}", file=sys.stderr)
@@ -246,31 +243,23 @@ class MCPServer:
 
     async def _log_request_complete(
         self,
-        request_id: str,
+        request: Any,
         result: dict,
         duration_ms: int,
     ) -> None:
-        """Log the completion of an MCP request."""
+        """Queue the audit record update for the completion of an MCP request."""
         try:
-            from sqlalchemy import select
-
-            from src.models import McpRequest
-
-            async with self.db_session_factory() as session:
-                stmt = select(McpRequest).where(McpRequest.id == request_id)
-                db_result = await session.execute(stmt)
-                request = db_result.scalar_one_or_none()
-
-                if request:
-                    if result.get("success", False):
-                        request.mark_completed(result.get("result", {}))
-                    else:
-                        request.mark_failed(
-                            error_message=result.get("error", "Unknown error"),
-                            error_type=result.get("error_type", "Error"),
-                        )
-                    request.duration_ms = duration_ms
-                    await session.commit()
+            from src.services.mcp_audit_writer import mcp_audit_writer
+
+            if result.get("success", False):
+                request.mark_completed(result.get("result", {}))
+            else:
+                request.mark_failed(
+                    error_message=result.get("error", "Unknown error"),
+                    error_type=result.get("error_type", "Error"),
+                )
+            request.duration_ms = duration_ms
+            await mcp_audit_writer.update(request)
         except Exception as e:
             print(f"Failed to log MCP request completion: {e}", file=sys.stderr)
 
@@ -216,10 +216,12 @@ class AudiobookshelfTools(BaseTool):
 
         try:
             from src.adapters.audiobookshelf import AudiobookshelfAdapter
+            from src.adapters.pool import adapter_pool
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     self.username = config.get("username")
                     self.password = config.get("password")
@@ -233,7 +235,7 @@ class AudiobookshelfTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = AudiobookshelfAdapter(service_proxy)
+            adapter = adapter_pool.get(AudiobookshelfAdapter, service_proxy)
 
             if tool_name == "audiobookshelf_get_libraries":
                 return await self._get_libraries(adapter)
@@ -375,10 +377,9 @@ class AudiobookshelfTools(BaseTool):
         if not libraries_to_search:
             libraries_to_search = libraries
 
-        # Search in each library
-        for lib in libraries_to_search:
-            results = await adapter.search(lib["id"], title, limit=10)
-
+        # Search all libraries at once, then check them in order
+        library_results = await adapter.search_libraries([lib["id"] for lib in libraries_to_search], title, limit=10)
+        for lib, results in zip(libraries_to_search, library_results, strict=True):
             # Check books
             for book in results.get("book", []):
                 book_title = book.get("title", "").lower()
@@ -436,15 +437,10 @@ class AudiobookshelfTools(BaseTool):
         if not libraries_to_search:
             libraries_to_search = libraries
 
-        # Search in all selected libraries and merge results
-        merged_results = {"book": [], "podcast": [], "authors": [], "series": []}
-        searched_libraries = []
-
-        for lib in libraries_to_search:
-            results = await adapter.search(lib["id"], query, limit=limit)
-            searched_libraries.append(lib.get("name"))
-            for key in merged_results:
-                merged_results[key].extend(results.get(key, []))
+        # Search all selected libraries concurrently and merge results
+        library_results = await adapter.search_libraries([lib["id"] for lib in libraries_to_search], query, limit=limit)
+        searched_libraries = [lib.get("name") for lib in libraries_to_search]
+        merged_results = self._merge_search_results(query, library_results, limit)
 
         return {
             "success": True,
@@ -459,6 +455,46 @@ class AudiobookshelfTools(BaseTool):
             },
         }
 
+    @staticmethod
+    def _merge_search_results(query: str, library_results: List[dict], limit: int) -> dict:
+        """Merge per-library search results, ranking books and podcasts by title relevance.
+
+        Each item is scored once; ties keep library order. Books and podcasts are
+        capped to ``limit`` overall, authors and series are deduplicated.
+        """
+        query_lower = (query or "").lower()
+
+        def relevance(item: dict) -> int:
+            title = (item.get("title") or "").lower()
+            if title == query_lower:
+                return 3
+            if title.startswith(query_lower):
+                return 2
+            if query_lower in title:
+                return 1
+            return 0
+
+        merged = {}
+        for key in ("book", "podcast"):
+            scored = [
+                (-relevance(item), position, item)
+                for position, item in enumerate(item for results in library_results for item in results.get(key, []))
+            ]
+            scored.sort(key=lambda entry: entry[:2])
+            merged[key] = [item for _, _, item in scored[:limit]]
+
+        for key in ("authors", "series"):
+            seen = set()
+            merged[key] = []
+            for results in library_results:
+                for item in results.get(key, []):
+                    item_id = item.get("id")
+                    if item_id is None or item_id not in seen:
+                        seen.add(item_id)
+                        merged[key].append(item)
+
+        return merged
+
     async def _get_users(self, adapter) -> dict:
         """Get users from Audiobookshelf."""
         users = await adapter.get_users()
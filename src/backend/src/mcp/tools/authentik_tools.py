@@ -169,10 +169,12 @@ class AuthentikTools(BaseTool):
 
         try:
             from src.adapters.authentik import AuthentikAdapter
+            from src.adapters.pool import adapter_pool
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     self.base_url = config.get("base_url") or config.get("url", "")
                     self.external_url = config.get("external_url")  # Public URL for user links
@@ -183,7 +185,7 @@ class AuthentikTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = AuthentikAdapter(service_proxy)
+            adapter = adapter_pool.get(AuthentikAdapter, service_proxy)
 
             async with adapter:
                 if tool_name == "authentik_get_users":
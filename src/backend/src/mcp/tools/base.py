@@ -1,8 +1,15 @@
 """Base classes for MCP tools."""
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Awaitable, Dict, List, Optional, Type
+
+from ...adapters.base import service_base_url
+from ...services.circuit_breaker import CircuitBreaker, CircuitBreakerError, circuit_manager, service_breaker_name
+from .result_cache import tool_result_cache
+from .single_flight import tool_call_coalescer
 
 
 @dataclass
@@ -85,6 +92,16 @@ class BaseTool(ABC):
         """
         pass
 
+    @property
+    def config_fingerprint(self) -> str:
+        """Stable hash of the service configuration, used to scope cached results."""
+        fingerprint = getattr(self, "_config_fingerprint", None)
+        if fingerprint is None:
+            payload = json.dumps(self.service_config, sort_keys=True, default=str)
+            fingerprint = hashlib.sha1(payload.encode()).hexdigest()
+            self._config_fingerprint = fingerprint
+        return fingerprint
+
     def get_tool_names(self) -> List[str]:
         """Get list of tool names provided by this class."""
         return [d.name for d in self.definitions]
@@ -133,13 +150,53 @@ class ToolRegistry:
         return [d.to_mcp_schema() for d in self._definitions.values()]
 
     async def execute(self, tool_name: str, arguments: dict) -> dict:
-        """Execute a tool by name with arguments."""
+        """Execute a tool by name with arguments.
+
+        Read-only tools go through the shared result cache, and identical
+        concurrent calls share one execution; mutation tools invalidate the
+        cached results of their service.
+        """
         tool = self.get_tool(tool_name)
         if not tool:
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
 
+        definition = self._definitions[tool_name]
+        if definition.is_mutation:
+            try:
+                return await self._execute(tool, tool_name, arguments)
+            finally:
+                tool_result_cache.invalidate_service(definition.requires_service)
+
+        def execute_once() -> Awaitable[dict]:
+            key = tool_result_cache.make_key(definition, tool, arguments)
+            return tool_call_coalescer.run(key, tool_name, lambda: self._execute(tool, tool_name, arguments))
+
+        return await tool_result_cache.run(definition, tool, arguments, execute_once)
+
+    async def _execute(self, tool: BaseTool, tool_name: str, arguments: dict) -> dict:
+        """Execute a tool, turning exceptions into error results.
+
+        Tools of a service whose circuit breaker is open fail fast with a
+        structured ``circuit_open`` error instead of waiting for its timeout.
+        """
+        breaker = self._service_breaker(tool, self._definitions[tool_name])
+        if breaker is not None and breaker.is_rejecting():
+            return {"success": False, **breaker.rejection().to_dict()}
+
         try:
             result = await tool.execute(tool_name, arguments)
             return result
+        except CircuitBreakerError as e:
+            return {"success": False, **e.to_dict()}
         except Exception as e:
             return {"success": False, "error": str(e), "error_type": type(e).__name__}
+
+    @staticmethod
+    def _service_breaker(tool: BaseTool, definition: ToolDefinition) -> Optional[CircuitBreaker]:
+        """Existing circuit breaker of the service a tool calls, if any."""
+        base_url = tool.service_config.get("base_url") or tool.service_config.get("url")
+        if not definition.requires_service or not base_url:
+            return None
+        # Named like the adapter's breaker, which includes a separately configured port
+        base_url = service_base_url(base_url, tool.service_config.get("port"))
+        return circuit_manager.find_breaker(service_breaker_name(definition.requires_service, base_url))
@@ -131,10 +131,12 @@ class DelugeTools(BaseTool):
 
         try:
             from src.adapters.deluge import DelugeAdapter
+            from src.adapters.pool import adapter_pool
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.password = config.get("password")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -146,7 +148,7 @@ class DelugeTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = DelugeAdapter(service_proxy)
+            adapter = adapter_pool.get(DelugeAdapter, service_proxy)
 
             if tool_name == "deluge_get_torrents":
                 return await self._get_torrents(adapter)
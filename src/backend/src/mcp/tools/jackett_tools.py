@@ -101,10 +101,12 @@ class JackettTools(BaseTool):
 
         try:
             from src.adapters.jackett import JackettAdapter
+            from src.adapters.pool import adapter_pool
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     self.base_url = config.get("base_url") or config.get("url", "")
                     self.external_url = config.get("external_url")  # Public URL for user links
@@ -115,7 +117,7 @@ class JackettTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = JackettAdapter(service_proxy)
+            adapter = adapter_pool.get(JackettAdapter, service_proxy)
 
             if tool_name == "jackett_get_indexers":
                 return await self._get_indexers(adapter, arguments)
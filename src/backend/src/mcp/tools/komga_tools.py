@@ -136,10 +136,12 @@ class KomgaTools(BaseTool):
 
         try:
             from src.adapters.komga import KomgaAdapter
+            from src.adapters.pool import adapter_pool
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     self.username = config.get("username")
                     self.password = config.get("password")
@@ -153,7 +155,7 @@ class KomgaTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = KomgaAdapter(service_proxy)
+            adapter = adapter_pool.get(KomgaAdapter, service_proxy)
 
             if tool_name == "komga_get_libraries":
                 return await self._get_libraries(adapter)
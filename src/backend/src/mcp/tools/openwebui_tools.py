@@ -92,11 +92,13 @@ class OpenWebUITools(BaseTool):
         try:
             # Import adapter here to avoid circular imports
             from src.adapters.openwebui import OpenWebUIAdapter
+            from src.adapters.pool import adapter_pool
 
             # Create a mock ServiceConfig object for the adapter
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -108,7 +110,7 @@ class OpenWebUITools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = OpenWebUIAdapter(service_proxy)
+            adapter = adapter_pool.get(OpenWebUIAdapter, service_proxy)
 
             if tool_name == "openwebui_get_status":
                 return await self._get_status(adapter)
@@ -295,11 +295,13 @@ class OverseerrTools(BaseTool):
 
         try:
             from src.adapters.overseerr import OverseerrAdapter
+            from src.adapters.pool import adapter_pool
 
             # Create a mock ServiceConfig object for the adapter
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # base_url can come as 'url' from tool test or 'base_url' from MCP server
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -311,7 +313,7 @@ class OverseerrTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = OverseerrAdapter(service_proxy)
+            adapter = adapter_pool.get(OverseerrAdapter, service_proxy)
 
             if tool_name == "overseerr_search_media":
                 return await self._search_media(adapter, arguments)
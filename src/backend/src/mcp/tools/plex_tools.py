@@ -185,11 +185,13 @@ class PlexTools(BaseTool):
         try:
             # Import adapter here to avoid circular imports
             from src.adapters.plex import PlexAdapter
+            from src.adapters.pool import adapter_pool
 
             # Create a mock ServiceConfig object for the adapter
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -201,7 +203,7 @@ class PlexTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = PlexAdapter(service_proxy)
+            adapter = adapter_pool.get(PlexAdapter, service_proxy)
 
             if tool_name == "plex_get_libraries":
                 return await self._get_libraries(adapter)
@@ -102,11 +102,13 @@ class ProwlarrTools(BaseTool):
             return {"success": False, "error": "Prowlarr service not configured"}
 
         try:
+            from src.adapters.pool import adapter_pool
             from src.adapters.prowlarr import ProwlarrAdapter
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -118,7 +120,7 @@ class ProwlarrTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = ProwlarrAdapter(service_proxy)
+            adapter = adapter_pool.get(ProwlarrAdapter, service_proxy)
 
             if tool_name == "prowlarr_get_indexers":
                 return await self._get_indexers(adapter)
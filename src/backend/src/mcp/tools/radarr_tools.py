@@ -310,11 +310,13 @@ class RadarrTools(BaseTool):
             return {"success": False, "error": "Radarr service not configured"}
 
         try:
+            from src.adapters.pool import adapter_pool
             from src.adapters.radarr import RadarrAdapter
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -326,7 +328,7 @@ class RadarrTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = RadarrAdapter(service_proxy)
+            adapter = adapter_pool.get(RadarrAdapter, service_proxy)
 
             if tool_name == "radarr_search_movie":
                 return await self._search_movie(adapter, arguments)
@@ -0,0 +1,316 @@
+"""Result cache for read-only MCP tools.
+
+LLM agents call the same lookups (libraries, quality profiles, trending...)
+over and over. Successful results of non-mutation tools are cached per tool,
+normalized arguments and service configuration. Expired entries are still
+served for a short grace period while a background refresh runs, and any
+mutation tool of a service drops that service's entries.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from ...adapters.reference_data import REFERENCE_TTLS
+
+if TYPE_CHECKING:
+    from .base import BaseTool, ToolDefinition
+
+logger = logging.getLogger(__name__)
+
+# Key used for tools that do not belong to an external service
+SYSTEM_SERVICE = "system"
+
+# Per-category TTLs in seconds (0 disables caching)
+DEFAULT_CATEGORY_TTLS: Dict[str, float] = {
+    "downloads": 0,  # Torrent states change constantly
+    "monitoring": 60,
+    "support": 60,
+}
+
+# Per-tool TTLs in seconds, taking precedence over categories (0 disables caching)
+DEFAULT_TOOL_TTLS: Dict[str, float] = {
+    # Live state or side effects on the upstream service
+    "plex_get_active_sessions": 0,
+    "tautulli_get_activity": 0,
+    "radarr_get_queue": 0,
+    "radarr_check_queue_match": 0,
+    "radarr_test_indexer": 0,
+    "radarr_test_all_indexers": 0,
+    "sonarr_get_queue": 0,
+    "sonarr_check_queue_match": 0,
+    "sonarr_test_indexer": 0,
+    "sonarr_test_all_indexers": 0,
+    "prowlarr_test_indexer": 0,
+    "prowlarr_test_all_indexers": 0,
+    "jackett_test_indexer": 0,
+    "jackett_test_all_indexers": 0,
+    # Short-lived state
+    "plex_get_on_deck": 60,
+    "radarr_get_movie_status": 30,
+    "sonarr_get_series_status": 30,
+    "overseerr_get_requests": 30,
+    "overseerr_check_availability": 60,
+    "audiobookshelf_get_media_progress": 30,
+    "openwebui_get_status": 30,
+    # Reference data that barely changes
+    "plex_get_libraries": 3600,
+    "plex_get_collections": 900,
+    "overseerr_get_trending": 1800,
+    "tautulli_get_libraries": 3600,
+    "tautulli_get_server_info": 3600,
+    "radarr_get_quality_profiles": 3600,
+    # Free space changes with every download: follow the reference data cache
+    "radarr_get_root_folders": REFERENCE_TTLS["root_folders"],
+    "radarr_get_indexers": 900,
+    "sonarr_get_quality_profiles": 3600,
+    "sonarr_get_root_folders": REFERENCE_TTLS["root_folders"],
+    "sonarr_get_indexers": 900,
+    "prowlarr_get_indexers": 900,
+    "prowlarr_get_applications": 900,
+    "jackett_get_indexers": 900,
+    "komga_get_libraries": 3600,
+    "audiobookshelf_get_libraries": 3600,
+    "romm_get_platforms": 3600,
+    "authentik_get_server_info": 3600,
+    "openwebui_get_models": 900,
+    "wikijs_get_tags": 900,
+    "wikijs_get_page_tree": 900,
+}
+
+CacheKey = Tuple[str, str, str, int, str]
+
+
+@dataclass
+class CachedResult:
+    """A cached tool result with its freshness deadlines (monotonic time)."""
+
+    result: Dict[str, Any]
+    fresh_until: float
+    stale_until: float
+
+
+def normalize_arguments(arguments: Optional[Dict[str, Any]]) -> str:
+    """Serialize tool arguments into a stable cache key component.
+
+    Unset arguments and internal ``_``-prefixed metadata (e.g. the resolved
+    Open WebUI user) do not change a tool's result and are ignored.
+    """
+    cleaned = {k: v for k, v in (arguments or {}).items() if v is not None and not k.startswith("_")}
+    return json.dumps(cleaned, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolResultCache:
+    """LRU cache of successful read-only tool results."""
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float = 300.0, stale_ttl: float = 120.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            default_ttl: TTL for tools without a per-tool or per-category TTL
+            stale_ttl: How long an expired result may still be served while it is refreshed
+        """
+        self.enabled = True
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._tool_ttls: Dict[str, float] = dict(DEFAULT_TOOL_TTLS)
+        self._category_ttls: Dict[str, float] = dict(DEFAULT_CATEGORY_TTLS)
+        self._entries: "OrderedDict[CacheKey, CachedResult]" = OrderedDict()
+        self._service_generations: Dict[str, int] = {}
+        self._refreshing: Set[CacheKey] = set()
+        # Background refreshes in flight (the event loop only keeps weak references to tasks)
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "invalidations": 0,
+        }
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        maxsize: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Update cache settings.
+
+        Args:
+            enabled: Enable or disable caching
+            maxsize: Maximum number of cached results
+            default_ttl: Default TTL in seconds
+            stale_ttl: Stale-while-revalidate window in seconds
+            ttls: TTL overrides keyed by tool name or tool category (0 disables caching)
+        """
+        if enabled is not None:
+            self.enabled = enabled
+            if not enabled:
+                self.clear()
+        if maxsize is not None:
+            self.maxsize = maxsize
+        if default_ttl is not None:
+            self.default_ttl = default_ttl
+        if stale_ttl is not None:
+            self.stale_ttl = stale_ttl
+        if ttls:
+            for name, ttl in ttls.items():
+                # Tool names are prefixed with their service ("plex_..."), categories are single words
+                target = self._tool_ttls if "_" in name else self._category_ttls
+                target[name] = float(ttl)
+
+    def ttl_for(self, definition: "ToolDefinition") -> float:
+        """Get the TTL of a tool (0 means the tool is not cached)."""
+        if definition.is_mutation:
+            return 0
+        if definition.name in self._tool_ttls:
+            return self._tool_ttls[definition.name]
+        # Built-in tools report local, live state
+        if definition.requires_service is None:
+            return 0
+        return self._category_ttls.get(definition.category, self.default_ttl)
+
+    @staticmethod
+    def service_of(definition: "ToolDefinition") -> str:
+        """Get the service a tool's cache entries belong to."""
+        return definition.requires_service or SYSTEM_SERVICE
+
+    def make_key(self, definition: "ToolDefinition", tool: "BaseTool", arguments: Optional[Dict[str, Any]]) -> CacheKey:
+        """Build the cache key of a tool call."""
+        service = self.service_of(definition)
+        return (
+            definition.name,
+            service,
+            tool.config_fingerprint,
+            self._service_generations.get(service, 0),
+            normalize_arguments(arguments),
+        )
+
+    async def run(
+        self,
+        definition: "ToolDefinition",
+        tool: "BaseTool",
+        arguments: Optional[Dict[str, Any]],
+        execute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Execute a read-only tool through the cache.
+
+        Args:
+            definition: Definition of the tool
+            tool: Tool instance (provides the service configuration fingerprint)
+            arguments: Tool arguments
+            execute: Coroutine factory performing the actual execution
+
+        Returns:
+            The tool result (a private copy when served from the cache)
+        """
+        ttl = self.ttl_for(definition)
+        if not self.enabled or ttl <= 0:
+            return await execute()
+
+        key = self.make_key(definition, tool, arguments)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None and now < entry.fresh_until:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return copy.deepcopy(entry.result)
+
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self._stats["stale_hits"] += 1
+            if key not in self._refreshing:
+                self._refreshing.add(key)
+                task = asyncio.create_task(self._refresh(key, ttl, execute))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return copy.deepcopy(entry.result)
+
+        self._stats["misses"] += 1
+        result = await execute()
+        self._store(key, ttl, result)
+        return result
+
+    async def _refresh(self, key: CacheKey, ttl: float, execute: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        """Refresh a stale entry in the background."""
+        try:
+            result = await execute()
+            self._store(key, ttl, result)
+            self._stats["refreshes"] += 1
+        except Exception as e:
+            self._stats["refresh_errors"] += 1
+            logger.warning(f"Background refresh of cached tool '{key[0]}' failed: {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    def _store(self, key: CacheKey, ttl: float, result: Dict[str, Any]) -> None:
+        """Cache a successful result unless its service was invalidated meanwhile."""
+        if not isinstance(result, dict) or not result.get("success"):
+            return
+        if key[3] != self._service_generations.get(key[1], 0):
+            return
+
+        now = time.monotonic()
+        self._entries[key] = CachedResult(
+            result=copy.deepcopy(result),
+            fresh_until=now + ttl,
+            stale_until=now + ttl + self.stale_ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate_service(self, service: Optional[str]) -> int:
+        """Drop every cached result of a service (e.g. after a mutation).
+
+        Returns:
+            Number of entries removed
+        """
+        service = service or SYSTEM_SERVICE
+        self._service_generations[service] = self._service_generations.get(service, 0) + 1
+        keys = [key for key in self._entries if key[1] == service]
+        for key in keys:
+            del self._entries[key]
+        self._stats["invalidations"] += 1
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        for service in list(self._service_generations):
+            self._service_generations[service] += 1
+
+    async def close(self) -> None:
+        """Wait for background refreshes still in flight."""
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"]
+        hits = self._stats["hits"] + self._stats["stale_hits"]
+        return {
+            **self._stats,
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "refreshing": len(self._refresh_tasks),
+            "maxsize": self.maxsize,
+            "default_ttl": self.default_ttl,
+            "stale_ttl": self.stale_ttl,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Global instance
+tool_result_cache = ToolResultCache()
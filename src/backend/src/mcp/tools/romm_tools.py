@@ -153,11 +153,13 @@ class RommTools(BaseTool):
             return {"success": False, "error": "RomM service not configured"}
 
         try:
+            from src.adapters.pool import adapter_pool
             from src.adapters.romm import RommAdapter
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -171,7 +173,7 @@ class RommTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = RommAdapter(service_proxy)
+            adapter = adapter_pool.get(RommAdapter, service_proxy)
 
             if tool_name == "romm_get_platforms":
                 return await self._get_platforms(adapter)
@@ -0,0 +1,88 @@
+"""Single-flight coalescing of identical concurrent tool calls.
+
+When several users (or a retrying model) fire the same read-only tool with the
+same arguments at the same time, only the first call reaches the upstream
+service; the others wait for it and share its result.
+"""
+
+import asyncio
+import copy
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """An in-flight execution and the number of callers waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class ToolCallCoalescer:
+    """Shares one in-flight execution between identical concurrent calls."""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._coalesced_by_tool: Counter = Counter()
+
+    async def run(
+        self,
+        key: Hashable,
+        tool_name: str,
+        execute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Execute a call, or join an identical call that is already running.
+
+        Args:
+            key: Identity of the call (tool, service config, arguments)
+            tool_name: Tool name, used for statistics
+            execute: Coroutine factory performing the actual execution
+
+        Returns:
+            The tool result (a private copy for callers that joined)
+        """
+        flight = self._in_flight.get(key)
+        if flight is not None and not flight.task.done():
+            flight.waiters += 1
+            self._coalesced += 1
+            self._coalesced_by_tool[tool_name] += 1
+            logger.debug(f"Coalesced concurrent call to '{tool_name}'")
+            # A cancelled waiter must not cancel the shared execution
+            result = await asyncio.shield(flight.task)
+            return copy.deepcopy(result)
+
+        flight = _Flight(asyncio.ensure_future(execute()))
+        self._in_flight[key] = flight
+        self._executions += 1
+        flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        result = await asyncio.shield(flight.task)
+        # Callers may modify their result, so keep the shared one intact for waiters
+        return copy.deepcopy(result) if flight.waiters else result
+
+    def _forget(self, key: Hashable, flight: "_Flight") -> None:
+        """Remove a finished execution so later calls start a new one."""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        calls = self._executions + self._coalesced
+        return {
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._in_flight),
+            "coalesce_rate": round(self._coalesced / calls, 3) if calls else 0.0,
+            "top_coalesced_tools": dict(self._coalesced_by_tool.most_common(10)),
+        }
+
+
+# Global instance
+tool_call_coalescer = ToolCallCoalescer()
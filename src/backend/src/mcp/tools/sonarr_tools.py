@@ -355,11 +355,13 @@ class SonarrTools(BaseTool):
             return {"success": False, "error": "Sonarr service not configured"}
 
         try:
+            from src.adapters.pool import adapter_pool
             from src.adapters.sonarr import SonarrAdapter
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -371,7 +373,7 @@ class SonarrTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = SonarrAdapter(service_proxy)
+            adapter = adapter_pool.get(SonarrAdapter, service_proxy)
 
             if tool_name == "sonarr_search_series":
                 return await self._search_series(adapter, arguments)
@@ -307,8 +307,10 @@ class SystemTools(BaseTool):
         """Get system health status."""
         import psutil
 
+        from src.services.metrics_sampler import system_metrics_sampler
+
         # Get basic system health
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent = (await system_metrics_sampler.get_latest())["cpu_percent"]
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
@@ -370,7 +372,9 @@ class SystemTools(BaseTool):
 
         import psutil
 
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        from src.services.metrics_sampler import system_metrics_sampler
+
+        cpu_percent = (await system_metrics_sampler.get_latest())["cpu_percent"]
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
         network = psutil.net_io_counters()
@@ -357,12 +357,14 @@ class TautulliTools(BaseTool):
 
         try:
             # Import adapter here to avoid circular imports
+            from src.adapters.pool import adapter_pool
             from src.adapters.tautulli import TautulliAdapter
 
             # Create a mock ServiceConfig object for the adapter
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -374,7 +376,7 @@ class TautulliTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = TautulliAdapter(service_proxy)
+            adapter = adapter_pool.get(TautulliAdapter, service_proxy)
 
             if tool_name == "tautulli_get_activity":
                 return await self._get_activity(adapter)
@@ -170,11 +170,13 @@ class WikiJSTools(BaseTool):
             return {"success": False, "error": "WikiJS service not configured"}
 
         try:
+            from src.adapters.pool import adapter_pool
             from src.adapters.wikijs import WikiJSAdapter
 
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     self.username = config.get("username")
                     self.password = config.get("password")
@@ -188,7 +190,7 @@ class WikiJSTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = WikiJSAdapter(service_proxy)
+            adapter = adapter_pool.get(WikiJSAdapter, service_proxy)
 
             if tool_name == "wikijs_get_pages":
                 return await self._get_pages(adapter, arguments, service_proxy)
@@ -174,12 +174,14 @@ class ZammadTools(BaseTool):
             return {"success": False, "error": "Zammad service not configured"}
 
         try:
+            from src.adapters.pool import adapter_pool
             from src.adapters.zammad import ZammadAdapter
 
             # Create a mock ServiceConfig object for the adapter
             class ServiceConfigProxy:
                 def __init__(self, config: dict):
                     self._config = config
+                    self.id = config.get("id")
                     self.api_key = config.get("api_key")
                     # Support both 'base_url' and 'url' keys for compatibility
                     self.base_url = config.get("base_url") or config.get("url", "")
@@ -191,7 +193,7 @@ class ZammadTools(BaseTool):
                     return self.config.get(key, default)
 
             service_proxy = ServiceConfigProxy(self.service_config)
-            adapter = ZammadAdapter(service_proxy)
+            adapter = adapter_pool.get(ZammadAdapter, service_proxy)
 
             if tool_name == "zammad_get_tickets":
                 return await self._get_tickets(adapter, arguments)
@@ -9,6 +9,8 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.adapters.conditional_cache import conditional_response_cache
+from src.adapters.pool import adapter_pool
 from src.database.connection import get_db_session
 from src.models.alert_config import AlertConfiguration
 from src.models.configuration import ConfigurationSetting
@@ -26,6 +28,8 @@ from src.models.tool_chain import (
 from src.models.training_prompt import PromptTemplate, TrainingPrompt
 from src.models.training_worker import TrainingWorker
 from src.models.user_mapping import UserMapping
+from src.services.tool_registry_cache import tool_registry_cache
+from src.services.user_resolution_cache import user_resolution_cache
 from src.utils.logging import get_logger
 
 logger = get_logger()
@@ -1056,6 +1060,11 @@ async def import_configuration(request: ImportRequest, db: AsyncSession = Depend
 
         await db.commit()
 
+        if imported.get("services"):
+            tool_registry_cache.invalidate("services imported from backup")
+            adapter_pool.release_all()
+            conditional_response_cache.invalidate()
+
         result = ImportResult(success=len(errors) == 0, imported=imported, errors=errors, warnings=warnings)
 
         logger.info(f"Configuration import completed: {imported}, errors: {len(errors)}")
@@ -1230,6 +1239,10 @@ async def reset_all_data(db: AsyncSession = Depends(get_db_session)) -> ResetAll
 
         # Commit all deletions
         await db.commit()
+        tool_registry_cache.invalidate("all data reset")
+        adapter_pool.release_all()
+        conditional_response_cache.invalidate()
+        user_resolution_cache.clear()
 
         total_deleted = sum(deleted.values())
         message = f"Successfully deleted all data ({total_deleted} total records)"
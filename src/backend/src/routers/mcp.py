@@ -503,6 +503,40 @@ async def cleanup_old_requests(
     return {"deleted": deleted, "retention_days": retention_days}
 
 
+@router.get("/tools/cache-stats")
+async def get_tool_cache_stats():
+    """Get tool result cache, coalescing, reference data, HTTP revalidation and circuit breaker statistics."""
+    from src.adapters.conditional_cache import conditional_response_cache
+    from src.adapters.reference_data import arr_reference_cache
+    from src.mcp.tools.result_cache import tool_result_cache
+    from src.mcp.tools.single_flight import tool_call_coalescer
+    from src.services.circuit_breaker import circuit_manager
+
+    return {
+        "result_cache": tool_result_cache.get_stats(),
+        "coalescing": tool_call_coalescer.get_stats(),
+        "reference_data": arr_reference_cache.get_stats(),
+        "conditional_requests": conditional_response_cache.get_stats(),
+        "circuit_breakers": circuit_manager.get_all_stats(),
+    }
+
+
+@router.post("/tools/reference-data/refresh")
+async def refresh_reference_data(
+    service_id: Optional[str] = Query(None, description="Only refresh this Radarr/Sonarr service"),
+):
+    """Drop cached *arr quality profiles, root folders and tags so they are refetched."""
+    from src.adapters.reference_data import arr_reference_cache
+    from src.mcp.tools.result_cache import tool_result_cache
+
+    removed = arr_reference_cache.invalidate(service_id)
+    # Tool results built from the reference data would otherwise outlive it
+    for service in ("radarr", "sonarr"):
+        tool_result_cache.invalidate_service(service)
+
+    return {"success": True, "removed": removed}
+
+
 @router.get("/tools")
 async def get_available_tools(
     session: AsyncSession = Depends(get_db_session),
@@ -649,6 +683,7 @@ async def test_tool(
     from src.mcp.tools.wikijs_tools import WikiJSTools
     from src.mcp.tools.zammad_tools import ZammadTools
     from src.models import ServiceConfig
+    from src.services.tool_registry_cache import build_tool_config
 
     start_time = time.time()
 
@@ -656,19 +691,10 @@ async def test_tool(
     result = await session.execute(select(ServiceConfig).where(ServiceConfig.enabled == True))
     enabled_services = result.scalars().all()
 
-    # Build service configs dict
+    # Build service configs dict like the tool registry, so adapters share its pooled clients
     service_configs = {}
     for svc in enabled_services:
-        service_configs[svc.service_type.lower()] = {
-            "url": svc.base_url,
-            "base_url": svc.base_url,
-            "external_url": getattr(svc, "external_url", None),
-            "port": svc.port,
-            "api_key": svc.api_key,
-            "username": getattr(svc, "username", None),
-            "password": getattr(svc, "password", None),
-            "config": getattr(svc, "config", None) or {},
-        }
+        service_configs[svc.service_type.lower()] = build_tool_config(svc)
 
     # Tool class mapping
     tool_classes = {
@@ -4,6 +4,9 @@ This router exposes MCP tools as standard REST endpoints that Open WebUI
 can discover via /openapi.json and invoke as external tools.
 """
 
+import gzip
+import hashlib
+import json
 import logging
 import os
 from typing import Any, Dict, List, Optional
@@ -11,7 +14,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 import jwt
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -37,6 +40,9 @@ from src.mcp.tools.zammad_tools import ZammadTools
 from src.models import ServiceConfig
 from src.models.mcp_request import McpRequest, McpToolCategory
 from src.models.service_group import ServiceGroup, ServiceGroupMembership
+from src.services.mcp_audit_writer import mcp_audit_writer
+from src.services.tool_registry_cache import tool_registry_cache
+from src.services.user_resolution_cache import user_resolution_cache
 
 logger = logging.getLogger(__name__)
 
@@ -51,20 +57,25 @@ router = APIRouter(prefix="/tools", tags=["AI Tools"])
 # ============================================================================
 
 
-def decode_jwt_user_id(token: str) -> Optional[str]:
+def decode_jwt_payload(token: str) -> Optional[dict]:
     """
-    Decode a JWT token without verifying the signature to extract user ID.
+    Decode a JWT token without verifying the signature.
     This is safe in a trusted network environment where the token comes from Open WebUI.
     """
     try:
-        payload = jwt.decode(token, options={"verify_signature": False})
-        return payload.get("id")
+        return jwt.decode(token, options={"verify_signature": False})
     except jwt.exceptions.DecodeError:
         return None
     except Exception:
         return None
 
 
+def decode_jwt_user_id(token: str) -> Optional[str]:
+    """Decode a JWT token without verifying the signature to extract user ID."""
+    payload = decode_jwt_payload(token)
+    return payload.get("id") if payload else None
+
+
 async def resolve_openwebui_user(request: Request) -> Optional[dict]:
     """
     Resolve Open WebUI user from the session JWT token.
@@ -72,6 +83,9 @@ async def resolve_openwebui_user(request: Request) -> Optional[dict]:
     When Open WebUI is configured with Auth: Session, it forwards the user's
     JWT token in both the Authorization header and Cookie.
 
+    Resolutions are cached per token (see ``user_resolution_cache``) so the
+    Open WebUI API is only called once per session token and TTL.
+
     Returns dict with id, email, name, role or None if resolution fails.
     """
     token = None
@@ -89,10 +103,18 @@ async def resolve_openwebui_user(request: Request) -> Optional[dict]:
         return None
 
     # Decode JWT to get user ID
-    user_id = decode_jwt_user_id(token)
+    payload = decode_jwt_payload(token)
+    user_id = payload.get("id") if payload else None
     if not user_id:
         return None
 
+    cache_key = user_resolution_cache.token_key(token)
+    cached_user = user_resolution_cache.get_user(cache_key)
+    if cached_user:
+        return cached_user
+
+    expires_at = payload.get("exp")
+
     # Call Open WebUI API to get full user info (email, name, role)
     try:
         async with httpx.AsyncClient(timeout=5.0) as client:
@@ -109,14 +131,19 @@ async def resolve_openwebui_user(request: Request) -> Optional[dict]:
                     "role": data.get("role"),
                 }
                 logger.info(f"[OpenWebUI] Resolved user: {user_info.get('email')} (id: {user_info.get('id')})")
+                user_resolution_cache.set_user(cache_key, user_info, expires_at=expires_at)
                 return user_info
             else:
                 # API call failed, return just the ID from JWT
                 logger.warning(f"[OpenWebUI] API call failed ({response.status_code}), using JWT id only")
-                return {"id": user_id, "email": None, "name": None, "role": None}
+                user_info = {"id": user_id, "email": None, "name": None, "role": None}
+                user_resolution_cache.set_user(cache_key, user_info, expires_at=expires_at, fallback=True)
+                return user_info
     except Exception as e:
         logger.warning(f"[OpenWebUI] Error calling API: {e}, using JWT id only")
-        return {"id": user_id, "email": None, "name": None, "role": None}
+        user_info = {"id": user_id, "email": None, "name": None, "role": None}
+        user_resolution_cache.set_user(cache_key, user_info, expires_at=expires_at, fallback=True)
+        return user_info
 
 
 # ============================================================================
@@ -243,105 +270,160 @@ def filter_spec_by_services(spec: dict, services: list[str], title: str, descrip
     }
 
 
+# Spec groups served under /tools/{group}/openapi.json: services, title, description
+SPEC_GROUPS: Dict[str, tuple] = {
+    "media": (
+        ["plex", "tautulli", "overseerr", "komga", "romm", "audiobookshelf"],
+        "MCParr Media Tools",
+        "AI tools for media playback and libraries (Plex, Tautulli, Overseerr, Komga, RomM, Audiobookshelf)",
+    ),
+    "processing": (
+        ["radarr", "sonarr", "prowlarr", "jackett", "deluge"],
+        "MCParr Processing Tools",
+        "AI tools for media acquisition and processing (Radarr, Sonarr, Prowlarr, Jackett, Deluge)",
+    ),
+    "system": (
+        ["system", "zammad", "authentik"],
+        "MCParr System Tools",
+        "AI tools for system management (health, support, authentication)",
+    ),
+    "knowledge": (
+        ["wikijs", "openwebui", "ollama"],
+        "MCParr Knowledge Tools",
+        "AI tools for knowledge management (Wiki.js, Open WebUI, Ollama)",
+    ),
+}
+
+# Map service names to their display names
+SERVICE_DISPLAY_NAMES = {
+    "plex": "Plex",
+    "tautulli": "Tautulli",
+    "overseerr": "Overseerr",
+    "radarr": "Radarr",
+    "sonarr": "Sonarr",
+    "prowlarr": "Prowlarr",
+    "jackett": "Jackett",
+    "deluge": "Deluge",
+    "komga": "Komga",
+    "romm": "RomM",
+    "audiobookshelf": "Audiobookshelf",
+    "openwebui": "Open WebUI",
+    "wikijs": "Wiki.js",
+    "zammad": "Zammad",
+    "system": "System",
+    "authentik": "Authentik",
+}
+
+
+class PrecomputedSpec:
+    """An OpenAPI spec serialized once, with its gzip encoding and ETag."""
+
+    __slots__ = ("body", "gzip_body", "etag")
+
+    def __init__(self, spec: dict):
+        # Same serialization as JSONResponse
+        self.body = json.dumps(spec, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+        self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
+
+
+class OpenAPISpecCache:
+    """Specs built once per tool registry generation and kept as bytes."""
+
+    def __init__(self):
+        self._generation: Optional[int] = None
+        self._full_spec: Optional[dict] = None
+        self._specs: Dict[str, PrecomputedSpec] = {}
+
+    def get(self, name: str) -> PrecomputedSpec:
+        """Get a precomputed spec ("all", a group name or a service name)."""
+        generation = tool_registry_cache.generation
+        if generation != self._generation:
+            self._generation = generation
+            self._full_spec = None
+            self._specs = {}
+
+        spec = self._specs.get(name)
+        if spec is None:
+            spec = PrecomputedSpec(self._build(name))
+            self._specs[name] = spec
+        return spec
+
+    def _build(self, name: str) -> dict:
+        if self._full_spec is None:
+            self._full_spec = generate_openwebui_openapi_spec()
+        if name == "all":
+            return self._full_spec
+        if name in SPEC_GROUPS:
+            services, title, description = SPEC_GROUPS[name]
+            return filter_spec_by_services(self._full_spec, services, title, description)
+        display_name = SERVICE_DISPLAY_NAMES[name]
+        return filter_spec_by_services(
+            self._full_spec, [name], f"MCParr {display_name} Tools", f"AI tools for {display_name}"
+        )
+
+
+openapi_spec_cache = OpenAPISpecCache()
+
+
+def spec_response(request: Request, name: str) -> Response:
+    """Serve a precomputed spec with ETag revalidation and gzip when accepted."""
+    spec = openapi_spec_cache.get(name)
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    # Each encoding is a distinct representation and gets its own strong ETag
+    etag = f'"{spec.etag}-gzip"' if use_gzip else f'"{spec.etag}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or f'"{spec.etag}"' in candidates or f'"{spec.etag}-gzip"' in candidates:
+            return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=spec.gzip_body, media_type="application/json", headers=headers)
+    return Response(content=spec.body, media_type="application/json", headers=headers)
+
+
 @router.get("/openapi.json", include_in_schema=False, response_class=JSONResponse)
-async def get_openwebui_openapi():
+async def get_openwebui_openapi(request: Request):
     """Get OpenAPI spec optimized for Open WebUI compatibility."""
-    return JSONResponse(content=generate_openwebui_openapi_spec())
+    return spec_response(request, "all")
 
 
 @router.get("/media/openapi.json", include_in_schema=False, response_class=JSONResponse)
-async def get_media_openapi():
+async def get_media_openapi(request: Request):
     """Get OpenAPI spec for media tools (Plex, Tautulli, Overseerr, Komga, RomM, Audiobookshelf)."""
-    full_spec = generate_openwebui_openapi_spec()
-    return JSONResponse(
-        content=filter_spec_by_services(
-            full_spec,
-            ["plex", "tautulli", "overseerr", "komga", "romm", "audiobookshelf"],
-            "MCParr Media Tools",
-            "AI tools for media playback and libraries (Plex, Tautulli, Overseerr, Komga, RomM, Audiobookshelf)",
-        )
-    )
+    return spec_response(request, "media")
 
 
 @router.get("/processing/openapi.json", include_in_schema=False, response_class=JSONResponse)
-async def get_processing_openapi():
+async def get_processing_openapi(request: Request):
     """Get OpenAPI spec for media processing tools (Radarr, Sonarr, Prowlarr, Jackett, Deluge)."""
-    full_spec = generate_openwebui_openapi_spec()
-    return JSONResponse(
-        content=filter_spec_by_services(
-            full_spec,
-            ["radarr", "sonarr", "prowlarr", "jackett", "deluge"],
-            "MCParr Processing Tools",
-            "AI tools for media acquisition and processing (Radarr, Sonarr, Prowlarr, Jackett, Deluge)",
-        )
-    )
+    return spec_response(request, "processing")
 
 
 @router.get("/system/openapi.json", include_in_schema=False, response_class=JSONResponse)
-async def get_system_openapi():
+async def get_system_openapi(request: Request):
     """Get OpenAPI spec for system tools (System, Zammad, Authentik)."""
-    full_spec = generate_openwebui_openapi_spec()
-    return JSONResponse(
-        content=filter_spec_by_services(
-            full_spec,
-            ["system", "zammad", "authentik"],
-            "MCParr System Tools",
-            "AI tools for system management (health, support, authentication)",
-        )
-    )
+    return spec_response(request, "system")
 
 
 @router.get("/knowledge/openapi.json", include_in_schema=False, response_class=JSONResponse)
-async def get_knowledge_openapi():
+async def get_knowledge_openapi(request: Request):
     """Get OpenAPI spec for knowledge tools (Wiki.js, Open WebUI, Ollama)."""
-    full_spec = generate_openwebui_openapi_spec()
-    return JSONResponse(
-        content=filter_spec_by_services(
-            full_spec,
-            ["wikijs", "openwebui", "ollama"],
-            "MCParr Knowledge Tools",
-            "AI tools for knowledge management (Wiki.js, Open WebUI, Ollama)",
-        )
-    )
+    return spec_response(request, "knowledge")
 
 
 # Dynamic endpoint for individual services (e.g., /tools/plex/openapi.json)
 @router.get("/{service_name}/openapi.json", include_in_schema=False, response_class=JSONResponse)
-async def get_service_openapi(service_name: str):
+async def get_service_openapi(service_name: str, request: Request):
     """Get OpenAPI spec for a specific service."""
-    # Map service names to their display names
-    service_display_names = {
-        "plex": "Plex",
-        "tautulli": "Tautulli",
-        "overseerr": "Overseerr",
-        "radarr": "Radarr",
-        "sonarr": "Sonarr",
-        "prowlarr": "Prowlarr",
-        "jackett": "Jackett",
-        "deluge": "Deluge",
-        "komga": "Komga",
-        "romm": "RomM",
-        "audiobookshelf": "Audiobookshelf",
-        "openwebui": "Open WebUI",
-        "wikijs": "Wiki.js",
-        "zammad": "Zammad",
-        "system": "System",
-        "authentik": "Authentik",
-    }
-
-    if service_name not in service_display_names:
+    if service_name not in SERVICE_DISPLAY_NAMES:
         return JSONResponse(status_code=404, content={"error": f"Unknown service: {service_name}"})
 
-    display_name = service_display_names[service_name]
-    full_spec = generate_openwebui_openapi_spec()
-    return JSONResponse(
-        content=filter_spec_by_services(
-            full_spec,
-            [service_name],
-            f"MCParr {display_name} Tools",
-            f"AI tools for {display_name}",
-        )
-    )
+    return spec_response(request, service_name)
 
 
 # ============================================================================
@@ -515,63 +597,36 @@ MUTATION_TOOLS = {
 
 
 async def get_tool_registry(session: AsyncSession) -> ToolRegistry:
-    """Get tool registry with enabled services."""
-    result = await session.execute(select(ServiceConfig).where(ServiceConfig.enabled == True))
-    enabled_services = result.scalars().all()
-
-    configs_by_type = {}
-    for svc in enabled_services:
-        svc_type = svc.service_type.lower()
-        # Construct full URL with port if specified
-        base_url = svc.base_url
-        if svc.port:
-            # Remove trailing slash if present
-            base_url = base_url.rstrip("/")
-            base_url = f"{base_url}:{svc.port}"
-        configs_by_type[svc_type] = {
-            "base_url": base_url,
-            "external_url": svc.external_url,  # Public URL for user-facing links
-            "api_key": svc.api_key,
-            "username": svc.username,
-            "password": svc.password,
-            "config": svc.config or {},
-        }
+    """Get tool registry with enabled services.
+
+    The registry is cached process-wide and only rebuilt after a service
+    change invalidates it (see ``tool_registry_cache``).
+    """
+    return await tool_registry_cache.get(session)
 
-    registry = ToolRegistry()
-    registry.register(SystemTools)
-
-    if "plex" in configs_by_type:
-        registry.register(PlexTools, configs_by_type["plex"])
-    if "overseerr" in configs_by_type:
-        registry.register(OverseerrTools, configs_by_type["overseerr"])
-    if "zammad" in configs_by_type:
-        registry.register(ZammadTools, configs_by_type["zammad"])
-    if "tautulli" in configs_by_type:
-        registry.register(TautulliTools, configs_by_type["tautulli"])
-    if "openwebui" in configs_by_type:
-        registry.register(OpenWebUITools, configs_by_type["openwebui"])
-    if "romm" in configs_by_type:
-        registry.register(RommTools, configs_by_type["romm"])
-    if "komga" in configs_by_type:
-        registry.register(KomgaTools, configs_by_type["komga"])
-    if "radarr" in configs_by_type:
-        registry.register(RadarrTools, configs_by_type["radarr"])
-    if "sonarr" in configs_by_type:
-        registry.register(SonarrTools, configs_by_type["sonarr"])
-    if "prowlarr" in configs_by_type:
-        registry.register(ProwlarrTools, configs_by_type["prowlarr"])
-    if "jackett" in configs_by_type:
-        registry.register(JackettTools, configs_by_type["jackett"])
-    if "deluge" in configs_by_type:
-        registry.register(DelugeTools, configs_by_type["deluge"])
-    if "authentik" in configs_by_type:
-        registry.register(AuthentikTools, configs_by_type["authentik"])
-    if "audiobookshelf" in configs_by_type:
-        registry.register(AudiobookshelfTools, configs_by_type["audiobookshelf"])
-    if "wikijs" in configs_by_type:
-        registry.register(WikiJSTools, configs_by_type["wikijs"])
-
-    return registry
+
+async def filter_tool_listing_for_user(
+    session: AsyncSession, registry: ToolRegistry, central_user_id: str, result: dict
+) -> dict:
+    """Remove tools the user has no permission for from a system_list_tools result."""
+    from src.services.permission_service import PermissionService
+
+    allowed = await PermissionService(session).get_allowed_tools(
+        central_user_id, [(d.name, d.requires_service) for d in registry.list_tools()]
+    )
+
+    categories = {}
+    for category, services in result.get("result", {}).get("categories", {}).items():
+        filtered_services = {}
+        for service_name, tools_list in services.items():
+            # Entries are formatted as "tool_name - description"
+            kept = [entry for entry in tools_list if entry.split(" - ", 1)[0] in allowed]
+            if kept:
+                filtered_services[service_name] = kept
+        if filtered_services:
+            categories[category] = filtered_services
+
+    return {**result, "result": {**result["result"], "categories": categories}}
 
 
 async def execute_tool_with_logging(
@@ -581,7 +636,6 @@ async def execute_tool_with_logging(
     request: Optional[Request] = None,
 ) -> dict:
     """Execute a tool and log the request to the database."""
-    from src.models.user_mapping import UserMapping
     from src.services.permission_service import check_tool_permission
 
     # Create MCP request record
@@ -607,28 +661,8 @@ async def execute_tool_with_logging(
             mcp_request.input_params["_openwebui_user"] = openwebui_user
             logger.info(f"[MCP] Tool '{tool_name}' called by user: {mcp_request.user_id}")
 
-            # Try to find central_user_id from user mappings
-            # First try by email
-            if openwebui_user.get("email"):
-                user_mapping_result = await session.execute(
-                    select(UserMapping.central_user_id)
-                    .where(UserMapping.central_email == openwebui_user.get("email"))
-                    .limit(1)
-                )
-                row = user_mapping_result.first()
-                if row:
-                    central_user_id = row[0]
-
-            # If no mapping found by email, try by Open WebUI user ID
-            if not central_user_id and openwebui_user.get("id"):
-                user_mapping_result = await session.execute(
-                    select(UserMapping.central_user_id)
-                    .where(UserMapping.service_user_id == openwebui_user.get("id"))
-                    .limit(1)
-                )
-                row = user_mapping_result.first()
-                if row:
-                    central_user_id = row[0]
+            # Try to find central_user_id from user mappings (by email, then by Open WebUI user ID)
+            central_user_id = await user_resolution_cache.get_central_user_id(session, openwebui_user)
 
             # Check group permissions if we have a central_user_id
             if central_user_id:
@@ -656,8 +690,7 @@ async def execute_tool_with_logging(
                     )
                     # Log the denied request with dedicated status
                     mcp_request.mark_denied(f"Access denied: {permission_result.denial_reason}")
-                    session.add(mcp_request)
-                    await session.commit()
+                    await mcp_audit_writer.add(mcp_request)
                     return {
                         "success": False,
                         "error": (
@@ -677,28 +710,19 @@ async def execute_tool_with_logging(
         mcp_request.correlation_id = request.headers.get("X-Correlation-Id")
         mcp_request.ai_model = request.headers.get("X-AI-Model")
 
-    session.add(mcp_request)
-
-    try:
-        await session.flush()  # Get the ID
-        # Mark as started
-        mcp_request.mark_started()
-        # Commit to persist the record before executing the tool
-        # This prevents StaleDataError when autoflush triggers during registry fetch
-        await session.commit()
-        # Re-add to session for later updates
-        session.add(mcp_request)
-    except Exception as e:
-        # If flush fails, rollback and continue without logging
-        await session.rollback()
-        logger.warning(f"[MCP] Failed to create request log for {tool_name}: {e}")
-        mcp_request = None  # Don't try to update it later
+    # Mark as started; the audit writer persists the record in the background
+    mcp_request.mark_started()
+    await mcp_audit_writer.add(mcp_request)
 
     try:
         # Get registry and execute
         registry = await get_tool_registry(session)
         result = await registry.execute(tool_name, arguments)
 
+        # Only list the tools this user is allowed to call
+        if tool_name == "system_list_tools" and central_user_id and result.get("success"):
+            result = await filter_tool_listing_for_user(session, registry, central_user_id, result)
+
         # Enrich result with tool chain suggestions BEFORE storing
         # Pass session_id and user_id for multi-user chain flow tracking
         from src.services.tool_chain_service import enrich_tool_result_with_chains
@@ -708,34 +732,22 @@ async def execute_tool_with_logging(
             tool_name,
             result,
             arguments,
-            session_id=mcp_request.session_id if mcp_request else None,
-            user_id=mcp_request.user_id if mcp_request else None,
+            session_id=mcp_request.session_id,
+            user_id=mcp_request.user_id,
         )
 
         # Mark as completed (now includes next_tools_to_call if any)
-        if mcp_request:
-            if result.get("success"):
-                mcp_request.mark_completed(result)
-            else:
-                mcp_request.mark_failed(result.get("error", "Unknown error"), result.get("error_type", "ToolError"))
-            try:
-                await session.commit()
-            except Exception as commit_err:
-                logger.warning(f"[MCP] Failed to commit request log: {commit_err}")
-                await session.rollback()
+        if result.get("success"):
+            mcp_request.mark_completed(result)
+        else:
+            mcp_request.mark_failed(result.get("error", "Unknown error"), result.get("error_type", "ToolError"))
+        await mcp_audit_writer.update(mcp_request)
 
         return result
 
     except Exception as e:
-        if mcp_request:
-            try:
-                await session.rollback()
-                mcp_request.mark_failed(str(e), type(e).__name__)
-                session.add(mcp_request)
-                await session.commit()
-            except Exception as log_err:
-                logger.warning(f"[MCP] Failed to log error for {tool_name}: {log_err}")
-                await session.rollback()
+        mcp_request.mark_failed(str(e), type(e).__name__)
+        await mcp_audit_writer.update(mcp_request)
         raise
 
 
@@ -1139,9 +1151,7 @@ async def tautulli_get_my_stats(
         user_id=openwebui_user.get("email") or openwebui_user.get("id"),
     )
     mcp_request.input_params["_openwebui_user"] = openwebui_user
-    session.add(mcp_request)
-    await session.commit()
-    await session.refresh(mcp_request)
+    await mcp_audit_writer.add(mcp_request)
 
     start_time = datetime.utcnow()
 
@@ -1154,7 +1164,7 @@ async def tautulli_get_my_stats(
 
         if not tautulli_config:
             mcp_request.mark_failed("Tautulli service not configured", "ConfigError")
-            await session.commit()
+            await mcp_audit_writer.update(mcp_request)
             return ToolResponse(success=False, error="Le service Tautulli n'est pas configuré.")
 
         # Create adapter and get history for the user
@@ -1162,6 +1172,7 @@ async def tautulli_get_my_stats(
 
         class ServiceConfigProxy:
             def __init__(self, config):
+                self.id = config.id
                 self.api_key = config.api_key
                 self.base_url = f"{config.base_url}:{config.port}" if config.port else config.base_url
                 self.port = None
@@ -1213,7 +1224,7 @@ async def tautulli_get_my_stats(
 
         mcp_request.mark_completed(result)
         mcp_request.duration_ms = duration_ms
-        await session.commit()
+        await mcp_audit_writer.update(mcp_request)
 
         return ToolResponse(success=True, result=result)
 
@@ -1223,7 +1234,7 @@ async def tautulli_get_my_stats(
 
         mcp_request.mark_failed(str(e), type(e).__name__)
         mcp_request.duration_ms = duration_ms
-        await session.commit()
+        await mcp_audit_writer.update(mcp_request)
 
         logger.error(f"[tautulli_get_my_stats] Error: {e}")
         return ToolResponse(success=False, error=str(e))
@@ -7,6 +7,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..adapters.conditional_cache import conditional_response_cache
+from ..adapters.pool import adapter_pool
 from ..database.connection import get_db_session
 from ..models.service_config import ServiceConfig, ServiceHealthHistory, ServiceType
 from ..schemas.services import (
@@ -15,6 +17,7 @@ from ..schemas.services import (
     ServiceConfigUpdate,
     ServiceTestResult,
 )
+from ..services.tool_registry_cache import tool_registry_cache
 
 router = APIRouter(prefix="/api/services", tags=["services"])
 
@@ -66,6 +69,7 @@ async def create_service(service_data: ServiceConfigCreate, db: AsyncSession = D
     db.add(service)
     await db.commit()
     await db.refresh(service)
+    tool_registry_cache.invalidate(f"service '{service.name}' created")
 
     return ServiceConfigResponse.model_validate(service)
 
@@ -88,6 +92,9 @@ async def update_service(
 
     await db.commit()
     await db.refresh(service)
+    tool_registry_cache.invalidate(f"service '{service.name}' updated")
+    adapter_pool.release_service(service_id)
+    conditional_response_cache.invalidate(service_id)
 
     return ServiceConfigResponse.model_validate(service)
 
@@ -103,6 +110,9 @@ async def delete_service(service_id: str, db: AsyncSession = Depends(get_db_sess
 
     await db.delete(service)
     await db.commit()
+    tool_registry_cache.invalidate(f"service '{service.name}' deleted")
+    adapter_pool.release_service(service_id)
+    conditional_response_cache.invalidate(service_id)
 
 
 @router.post("/{service_id}/test", response_model=ServiceTestResult)
@@ -172,6 +182,7 @@ async def enable_service(service_id: str, db: AsyncSession = Depends(get_db_sess
 
     service.enabled = True
     await db.commit()
+    tool_registry_cache.invalidate(f"service '{service.name}' enabled")
 
     return {"message": "Service enabled successfully"}
 
@@ -187,6 +198,9 @@ async def disable_service(service_id: str, db: AsyncSession = Depends(get_db_ses
 
     service.enabled = False
     await db.commit()
+    tool_registry_cache.invalidate(f"service '{service.name}' disabled")
+    adapter_pool.release_service(service_id)
+    conditional_response_cache.invalidate(service_id)
 
     return {"message": "Service disabled successfully"}
 
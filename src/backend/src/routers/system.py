@@ -155,8 +155,11 @@ async def get_current_system_metrics():
 
     import psutil
 
+    from src.services.metrics_sampler import system_metrics_sampler
+
     try:
-        cpu_usage = psutil.cpu_percent(interval=0.1)
+        snapshot = await system_metrics_sampler.get_latest()
+        cpu_usage = snapshot["cpu_percent"]
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
         network = psutil.net_io_counters()
@@ -167,7 +170,7 @@ async def get_current_system_metrics():
 
         return {
             "cpu_usage": cpu_usage,
-            "cpu_load_avg": psutil.getloadavg()[0] if hasattr(psutil, "getloadavg") else 0,
+            "cpu_load_avg": snapshot["load_average"][0],
             "memory_usage": memory.percent,
             "memory_used": memory.used,
             "memory_total": memory.total,
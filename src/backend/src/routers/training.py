@@ -2100,6 +2100,8 @@ async def get_ollama_metrics(service_id: Optional[str] = None, session: AsyncSes
     """Get comprehensive Ollama and system metrics for training stats."""
     import psutil
 
+    from src.services.metrics_sampler import system_metrics_sampler
+
     response = OllamaMetricsResponse(ollama_status="not_configured", ollama_url="")
 
     # Get Ollama service and status
@@ -2138,7 +2140,7 @@ async def get_ollama_metrics(service_id: Optional[str] = None, session: AsyncSes
     # Get system metrics (local system - could be adapted for remote Ollama host)
     try:
         # CPU
-        response.system_cpu_percent = psutil.cpu_percent(interval=0.1)
+        response.system_cpu_percent = (await system_metrics_sampler.get_latest())["cpu_percent"]
 
         # Memory
         memory = psutil.virtual_memory()
@@ -212,13 +212,8 @@ async def enumerate_all_users(db: AsyncSession = Depends(get_db)):
                 # Try to get users if adapter supports it
                 try:
                     if hasattr(adapter, "get_users"):
-                        users_data = await adapter.get_users()
-                        if isinstance(users_data, dict) and "users" in users_data:
-                            users = users_data["users"]
-                        elif isinstance(users_data, list):
-                            users = users_data
-                        else:
-                            users = []
+                        # Paginated services are enumerated completely, not just their first page
+                        users = [user async for user in adapter.iter_users()]
 
                         all_users[service.id] = {
                             "service_name": service.name,
@@ -0,0 +1,184 @@
+"""Session-scoped state for tool chain flows.
+
+When a tool result is enriched with chain suggestions, the suggested tools and
+the chain context are recorded here for the calling session (or user). The
+next tool call consumes the matching suggestion, so chain position detection
+no longer has to scan recent McpRequest history.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from src.utils.cache import TTLCache
+
+# Pending results kept per session; older suggestions are dropped first
+MAX_PENDING_PER_SESSION = 10
+
+# Key used when a call carries neither a session id nor a user id
+ANONYMOUS_FLOW_KEY = "anonymous"
+
+
+@dataclass
+class PendingChainFlow:
+    """Suggestions attached to a previous tool result and not yet followed."""
+
+    tool_name: str
+    next_tools: List[Dict[str, Any]]
+    chain_context: Dict[str, Any]
+    result: Dict[str, Any]
+    recorded_at: float = field(default_factory=time.monotonic)
+
+
+class ChainFlowStore:
+    """In-memory LRU of pending chain suggestions per session/user, with expiry."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self._flows: TTLCache[Deque[PendingChainFlow]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Fall back to the McpRequest history for sessions unknown to the store
+        self.history_fallback = False
+        self._recorded = 0
+        self._consumed = 0
+
+    @property
+    def ttl(self) -> float:
+        """How long suggestions stay pending, in seconds."""
+        return self._flows.ttl
+
+    def configure(
+        self,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None,
+        history_fallback: Optional[bool] = None,
+    ) -> None:
+        """Update store size, expiry and history fallback."""
+        if maxsize is not None:
+            self._flows.maxsize = maxsize
+        if ttl is not None:
+            self._flows.ttl = ttl
+        if history_fallback is not None:
+            self.history_fallback = history_fallback
+
+    @staticmethod
+    def flow_key(session_id: Optional[str] = None, user_id: Optional[str] = None) -> str:
+        """Build the store key for a caller, preferring the session id."""
+        if session_id:
+            return f"session:{session_id}"
+        if user_id:
+            return f"user:{user_id}"
+        return ANONYMOUS_FLOW_KEY
+
+    def knows(self, session_id: Optional[str] = None, user_id: Optional[str] = None) -> bool:
+        """Whether the store holds state for a caller."""
+        return self.flow_key(session_id, user_id) in self._flows
+
+    def record(
+        self,
+        tool_name: str,
+        result: Dict[str, Any],
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> bool:
+        """Record the chain suggestions of an enriched tool result.
+
+        Args:
+            tool_name: Tool that produced the result
+            result: Enriched result containing ``next_tools_to_call``
+            session_id: Session of the caller
+            user_id: User of the caller (used when there is no session)
+
+        Returns:
+            True if suggestions were recorded
+        """
+        next_tools = result.get("next_tools_to_call")
+        if not next_tools:
+            return False
+
+        key = self.flow_key(session_id, user_id)
+        pending = self._flows.get(key)
+        if pending is None:
+            pending = deque(maxlen=MAX_PENDING_PER_SESSION)
+        pending.append(
+            PendingChainFlow(
+                tool_name=tool_name,
+                next_tools=list(next_tools),
+                chain_context=dict(result.get("chain_context") or {}),
+                result=result,
+            )
+        )
+        # Re-setting refreshes the session expiry
+        self._flows.set(key, pending)
+        self._recorded += 1
+        return True
+
+    def consume(
+        self,
+        tool_name: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        time_window_seconds: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Consume the most recent pending suggestion of a tool for a caller.
+
+        Args:
+            tool_name: Tool being called now
+            session_id: Session of the caller
+            user_id: User of the caller (used when there is no session)
+            time_window_seconds: Ignore suggestions older than this (defaults to the store TTL)
+
+        Returns:
+            Chain flow info in the format of ``check_recent_chain_flow``, or None
+        """
+        pending = self._flows.get(self.flow_key(session_id, user_id))
+        if not pending:
+            return None
+
+        window = self.ttl if time_window_seconds is None else time_window_seconds
+        threshold = time.monotonic() - window
+
+        for entry in reversed(pending):
+            # A tool does not follow its own suggestions
+            if entry.recorded_at < threshold or entry.tool_name == tool_name:
+                continue
+
+            for index, next_tool in enumerate(entry.next_tools):
+                if next_tool.get("tool") != tool_name:
+                    continue
+
+                # Other suggested tools of the same result stay pending
+                del entry.next_tools[index]
+                if not entry.next_tools:
+                    pending.remove(entry)
+                self._consumed += 1
+                logger.debug(f"Consumed chain suggestion '{entry.tool_name}' -> '{tool_name}'")
+                return {
+                    "is_chain_flow": True,
+                    "previous_tool": entry.tool_name,
+                    "chain_context": entry.chain_context,
+                    # Include save_to_context from the action that suggested this tool
+                    "save_to_context": next_tool.get("save_to_context"),
+                    # Include the previous tool's result to extract values from
+                    "previous_result": entry.result,
+                }
+
+        return None
+
+    def clear(self) -> None:
+        """Drop all pending suggestions."""
+        self._flows.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {
+            **self._flows.get_stats(),
+            "recorded": self._recorded,
+            "consumed": self._consumed,
+            "history_fallback": self.history_fallback,
+        }
+
+
+# Global instance
+chain_flow_store = ChainFlowStore()
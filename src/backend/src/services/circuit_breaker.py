@@ -2,15 +2,23 @@
 
 This module implements the circuit breaker pattern to improve system resilience
 by preventing cascading failures when external services become unavailable.
+
+Every service adapter request goes through the breaker of its service instance
+(``get_service_breaker``): once a service keeps failing, calls fail fast with a
+``CircuitBreakerError`` instead of waiting for the HTTP timeout, a limited
+number of probe calls are let through after the recovery timeout, and health
+check results move breakers between states (``record_health``).
 """
 
 import asyncio
 import logging
-from dataclasses import dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +38,59 @@ class CircuitBreakerConfig:
     failure_threshold: int = 5  # Number of failures before opening
     recovery_timeout: int = 60  # Seconds to wait before testing recovery
     success_threshold: int = 2  # Successes needed to close from half-open
-    timeout: float = 30.0  # Request timeout in seconds
+    timeout: Optional[float] = 30.0  # Request timeout in seconds (None leaves it to the caller)
     expected_exception: tuple = (Exception,)  # Exceptions that count as failures
+    half_open_max_calls: int = 1  # Concurrent probe calls allowed while half-open
+    # Decides whether an expected exception counts as a failure (others are not recorded)
+    failure_predicate: Optional[Callable[[BaseException], bool]] = None
 
 
 class CircuitBreakerError(Exception):
     """Exception raised when circuit breaker is open."""
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        name: Optional[str] = None,
+        state: Optional["CircuitState"] = None,
+        retry_after: Optional[float] = None,
+    ):
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            name: Name of the rejecting circuit breaker
+            state: State of the breaker when the call was rejected
+            retry_after: Seconds until the breaker lets a probe call through
+        """
+        super().__init__(message)
+        self.name = name
+        self.state = state
+        self.retry_after = retry_after
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured description of the rejection, for API and tool results."""
+        return {
+            "error": str(self),
+            "error_type": "circuit_open",
+            "circuit": self.name,
+            "circuit_state": self.state.value if self.state else None,
+            "retry_after": round(self.retry_after, 1) if self.retry_after is not None else None,
+        }
+
+
+# Set while a call must reach its service regardless of breaker state (connection tests)
+_bypass: ContextVar[bool] = ContextVar("circuit_breaker_bypass", default=False)
+
+
+@contextmanager
+def circuit_bypass() -> Iterator[None]:
+    """Let calls made in this context through open breakers without recording their outcome."""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
 
 
 class CircuitBreaker:
@@ -58,6 +111,8 @@ class CircuitBreaker:
         self.last_failure_time: Optional[datetime] = None
         self.last_success_time: Optional[datetime] = None
         self.call_count = 0
+        self.rejected_count = 0
+        self._half_open_calls = 0
         self._lock = asyncio.Lock()
 
     async def call(self, func: Callable[[], Awaitable[Any]], *args, **kwargs) -> Any:
@@ -72,22 +127,34 @@ class CircuitBreaker:
             Function result
 
         Raises:
-            CircuitBreakerError: When circuit is open
+            CircuitBreakerError: When circuit is open, or half-open with all probe calls in flight
             Original exception: When function fails
         """
+        if _bypass.get():
+            return await func(*args, **kwargs)
+
         async with self._lock:
             await self._update_state()
 
             if self.state == CircuitState.OPEN:
-                raise CircuitBreakerError(
-                    f"Circuit breaker '{self.name}' is OPEN. " f"Service calls are being rejected."
-                )
+                self.rejected_count += 1
+                raise self.rejection()
+
+            probe = self.state == CircuitState.HALF_OPEN
+            if probe:
+                if self._half_open_calls >= self.config.half_open_max_calls:
+                    self.rejected_count += 1
+                    raise self.rejection()
+                self._half_open_calls += 1
 
             self.call_count += 1
 
         # Execute the function with timeout
         try:
-            result = await asyncio.wait_for(func(*args, **kwargs), timeout=self.config.timeout)
+            if self.config.timeout is None:
+                result = await func(*args, **kwargs)
+            else:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=self.config.timeout)
 
             # Record success
             async with self._lock:
@@ -95,14 +162,6 @@ class CircuitBreaker:
 
             return result
 
-        except self.config.expected_exception as e:
-            # Record failure
-            async with self._lock:
-                await self._record_failure()
-
-            logger.warning(f"Circuit breaker '{self.name}' recorded failure: {str(e)}")
-            raise
-
         except asyncio.TimeoutError:
             # Timeout is also considered a failure
             async with self._lock:
@@ -111,6 +170,70 @@ class CircuitBreaker:
             logger.warning(f"Circuit breaker '{self.name}' timeout after {self.config.timeout}s")
             raise
 
+        except self.config.expected_exception as e:
+            predicate = self.config.failure_predicate
+            if predicate is None or predicate(e):
+                # Record failure
+                async with self._lock:
+                    await self._record_failure()
+
+                logger.warning(f"Circuit breaker '{self.name}' recorded failure: {str(e)}")
+            raise
+
+        finally:
+            if probe:
+                async with self._lock:
+                    self._half_open_calls -= 1
+
+    def retry_after(self) -> Optional[float]:
+        """Seconds until an open breaker lets a probe call through (None unless open)."""
+        if self.state != CircuitState.OPEN or self.last_failure_time is None:
+            return None
+        elapsed = (datetime.utcnow() - self.last_failure_time).total_seconds()
+        return max(0.0, self.config.recovery_timeout - elapsed)
+
+    def is_rejecting(self) -> bool:
+        """Whether a call made now would be rejected, without changing the breaker state."""
+        if _bypass.get():
+            return False
+        if self.state == CircuitState.OPEN:
+            return bool(self.retry_after())
+        if self.state == CircuitState.HALF_OPEN:
+            return self._half_open_calls >= self.config.half_open_max_calls
+        return False
+
+    def rejection(self) -> CircuitBreakerError:
+        """Error describing why a call is rejected in the current state."""
+        retry_after = self.retry_after()
+        if self.state == CircuitState.HALF_OPEN:
+            message = f"Circuit breaker '{self.name}' is HALF_OPEN and already probing the service."
+        else:
+            message = f"Circuit breaker '{self.name}' is OPEN. Service calls are being rejected."
+        return CircuitBreakerError(message, name=self.name, state=self.state, retry_after=retry_after)
+
+    async def record_health(self, success: bool) -> None:
+        """Feed the result of an out-of-band health check into the breaker.
+
+        A passing check moves an open breaker to half-open so the next calls
+        probe the service right away; a failing check counts as a failure, and
+        keeps an open breaker open for another recovery timeout.
+
+        Args:
+            success: Whether the health check passed
+        """
+        async with self._lock:
+            if success:
+                if self.state == CircuitState.OPEN:
+                    logger.info(f"Circuit breaker '{self.name}' transitioning to HALF_OPEN after health check")
+                    self.state = CircuitState.HALF_OPEN
+                    self.success_count = 0
+                else:
+                    await self._record_success()
+            elif self.state == CircuitState.OPEN:
+                self.last_failure_time = datetime.utcnow()
+            else:
+                await self._record_failure()
+
     async def _update_state(self) -> None:
         """Update circuit breaker state based on current conditions."""
         now = datetime.utcnow()
@@ -176,6 +299,9 @@ class CircuitBreaker:
             "failure_count": self.failure_count,
             "success_count": self.success_count,
             "call_count": self.call_count,
+            "rejected_count": self.rejected_count,
+            "half_open_calls": self._half_open_calls,
+            "retry_after": self.retry_after(),
             "last_failure_time": self.last_failure_time.isoformat() if self.last_failure_time else None,
             "last_success_time": self.last_success_time.isoformat() if self.last_success_time else None,
             "config": {
@@ -183,6 +309,7 @@ class CircuitBreaker:
                 "recovery_timeout": self.config.recovery_timeout,
                 "success_threshold": self.config.success_threshold,
                 "timeout": self.config.timeout,
+                "half_open_max_calls": self.config.half_open_max_calls,
             },
         }
 
@@ -194,6 +321,7 @@ class CircuitBreaker:
             self.failure_count = 0
             self.success_count = 0
             self.call_count = 0
+            self.rejected_count = 0
             self.last_failure_time = None
             self.last_success_time = None
 
@@ -212,6 +340,20 @@ class CircuitBreakerManager:
         """Initialize circuit breaker manager."""
         self._breakers: Dict[str, CircuitBreaker] = {}
         self._default_config = CircuitBreakerConfig()
+        self.enabled = True
+        self.half_open_max_calls = 1
+
+    def configure(self, enabled: Optional[bool] = None, half_open_max_calls: Optional[int] = None) -> None:
+        """Update settings applied to service breakers.
+
+        Args:
+            enabled: Whether service adapter calls go through breakers
+            half_open_max_calls: Concurrent probe calls allowed while a service breaker is half-open
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        if half_open_max_calls is not None:
+            self.half_open_max_calls = max(1, half_open_max_calls)
 
     def get_breaker(self, name: str, config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
         """Get or create a circuit breaker.
@@ -230,6 +372,10 @@ class CircuitBreakerManager:
 
         return self._breakers[name]
 
+    def find_breaker(self, name: str) -> Optional[CircuitBreaker]:
+        """Get an existing circuit breaker without creating it."""
+        return self._breakers.get(name)
+
     def remove_breaker(self, name: str) -> bool:
         """Remove a circuit breaker.
 
@@ -329,6 +475,42 @@ def get_service_breaker_config(service_type: str) -> CircuitBreakerConfig:
     return service_configs.get(service_type.lower(), CircuitBreakerConfig())
 
 
+def service_breaker_name(service_type: str, base_url: str) -> str:
+    """Name of the breaker of one service instance, shared by adapters, tools and health checks."""
+    return f"{service_type.lower()}:{base_url.rstrip('/')}"
+
+
+def get_service_breaker(
+    service_type: str, base_url: str, failure_predicate: Optional[Callable[[BaseException], bool]] = None
+) -> Optional[CircuitBreaker]:
+    """Get the breaker guarding the calls to one service instance.
+
+    Service adapters enforce their own HTTP timeouts, so the breaker does not
+    add one.
+
+    Args:
+        service_type: Type of the service
+        base_url: Base URL of the service instance
+        failure_predicate: Decides which exceptions count as failures
+
+    Returns:
+        CircuitBreaker instance, or None when service breakers are disabled
+    """
+    if not circuit_manager.enabled:
+        return None
+    name = service_breaker_name(service_type, base_url)
+    breaker = circuit_manager.find_breaker(name)
+    if breaker is None:
+        config = replace(
+            get_service_breaker_config(service_type),
+            timeout=None,
+            half_open_max_calls=circuit_manager.half_open_max_calls,
+            failure_predicate=failure_predicate,
+        )
+        breaker = circuit_manager.get_breaker(name, config)
+    return breaker
+
+
 async def get_circuit_breaker_manager() -> CircuitBreakerManager:
     """Get the global circuit breaker manager."""
     return circuit_manager
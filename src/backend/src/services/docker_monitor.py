@@ -0,0 +1,367 @@
+"""Cached Docker status collection.
+
+``SystemMonitorService.get_docker_status`` used the synchronous ``docker`` SDK
+from async code, and the dashboard and every metrics WebSocket listed all
+containers, images and volumes on their own, which made the dashboard sluggish
+on hosts with many containers. Docker is now queried only in worker threads: a
+background task refreshes the inventory and per-container CPU / memory stats on
+a schedule, container events are applied to the cached inventory as they
+arrive, and readers get the cached status without waiting.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import docker
+
+    DOCKER_AVAILABLE = True
+except ImportError:
+    DOCKER_AVAILABLE = False
+    logger.warning("Docker library not available, Docker monitoring disabled")
+
+BYTES_PER_MB = 1024 * 1024
+
+# Container status after each event action (other actions leave the status unchanged)
+EVENT_STATUS = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+}
+
+
+def _container_entry(container: Dict[str, Any]) -> Dict[str, Any]:
+    """Inventory entry of a container from the Docker list API."""
+    names = container.get("Names") or []
+    return {
+        "id": container["Id"][:12],
+        "name": names[0].lstrip("/") if names else container["Id"][:12],
+        "image": container.get("Image"),
+        "status": container.get("State"),
+    }
+
+
+def _memory_usage(memory_stats: Dict[str, Any]) -> Optional[int]:
+    """Memory used by a container, without the page cache (as ``docker stats`` reports it)."""
+    usage = memory_stats.get("usage")
+    if usage is None:
+        return None
+    details = memory_stats.get("stats") or {}
+    # cgroup v2 reports inactive_file, cgroup v1 reports cache
+    cache = details.get("inactive_file", details.get("cache", 0))
+    return max(0, usage - cache)
+
+
+class DockerStatusCollector:
+    """Collects Docker inventory and container stats off the event loop and caches them."""
+
+    def __init__(self, inventory_interval: float = 60.0, stats_interval: float = 15.0, stats_concurrency: int = 8):
+        """Initialize the collector.
+
+        Args:
+            inventory_interval: Seconds between two full inventory refreshes (events update it in between)
+            stats_interval: Seconds between two refreshes of container CPU and memory
+            stats_concurrency: Containers whose stats are read at once
+        """
+        self.inventory_interval = inventory_interval
+        self.stats_interval = stats_interval
+        self.stats_concurrency = stats_concurrency
+        self._client = None
+        self._containers: Dict[str, Dict[str, Any]] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        # Previous (container CPU, system CPU) readings, for CPU percentages between two refreshes
+        self._cpu_readings: Dict[str, Tuple[int, int]] = {}
+        self._images_count = 0
+        self._volumes_count = 0
+        self._updated_at: Optional[datetime] = None
+        self._refreshed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._events_thread: Optional[threading.Thread] = None
+        self._event_stream = None
+        self._stopping = False
+        self._counters = {"inventory_refreshes": 0, "stats_refreshes": 0, "events_applied": 0, "errors": 0}
+
+    def configure(
+        self,
+        inventory_interval: Optional[float] = None,
+        stats_interval: Optional[float] = None,
+        stats_concurrency: Optional[int] = None,
+    ) -> None:
+        """Update refresh intervals and stats parallelism."""
+        if inventory_interval is not None:
+            self.inventory_interval = max(5.0, inventory_interval)
+        if stats_interval is not None:
+            self.stats_interval = max(1.0, stats_interval)
+        if stats_concurrency is not None:
+            self.stats_concurrency = max(1, stats_concurrency)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background refresh task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background refresh task (idempotent)."""
+        if not DOCKER_AVAILABLE or self.is_running:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Docker status collector started (inventory every {self.inventory_interval:g}s, "
+            f"stats every {self.stats_interval:g}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background task and the event watcher."""
+        self._stopping = True
+        self._close_event_stream()
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Docker status collector stopped")
+
+    async def _run(self) -> None:
+        next_inventory = 0.0
+        while True:
+            try:
+                if time.monotonic() >= next_inventory:
+                    await self.refresh_inventory()
+                    next_inventory = time.monotonic() + self.inventory_interval
+                if self._client is not None:
+                    await self.refresh_stats()
+            except Exception as e:
+                self._counters["errors"] += 1
+                logger.error(f"Failed to refresh Docker status: {e}")
+            await asyncio.sleep(self.stats_interval)
+
+    async def _ensure_client(self):
+        """Connect to Docker (in a worker thread); None if it is unreachable."""
+        if self._client is None and DOCKER_AVAILABLE:
+            try:
+                self._client = await asyncio.to_thread(docker.from_env)
+            except Exception as e:
+                logger.warning(f"Failed to connect to Docker: {e}")
+        return self._client
+
+    async def refresh_inventory(self) -> None:
+        """Reload containers, images and volumes in a worker thread."""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            client = await self._ensure_client()
+            if client is None:
+                return
+            try:
+                containers, images_count, volumes_count = await asyncio.to_thread(self._list_inventory, client)
+            except Exception:
+                # Reconnect on the next refresh (the daemon may have restarted)
+                self._client = None
+                self._close_event_stream()
+                raise
+
+            self._containers = {entry["id"]: entry for entry in map(_container_entry, containers)}
+            self._images_count = images_count
+            self._volumes_count = volumes_count
+            for stale in set(self._stats) - set(self._containers):
+                self._stats.pop(stale, None)
+                self._cpu_readings.pop(stale, None)
+            self._updated_at = datetime.utcnow()
+            self._refreshed_at = time.monotonic()
+            self._counters["inventory_refreshes"] += 1
+
+            if self.is_running:
+                self._watch_events(client)
+
+    @staticmethod
+    def _list_inventory(client) -> Tuple[List[Dict[str, Any]], int, int]:
+        # The low-level API lists containers without inspecting each of them
+        containers = client.api.containers(all=True)
+        images = client.api.images()
+        volumes = client.api.volumes().get("Volumes") or []
+        return containers, len(images), len(volumes)
+
+    async def refresh_stats(self) -> None:
+        """Read CPU and memory of running containers in worker threads."""
+        client = self._client
+        running = [cid for cid, entry in self._containers.items() if entry["status"] == "running"]
+        if client is None or not running:
+            return
+        readings = await asyncio.to_thread(self._read_stats, client, running, self.stats_concurrency)
+        for cid, raw in readings.items():
+            if cid in self._containers:
+                self._stats[cid] = self._container_stats(cid, raw)
+        self._counters["stats_refreshes"] += 1
+
+    @staticmethod
+    def _read_stats(client, container_ids: List[str], concurrency: int) -> Dict[str, Dict[str, Any]]:
+        def read(cid: str) -> Optional[Dict[str, Any]]:
+            try:
+                # One-shot stats return at once instead of waiting for a second CPU sample
+                return client.api.stats(cid, stream=False, one_shot=True)
+            except Exception as e:
+                logger.debug(f"Failed to read stats of container {cid}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="docker-stats") as executor:
+            results = executor.map(read, container_ids)
+            return {cid: raw for cid, raw in zip(container_ids, results, strict=True) if raw}
+
+    def _container_stats(self, cid: str, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """CPU percentage since the previous reading, and memory usage."""
+        cpu_stats = raw.get("cpu_stats") or {}
+        container_cpu = (cpu_stats.get("cpu_usage") or {}).get("total_usage")
+        system_cpu = cpu_stats.get("system_cpu_usage")
+        online_cpus = (
+            cpu_stats.get("online_cpus") or len((cpu_stats.get("cpu_usage") or {}).get("percpu_usage") or []) or 1
+        )
+
+        cpu_percent = None
+        previous = self._cpu_readings.get(cid)
+        if container_cpu is not None and system_cpu is not None:
+            if previous is not None and system_cpu > previous[1]:
+                cpu_delta = max(0, container_cpu - previous[0])
+                cpu_percent = round(cpu_delta / (system_cpu - previous[1]) * online_cpus * 100, 1)
+            self._cpu_readings[cid] = (container_cpu, system_cpu)
+
+        memory_stats = raw.get("memory_stats") or {}
+        memory_used = _memory_usage(memory_stats)
+        memory_limit = memory_stats.get("limit")
+        return {
+            "cpu_percent": cpu_percent,
+            "memory_usage_mb": round(memory_used / BYTES_PER_MB, 1) if memory_used is not None else None,
+            "memory_limit_mb": round(memory_limit / BYTES_PER_MB, 1) if memory_limit else None,
+            "memory_percent": (
+                round(memory_used / memory_limit * 100, 1) if memory_used is not None and memory_limit else None
+            ),
+        }
+
+    def _watch_events(self, client) -> None:
+        """Start the thread applying container events, unless it is already running."""
+        if self._events_thread is not None and self._events_thread.is_alive():
+            return
+        loop = asyncio.get_running_loop()
+        self._events_thread = threading.Thread(
+            target=self._consume_events, args=(client, loop), name="docker-events", daemon=True
+        )
+        self._events_thread.start()
+
+    def _consume_events(self, client, loop: asyncio.AbstractEventLoop) -> None:
+        """Forward container events to the event loop (blocking; runs in its own thread)."""
+        try:
+            self._event_stream = client.api.events(decode=True, filters={"type": "container"})
+            for event in self._event_stream:
+                loop.call_soon_threadsafe(self._apply_event, event)
+        except Exception as e:
+            if not self._stopping:
+                logger.warning(f"Docker event stream ended: {e}")
+        finally:
+            self._event_stream = None
+
+    def _close_event_stream(self) -> None:
+        stream = self._event_stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """Update the cached inventory with one container event."""
+        actor = event.get("Actor") or {}
+        full_id = actor.get("ID") or event.get("id")
+        if not full_id:
+            return
+        cid = full_id[:12]
+        attributes = actor.get("Attributes") or {}
+        action = (event.get("Action") or event.get("status") or "").split(":", 1)[0]
+
+        if action == "destroy":
+            self._containers.pop(cid, None)
+            self._stats.pop(cid, None)
+            self._cpu_readings.pop(cid, None)
+        else:
+            entry = self._containers.get(cid)
+            if entry is None:
+                if action not in EVENT_STATUS:
+                    return
+                entry = self._containers[cid] = {
+                    "id": cid,
+                    "name": attributes.get("name") or cid,
+                    "image": attributes.get("image") or event.get("from"),
+                    "status": None,
+                }
+            if action == "rename" and attributes.get("name"):
+                entry["name"] = attributes["name"]
+            elif action in EVENT_STATUS:
+                entry["status"] = EVENT_STATUS[action]
+                if entry["status"] != "running":
+                    self._stats.pop(cid, None)
+                    self._cpu_readings.pop(cid, None)
+            else:
+                return
+
+        self._updated_at = datetime.utcnow()
+        self._counters["events_applied"] += 1
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get the cached Docker status.
+
+        Refreshes the inventory on demand when the background task is not
+        running and the cached one is older than the inventory interval.
+        """
+        if not self.is_running and (
+            self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.inventory_interval
+        ):
+            try:
+                await self.refresh_inventory()
+            except Exception as e:
+                logger.error(f"Failed to get Docker status: {e}")
+
+        statuses = [entry["status"] for entry in self._containers.values()]
+        containers = [
+            {**entry, **self._stats.get(cid, {})}
+            for cid, entry in sorted(self._containers.items(), key=lambda item: item[1]["name"])
+        ]
+        return {
+            "available": self._client is not None,
+            "containers_running": statuses.count("running"),
+            "containers_stopped": sum(1 for status in statuses if status in ["exited", "stopped"]),
+            "containers_paused": statuses.count("paused"),
+            "images_count": self._images_count,
+            "volumes_count": self._volumes_count,
+            "containers": containers,
+            "updated_at": self._updated_at.isoformat() if self._updated_at else None,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get collector statistics."""
+        return {
+            **self._counters,
+            "running": self.is_running,
+            "connected": self._client is not None,
+            "watching_events": self._events_thread is not None and self._events_thread.is_alive(),
+            "containers": len(self._containers),
+            "inventory_interval_seconds": self.inventory_interval,
+            "stats_interval_seconds": self.stats_interval,
+        }
+
+
+# Global instance
+docker_status_collector = DockerStatusCollector()
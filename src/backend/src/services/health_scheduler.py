@@ -1,20 +1,99 @@
-"""Health check scheduler for automatic service testing."""
+"""Health check scheduler for automatic service testing.
+
+Every service has its own schedule, spread over the interval with random
+jitter so checks do not all fire on the same tick. Due services are checked
+concurrently (bounded by a semaphore), each with its own timeout, without
+holding a database session during the network calls; results of a batch are
+then written in a single transaction.
+
+Intervals adapt to each service: they grow while a service stays healthy and
+shrink while it is failing or flapping, and a global probe budget caps how many
+checks may start per minute. Check results are fed to the circuit breakers of
+the services, so an open breaker is probed again as soon as its service passes.
+"""
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from itertools import pairwise
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from sqlalchemy import select
 
+from ..adapters.base import ConnectionTestResult
 from ..database.connection import get_db_manager
 from ..models.alert_config import AlertConfiguration
-from ..models.service_config import ServiceConfig
+from ..models.service_config import ServiceConfig, ServiceHealthHistory
 from .alert_service import alert_service
 from .service_tester import ServiceTester
 
 logger = logging.getLogger(__name__)
 
+# Per-service schedules are shifted by up to this fraction of the interval
+SCHEDULE_JITTER = 0.1
+
+# Longest sleep between two scheduler wakeups, so added services are picked up
+MAX_SLEEP_SECONDS = 60.0
+
+# Adaptive intervals, as factors of the configured interval
+FAILING_INTERVAL_FACTOR = 0.25
+FLAPPING_INTERVAL_FACTOR = 0.5
+MAX_STABLE_INTERVAL_FACTOR = 4.0
+
+# Consecutive successes after which the interval of a healthy service doubles
+STABLE_STREAK = 4
+
+# Status changes among the recent checks that mark a service as flapping
+RECENT_CHECKS = 10
+FLAP_THRESHOLD = 3
+
+# Shrinking intervals never go below this (unless the configured interval is shorter)
+MIN_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class ServiceSchedule:
+    """Adaptive check schedule of one service."""
+
+    due_at: float  # Monotonic time of the next check
+    interval: float  # Seconds between checks
+    recent: Deque[bool] = field(default_factory=lambda: deque(maxlen=RECENT_CHECKS))
+    consecutive_successes: int = 0
+    consecutive_failures: int = 0
+
+    @property
+    def last_success(self) -> Optional[bool]:
+        return self.recent[-1] if self.recent else None
+
+    @property
+    def is_flapping(self) -> bool:
+        return sum(1 for previous, current in pairwise(self.recent) if previous != current) >= FLAP_THRESHOLD
+
+    @property
+    def state(self) -> str:
+        """unknown, failing, flapping, stable (long healthy streak) or healthy."""
+        if not self.recent:
+            return "unknown"
+        if self.consecutive_failures:
+            return "failing"
+        if self.is_flapping:
+            return "flapping"
+        return "stable" if self.consecutive_successes >= STABLE_STREAK else "healthy"
+
+    def record(self, success: bool) -> None:
+        """Record the result of a check."""
+        self.recent.append(success)
+        if success:
+            self.consecutive_successes += 1
+            self.consecutive_failures = 0
+        else:
+            self.consecutive_failures += 1
+            self.consecutive_successes = 0
+
 
 class HealthCheckScheduler:
     """Scheduler for automatic service health checks."""
@@ -27,7 +106,18 @@ class HealthCheckScheduler:
         self._interval_minutes: int = 15  # Default: 15 minutes
         self._running: bool = False
         self._last_run: Optional[datetime] = None
-        self._next_run: Optional[datetime] = None
+        self._last_duration_ms: Optional[int] = None
+        self._max_concurrent_checks: int = 8
+        self._check_timeout: float = 45.0
+        self._max_probes_per_minute: int = 30
+        self._probe_tokens: float = float(self._max_probes_per_minute)
+        self._tokens_updated_at: float = time.monotonic()
+        self._schedules: Dict[str, ServiceSchedule] = {}
+        # service id -> service (detached), as of the last scheduler wakeup
+        self._services: Dict[str, ServiceConfig] = {}
+        # Whether enabled services were loaded since the scheduler started (there may be none)
+        self._services_loaded: bool = False
+        self._check_lock = asyncio.Lock()
 
     @classmethod
     def get_instance(cls) -> "HealthCheckScheduler":
@@ -36,15 +126,69 @@ class HealthCheckScheduler:
             cls._instance = HealthCheckScheduler()
         return cls._instance
 
+    def configure(
+        self,
+        max_concurrent_checks: Optional[int] = None,
+        check_timeout: Optional[float] = None,
+        max_probes_per_minute: Optional[int] = None,
+    ) -> None:
+        """Update check parallelism, per-check timeout (seconds) and global probe rate."""
+        if max_concurrent_checks is not None:
+            self._max_concurrent_checks = max(1, max_concurrent_checks)
+        if check_timeout is not None:
+            self._check_timeout = check_timeout
+        if max_probes_per_minute is not None:
+            self._max_probes_per_minute = max(1, max_probes_per_minute)
+            self._probe_tokens = min(self._probe_tokens, float(self._max_probes_per_minute))
+
+    @staticmethod
+    def _wall_clock(monotonic_time: float) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=max(0.0, monotonic_time - time.monotonic()))
+
+    @property
+    def _next_run(self) -> Optional[datetime]:
+        """Wall-clock time of the next scheduled check."""
+        if not self._enabled or not self._schedules:
+            return None
+        return self._wall_clock(min(schedule.due_at for schedule in self._schedules.values()))
+
+    def _schedule_status(self) -> List[Dict[str, Any]]:
+        """Per-service schedules, soonest check first."""
+        entries = []
+        for service_id, schedule in sorted(self._schedules.items(), key=lambda item: item[1].due_at):
+            service = self._services.get(service_id)
+            entries.append(
+                {
+                    "service_id": service_id,
+                    "service_name": service.name if service is not None else None,
+                    "state": schedule.state,
+                    "interval_seconds": round(schedule.interval),
+                    "next_check": self._wall_clock(schedule.due_at).isoformat() if self._enabled else None,
+                    "last_success": schedule.last_success,
+                    "consecutive_successes": schedule.consecutive_successes,
+                    "consecutive_failures": schedule.consecutive_failures,
+                }
+            )
+        return entries
+
     @property
     def status(self) -> Dict[str, Any]:
         """Get current scheduler status."""
+        next_run = self._next_run
         return {
             "enabled": self._enabled,
             "interval_minutes": self._interval_minutes,
             "running": self._running,
             "last_run": self._last_run.isoformat() if self._last_run else None,
-            "next_run": self._next_run.isoformat() if self._next_run else None,
+            "next_run": next_run.isoformat() if next_run else None,
+            "last_duration_ms": self._last_duration_ms,
+            "max_concurrent_checks": self._max_concurrent_checks,
+            "check_timeout_seconds": self._check_timeout,
+            "max_probes_per_minute": self._max_probes_per_minute,
+            "scheduled_services": len(self._schedules),
+            # Probe rate the current intervals lead to
+            "probes_per_minute": round(sum(60 / s.interval for s in self._schedules.values() if s.interval), 2),
+            "schedule": self._schedule_status(),
         }
 
     async def start(self, interval_minutes: int = 15) -> None:
@@ -55,6 +199,10 @@ class HealthCheckScheduler:
 
         self._interval_minutes = interval_minutes
         self._enabled = True
+        # Schedules are spread again over the new interval
+        self._schedules.clear()
+        self._services.clear()
+        self._services_loaded = False
         self._task = asyncio.create_task(self._run_scheduler())
         logger.info(f"Health check scheduler started with {interval_minutes} minute interval")
 
@@ -68,7 +216,8 @@ class HealthCheckScheduler:
             except asyncio.CancelledError:
                 pass
             self._task = None
-        self._next_run = None
+        self._schedules.clear()
+        self._services_loaded = False
         logger.info("Health check scheduler stopped")
 
     async def update_interval(self, interval_minutes: int) -> None:
@@ -81,20 +230,15 @@ class HealthCheckScheduler:
             await self.start(interval_minutes)
 
     async def _run_scheduler(self) -> None:
-        """Main scheduler loop."""
+        """Main scheduler loop: wake up when the next service is due and check every due service."""
         while self._enabled:
             try:
-                # Calculate next run time
-                self._next_run = datetime.utcnow()
-
-                # Wait for the interval
-                await asyncio.sleep(self._interval_minutes * 60)
+                await asyncio.sleep(self._seconds_until_next_check())
 
                 if not self._enabled:
                     break
 
-                # Run health checks
-                await self._run_health_checks()
+                await self._run_due_checks()
 
             except asyncio.CancelledError:
                 break
@@ -103,45 +247,185 @@ class HealthCheckScheduler:
                 # Wait a bit before retrying
                 await asyncio.sleep(60)
 
-    async def _run_health_checks(self) -> None:
-        """Run health checks on all enabled services."""
-        self._running = True
-        self._last_run = datetime.utcnow()
-        logger.info("Starting scheduled health checks")
+    def _seconds_until_next_check(self) -> float:
+        if not self._schedules:
+            # Load the services right away on start; afterwards, none are enabled
+            return MAX_SLEEP_SECONDS if self._services_loaded else 0.0
+        next_due = min(schedule.due_at for schedule in self._schedules.values())
+        return min(max(0.0, next_due - time.monotonic()), MAX_SLEEP_SECONDS)
+
+    def _adaptive_interval(self, schedule: ServiceSchedule) -> float:
+        """Seconds between checks of a service, given its recent results."""
+        base = self._interval_minutes * 60
+        if schedule.consecutive_failures:
+            factor = FAILING_INTERVAL_FACTOR
+        elif schedule.is_flapping:
+            factor = FLAPPING_INTERVAL_FACTOR
+        else:
+            # Double the interval for every streak of successes, up to the cap
+            factor = min(MAX_STABLE_INTERVAL_FACTOR, 2 ** (schedule.consecutive_successes // STABLE_STREAK))
+        return max(min(base, MIN_INTERVAL_SECONDS), base * factor)
+
+    def _reschedule(self, service_id: str, success: bool) -> None:
+        """Record a check result and schedule the next check, with jitter."""
+        schedule = self._schedules.get(service_id)
+        if schedule is None:
+            return
+        schedule.record(success)
+        schedule.interval = self._adaptive_interval(schedule)
+        schedule.due_at = time.monotonic() + schedule.interval * random.uniform(
+            1 - SCHEDULE_JITTER, 1 + SCHEDULE_JITTER
+        )
+
+    def _take_probe_budget(self, wanted: int) -> int:
+        """Consume up to ``wanted`` probes from the global per-minute budget."""
+        now = time.monotonic()
+        rate = self._max_probes_per_minute / 60
+        self._probe_tokens = min(
+            float(self._max_probes_per_minute), self._probe_tokens + (now - self._tokens_updated_at) * rate
+        )
+        self._tokens_updated_at = now
+        granted = min(wanted, int(self._probe_tokens))
+        self._probe_tokens -= granted
+        return granted
+
+    async def _load_services(self) -> List[ServiceConfig]:
+        """Load enabled services and add or drop their schedules."""
+        db_manager = get_db_manager()
+        async with db_manager.session_factory() as session:
+            result = await session.execute(select(ServiceConfig).where(ServiceConfig.enabled == True))
+            services = list(result.scalars().all())
+
+        now = time.monotonic()
+        interval = self._interval_minutes * 60
+        self._services = {service.id: service for service in services}
+        self._services_loaded = True
+        for service_id in list(self._schedules):
+            if service_id not in self._services:
+                del self._schedules[service_id]
+        for service_id in self._services:
+            if service_id not in self._schedules:
+                # First checks are spread over the first interval
+                self._schedules[service_id] = ServiceSchedule(
+                    due_at=now + random.uniform(0, interval), interval=interval
+                )
+        return services
+
+    async def _run_due_checks(self) -> None:
+        """Check the services whose schedule is due."""
+        services = await self._load_services()
+        now = time.monotonic()
+        due = [service for service in services if self._schedules[service.id].due_at <= now]
+        if not due:
+            return
 
-        try:
-            db_manager = get_db_manager()
-            async with db_manager.session_factory() as session:
-                # Get all enabled services
-                result = await session.execute(select(ServiceConfig).where(ServiceConfig.enabled == True))
-                services = result.scalars().all()
-
-                success_count = 0
-                error_count = 0
-                failed_services: List[ServiceConfig] = []
-
-                for service in services:
-                    try:
-                        test_result = await ServiceTester.test_service_connection(service, db_session=session)
-                        if test_result.success:
-                            success_count += 1
-                        else:
-                            error_count += 1
-                            failed_services.append(service)
-                    except Exception as e:
-                        logger.error(f"Error testing service {service.name}: {e}")
-                        error_count += 1
-                        failed_services.append(service)
+        # Failing and flapping services go first when the probe budget is short
+        priority = {"failing": 0, "flapping": 0, "unknown": 1}
+        due.sort(key=lambda s: (priority.get(self._schedules[s.id].state, 2), self._schedules[s.id].due_at))
+        granted = self._take_probe_budget(len(due))
+        if granted < len(due):
+            logger.info(f"Probe budget reached, postponing {len(due) - granted} health checks")
+            seconds_per_probe = 60 / self._max_probes_per_minute
+            for position, service in enumerate(due[granted:], start=1):
+                self._schedules[service.id].due_at = now + position * seconds_per_probe
+        if granted:
+            await self._run_health_checks(due[:granted])
+
+    async def _check_service(self, service: ServiceConfig, semaphore: asyncio.Semaphore) -> ConnectionTestResult:
+        """Test one service within the concurrency limit and its own timeout."""
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    ServiceTester.test_service_connection(service), timeout=self._check_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Health check of {service.name} timed out after {self._check_timeout:g}s")
+                return ConnectionTestResult(
+                    success=False,
+                    message=f"Health check timed out after {self._check_timeout:g}s",
+                    details={"error": "timeout"},
+                )
+            except Exception as e:
+                logger.error(f"Error testing service {service.name}: {e}")
+                return ConnectionTestResult(
+                    success=False,
+                    message=f"Test failed with error: {str(e)}",
+                    details={"error": "test_exception", "exception": str(e)},
+                )
 
-                logger.info(f"Scheduled health checks completed: {success_count} success, {error_count} errors")
+    async def _run_health_checks(self, services: Optional[List[ServiceConfig]] = None) -> None:
+        """Run health checks concurrently on the given services (all enabled services by default)."""
+        async with self._check_lock:
+            self._running = True
+            self._last_run = datetime.utcnow()
+            started = time.monotonic()
 
-                # Check alerts for service test failures
-                await self._check_service_alerts(session, failed_services, error_count > 0)
+            try:
+                if services is None:
+                    services = await self._load_services()
+                logger.info(f"Starting scheduled health checks of {len(services)} services")
+
+                semaphore = asyncio.Semaphore(self._max_concurrent_checks)
+                results = await asyncio.gather(*(self._check_service(service, semaphore) for service in services))
+                checked = list(zip(services, results, strict=True))
+                for service, result in checked:
+                    self._reschedule(service.id, result.success)
+                await self._feed_circuit_breakers(checked)
+
+                success_count = sum(1 for _, result in checked if result.success)
+                logger.info(
+                    f"Scheduled health checks completed: {success_count} success, "
+                    f"{len(checked) - success_count} errors"
+                )
 
-        except Exception as e:
-            logger.error(f"Error running scheduled health checks: {e}")
-        finally:
-            self._running = False
+                await self._record_results(checked)
+
+            except Exception as e:
+                logger.error(f"Error running scheduled health checks: {e}")
+            finally:
+                self._last_duration_ms = int((time.monotonic() - started) * 1000)
+                self._running = False
+
+    async def _feed_circuit_breakers(self, checked: List[Tuple[ServiceConfig, ConnectionTestResult]]) -> None:
+        """Move the circuit breakers of checked services according to their health."""
+        for service, result in checked:
+            adapter = ServiceTester.get_adapter_for_service(service)
+            breaker = adapter.circuit_breaker if adapter else None
+            if breaker is not None:
+                await breaker.record_health(result.success)
+
+    async def _record_results(self, checked: List[Tuple[ServiceConfig, ConnectionTestResult]]) -> None:
+        """Write the results of a batch of checks in one transaction, then evaluate alerts."""
+        db_manager = get_db_manager()
+        async with db_manager.session_factory() as session:
+            ids = [service.id for service, _ in checked]
+            rows = await session.execute(select(ServiceConfig).where(ServiceConfig.id.in_(ids)))
+            by_id = {service.id: service for service in rows.scalars().all()}
+
+            history = []
+            for service, result in checked:
+                error = result.message if not result.success else None
+                stored = by_id.get(service.id)
+                if stored is not None:
+                    stored.update_test_result(success=result.success, error=error)
+                history.append(
+                    ServiceHealthHistory(
+                        service_id=service.id,
+                        success=result.success,
+                        response_time_ms=result.response_time_ms,
+                        error_message=error,
+                    )
+                )
+            session.add_all(history)
+            await session.commit()
+
+            # Alerts reflect the latest result of every service, not only this batch
+            failed_services = [
+                self._services[service_id]
+                for service_id, schedule in self._schedules.items()
+                if schedule.last_success is False and service_id in self._services
+            ]
+            await self._check_service_alerts(session, failed_services, bool(failed_services))
 
     async def _check_service_alerts(self, session, failed_services: List[ServiceConfig], has_failures: bool) -> None:
         """Check and trigger alerts for service test failures."""
@@ -0,0 +1,344 @@
+"""Write-behind writer for MCP request audit records.
+
+Tool calls used to commit their McpRequest row when the call started and again
+when it completed, so every call waited on the database (and on SQLite's single
+writer). Lifecycle events are now queued in memory, merged per request and
+written in bulk by a background task once the batch is large enough or the
+flush interval elapsed.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import insert, update
+
+from src.models import McpRequest
+
+logger = logging.getLogger(__name__)
+
+# How long an enqueue waits for room in the buffer with the "block" policy
+BLOCK_TIMEOUT_SECONDS = 2.0
+
+# Failed batches are retried this many times, then their records are written one by one
+MAX_FLUSH_ATTEMPTS = 3
+
+# Number of dropped request ids remembered so their later updates are skipped
+MAX_DROPPED_IDS = 1000
+
+BACKPRESSURE_POLICIES = ("block", "drop")
+
+_INSERT = "insert"
+_UPDATE = "update"
+
+
+class McpAuditWriter:
+    """Buffers McpRequest lifecycle events and flushes them in bulk."""
+
+    def __init__(
+        self,
+        flush_interval: float = 1.0,
+        batch_size: int = 100,
+        max_pending: int = 5000,
+        backpressure: str = "block",
+    ):
+        """Initialize the writer.
+
+        Args:
+            flush_interval: Maximum seconds an event stays buffered
+            batch_size: Number of buffered requests that triggers an early flush
+            max_pending: Maximum number of buffered requests
+            backpressure: What to do when the buffer is full ("block" or "drop")
+        """
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.backpressure = backpressure
+        # request id -> (operation, column values); events for the same request are merged
+        self._pending: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._attempts: Dict[str, int] = {}
+        self._dropped_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stopping = False
+        self._stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "failed_batches": 0,
+        }
+
+    def configure(
+        self,
+        flush_interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        backpressure: Optional[str] = None,
+    ) -> None:
+        """Update flush thresholds, buffer size and backpressure policy."""
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if max_pending is not None:
+            self.max_pending = max_pending
+        if backpressure is not None:
+            if backpressure not in BACKPRESSURE_POLICIES:
+                logger.warning(f"Unknown audit backpressure policy '{backpressure}', using 'block'")
+                backpressure = "block"
+            self.backpressure = backpressure
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flush task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task (idempotent)."""
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"MCP audit writer started (interval {self.flush_interval}s, batch {self.batch_size}, "
+            f"buffer {self.max_pending}, policy {self.backpressure})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background task after draining every buffered event."""
+        if not self.is_running:
+            if self._pending:
+                await self.flush()
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await self._task
+        except Exception as e:
+            logger.error(f"MCP audit writer stopped with error: {e}")
+        self._task = None
+        logger.info(f"MCP audit writer stopped ({self._stats['written']} records written)")
+
+    async def add(self, request: McpRequest) -> str:
+        """Queue the insertion of a new request record.
+
+        The id and timestamps are assigned here, so they reflect the time of the
+        call rather than the time of the flush.
+
+        Returns:
+            The request id
+        """
+        self._apply_defaults(request)
+        await self._enqueue(request.id, _INSERT, self._snapshot(request))
+        return request.id
+
+    async def update(self, request: McpRequest) -> None:
+        """Queue an update of a request previously passed to ``add``."""
+        if request.id is None:
+            raise ValueError("Cannot update an MCP request that was never added")
+        if request.id in self._dropped_ids:
+            return
+
+        request.updated_at = datetime.utcnow()
+        values = self._snapshot(request)
+        values.pop("created_at", None)
+        await self._enqueue(request.id, _UPDATE, values)
+
+    @staticmethod
+    def _apply_defaults(request: McpRequest) -> None:
+        """Fill column defaults (id, timestamps, status...) on a transient request."""
+        for attr in McpRequest.__mapper__.column_attrs:
+            default = attr.columns[0].default
+            if default is None or getattr(request, attr.key) is not None:
+                continue
+            if default.is_scalar:
+                setattr(request, attr.key, default.arg)
+            elif default.is_callable:
+                setattr(request, attr.key, default.arg(None))
+
+    @staticmethod
+    def _snapshot(request: McpRequest) -> Dict[str, Any]:
+        """Copy the column values of a (transient) request."""
+        return {attr.key: getattr(request, attr.key) for attr in McpRequest.__mapper__.column_attrs}
+
+    async def _enqueue(self, request_id: str, operation: str, values: Dict[str, Any]) -> None:
+        """Merge an event into the buffer, applying backpressure when it is full."""
+        if request_id in self._pending:
+            self._pending[request_id][1].update(values)
+            self._stats["coalesced"] += 1
+            return
+
+        if len(self._pending) >= self.max_pending and not await self._wait_for_space():
+            self._drop(request_id)
+            return
+
+        # The request may have been queued again while we were waiting
+        if request_id in self._pending:
+            self._pending[request_id][1].update(values)
+            self._stats["coalesced"] += 1
+            return
+
+        self._pending[request_id] = (operation, values)
+        self._stats["enqueued"] += 1
+
+        if not self.is_running:
+            self.start()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _wait_for_space(self) -> bool:
+        """Wait for the buffer to drain according to the backpressure policy."""
+        if self.backpressure != "block" or not self.is_running:
+            return False
+
+        self._space.clear()
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._space.wait(), timeout=BLOCK_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        return len(self._pending) < self.max_pending
+
+    def _drop(self, request_id: str) -> None:
+        """Count a dropped event and remember its request so later updates are skipped."""
+        self._stats["dropped"] += 1
+        self._dropped_ids[request_id] = None
+        while len(self._dropped_ids) > MAX_DROPPED_IDS:
+            self._dropped_ids.popitem(last=False)
+        if self._stats["dropped"] == 1 or self._stats["dropped"] % 100 == 0:
+            logger.warning(f"{self._stats['dropped']} MCP audit events dropped so far")
+
+    async def _run(self) -> None:
+        """Flush buffered events on size or time thresholds until stopped."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            await self.flush()
+
+            if self._stopping and not self._pending:
+                return
+
+    async def flush(self) -> int:
+        """Write every buffered event in one transaction.
+
+        Returns:
+            Number of request records written
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch = self._pending
+            self._pending = OrderedDict()
+            if self._space is not None:
+                self._space.set()
+
+            inserts = [values for op, values in batch.values() if op == _INSERT]
+            updates = [{**values, "id": request_id} for request_id, (op, values) in batch.items() if op == _UPDATE]
+
+            try:
+                from src.database.connection import get_async_session_maker
+
+                async with get_async_session_maker()() as session:
+                    if inserts:
+                        await session.execute(insert(McpRequest), inserts)
+                    if updates:
+                        await session.execute(update(McpRequest), updates)
+                    await session.commit()
+            except Exception as e:
+                self._stats["failed_batches"] += 1
+                logger.error(f"Failed to write {len(batch)} MCP audit records: {e}")
+                exhausted = self._requeue(batch)
+                return await self._write_individually(exhausted) if exhausted else 0
+
+            for request_id in batch:
+                self._attempts.pop(request_id, None)
+            self._stats["written"] += len(batch)
+            self._stats["batches"] += 1
+            return len(batch)
+
+    def _requeue(
+        self, batch: "OrderedDict[str, Tuple[str, Dict[str, Any]]]"
+    ) -> "OrderedDict[str, Tuple[str, Dict[str, Any]]]":
+        """Put a failed batch back in front of newer events.
+
+        Returns:
+            Records that failed too often to be retried in a batch again
+        """
+        merged: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        exhausted: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        for request_id, (op, values) in batch.items():
+            newer = self._pending.pop(request_id, None)
+            if newer is not None:
+                values = {**values, **newer[1]}
+            attempts = self._attempts.get(request_id, 0) + 1
+            if attempts >= MAX_FLUSH_ATTEMPTS:
+                self._attempts.pop(request_id, None)
+                exhausted[request_id] = (op, values)
+                continue
+            self._attempts[request_id] = attempts
+            merged[request_id] = (op, values)
+        merged.update(self._pending)
+        self._pending = merged
+        return exhausted
+
+    async def _write_individually(self, records: "OrderedDict[str, Tuple[str, Dict[str, Any]]]") -> int:
+        """Write records one transaction each, so a bad record no longer takes its batch down.
+
+        Records that still fail are dropped.
+
+        Returns:
+            Number of request records written
+        """
+        from src.database.connection import get_async_session_maker
+
+        written = 0
+        for request_id, (op, values) in records.items():
+            try:
+                async with get_async_session_maker()() as session:
+                    if op == _INSERT:
+                        await session.execute(insert(McpRequest), [values])
+                    else:
+                        await session.execute(update(McpRequest), [{**values, "id": request_id}])
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Dropping MCP audit record {request_id} after {MAX_FLUSH_ATTEMPTS} attempts: {e}")
+                self._drop(request_id)
+                continue
+            written += 1
+
+        self._stats["written"] += written
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            **self._stats,
+            "queued": len(self._pending),
+            "running": self.is_running,
+            "max_pending": self.max_pending,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "backpressure": self.backpressure,
+        }
+
+
+# Global instance
+mcp_audit_writer = McpAuditWriter()
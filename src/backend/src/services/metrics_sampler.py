@@ -0,0 +1,182 @@
+"""Background sampler of host system metrics.
+
+``SystemMonitorService`` used to call ``psutil.cpu_percent(interval=1)`` on the
+event loop, blocking the whole server for a second on every dashboard request
+and every metrics WebSocket tick. CPU, memory, disk, network and load average
+are now sampled by one background task at a fixed cadence, in a worker thread,
+into a ring buffer; readers get the latest snapshot without waiting.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+BYTES_PER_MB = 1024 * 1024
+BYTES_PER_GB = 1024 * 1024 * 1024
+
+# CPU measurement window of on-demand samples, which have no recent reference reading
+ON_DEMAND_CPU_WINDOW = 0.1
+
+
+def _collect_sample(cpu_window: Optional[float] = None) -> Dict[str, Any]:
+    """Read current system metrics (blocking; runs in a worker thread).
+
+    Args:
+        cpu_window: Seconds over which CPU usage is measured; None for the usage since the previous sample
+    """
+    cpu_percent = psutil.cpu_percent(interval=cpu_window)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage("/")
+    network = psutil.net_io_counters()
+    now = time.time()
+
+    try:
+        load_average = [round(load, 2) for load in psutil.getloadavg()]
+    except (AttributeError, OSError):
+        load_average = [0.0, 0.0, 0.0]
+
+    return {
+        "cpu_percent": cpu_percent,
+        "memory_used_mb": int(memory.used / BYTES_PER_MB),
+        "memory_total_mb": int(memory.total / BYTES_PER_MB),
+        "memory_percent": memory.percent,
+        "disk_used_gb": round(disk.used / BYTES_PER_GB, 2),
+        "disk_total_gb": round(disk.total / BYTES_PER_GB, 2),
+        "disk_percent": round((disk.used / disk.total) * 100, 1) if disk.total else 0.0,
+        "uptime_seconds": int(now - psutil.boot_time()),
+        "network_sent_mb": round(network.bytes_sent / BYTES_PER_MB, 2),
+        "network_recv_mb": round(network.bytes_recv / BYTES_PER_MB, 2),
+        "load_average": load_average,
+        "timestamp": datetime.utcfromtimestamp(now).isoformat(),
+        "sampled_at": now,
+    }
+
+
+class SystemMetricsSampler:
+    """Samples system metrics in the background and keeps the recent samples."""
+
+    def __init__(self, interval: float = 5.0, history_size: int = 720):
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between two samples
+            history_size: Number of samples kept in the ring buffer
+        """
+        self.interval = interval
+        self._samples: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._task: Optional[asyncio.Task] = None
+        self._sample_lock: Optional[asyncio.Lock] = None
+        self._stats = {"samples": 0, "errors": 0, "last_duration_ms": None}
+
+    def configure(self, interval: Optional[float] = None, history_size: Optional[int] = None) -> None:
+        """Update the sampling cadence and ring buffer size."""
+        if interval is not None:
+            self.interval = max(0.5, interval)
+        if history_size is not None and history_size != self._samples.maxlen:
+            self._samples = deque(self._samples, maxlen=max(1, history_size))
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background sampling task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background sampling task (idempotent)."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"System metrics sampler started (every {self.interval:g}s, {self._samples.maxlen} samples kept)")
+
+    async def stop(self) -> None:
+        """Stop the background sampling task."""
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("System metrics sampler stopped")
+
+    async def _run(self) -> None:
+        # The first CPU reading only sets the reference point
+        await asyncio.to_thread(psutil.cpu_percent, None)
+        next_at = time.monotonic()
+        while True:
+            next_at += self.interval
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+            try:
+                await self.sample()
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Failed to sample system metrics: {e}")
+            # Do not try to catch up after a stall
+            next_at = max(next_at, time.monotonic() - self.interval)
+
+    async def sample(self) -> Dict[str, Any]:
+        """Take a sample now, in a worker thread, and add it to the ring buffer.
+
+        While the background task runs, CPU usage is measured since the previous
+        sample. Otherwise the previous reading may be missing or hours old, so
+        CPU usage is measured over a short window instead.
+        """
+        if self._sample_lock is None:
+            self._sample_lock = asyncio.Lock()
+        async with self._sample_lock:
+            started = time.monotonic()
+            cpu_window = None if self.is_running and self._samples else ON_DEMAND_CPU_WINDOW
+            snapshot = await asyncio.to_thread(_collect_sample, cpu_window)
+            self._samples.append(snapshot)
+            self._stats["samples"] += 1
+            self._stats["last_duration_ms"] = int((time.monotonic() - started) * 1000)
+            return snapshot
+
+    async def get_latest(self) -> Dict[str, Any]:
+        """Get the latest snapshot.
+
+        Samples on demand when the background task is not running and the
+        latest sample is older than the interval.
+        """
+        if not self._samples or (
+            not self.is_running and time.time() - self._samples[-1]["sampled_at"] >= self.interval
+        ):
+            await self.sample()
+        return dict(self._samples[-1])
+
+    def get_history(self, since: Optional[float] = None, until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Get buffered samples, oldest first.
+
+        Args:
+            since: Only samples taken at or after this Unix time
+            until: Only samples taken at or before this Unix time
+
+        Returns:
+            List of snapshots
+        """
+        return [
+            dict(sample)
+            for sample in self._samples
+            if (since is None or sample["sampled_at"] >= since) and (until is None or sample["sampled_at"] <= until)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sampler statistics."""
+        return {
+            **self._stats,
+            "running": self.is_running,
+            "interval_seconds": self.interval,
+            "buffered": len(self._samples),
+            "history_size": self._samples.maxlen,
+        }
+
+
+# Global instance
+system_metrics_sampler = SystemMetricsSampler()
@@ -1,12 +1,14 @@
 """Permission service for checking group-based tool access."""
 
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from loguru import logger
-from sqlalchemy import and_, func, select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
 
 from ..models.group import Group, GroupMembership, GroupToolPermission
 
@@ -21,134 +23,328 @@ class PermissionCheckResult:
     denial_reason: Optional[str] = None
 
 
-class PermissionService:
-    """Service for checking user permissions based on group memberships."""
+@dataclass
+class CompiledGroup:
+    """Group with its enabled tool permissions and members, precompiled for lookups."""
+
+    id: str
+    name: str
+    priority: int
+    enabled: bool
+    # Exact tool name -> service types the permission is limited to (None = any service)
+    tools: Dict[str, List[Optional[str]]] = field(default_factory=dict)
+    # Service types of "*" permissions (None = all services)
+    wildcards: List[Optional[str]] = field(default_factory=list)
+    # Users with an enabled membership
+    members: Set[str] = field(default_factory=set)
+
+    def matches_tool(self, tool_name: str, service_type: Optional[str] = None) -> bool:
+        """Same semantics as ``GroupToolPermission.matches_tool`` across all permissions."""
+        for scoped_service in self.wildcards:
+            if not (scoped_service and service_type and scoped_service != service_type):
+                return True
+        for scoped_service in self.tools.get(tool_name, ()):
+            if not (scoped_service and service_type and scoped_service != service_type):
+                return True
+        return False
+
+    @property
+    def permission_names(self) -> List[str]:
+        """Tool names covered by this group's enabled permissions ("*" for wildcards)."""
+        names = list(self.tools)
+        if self.wildcards:
+            names.append("*")
+        return names
+
+
+class PermissionIndex:
+    """In-memory index of groups, memberships and tool permissions.
+
+    Built once from the database, then kept current by reloading only the
+    groups touched by committed changes (tracked through session events).
+    """
+
+    def __init__(self):
+        self._groups: Dict[str, CompiledGroup] = {}
+        self._user_group_ids: Dict[str, Set[str]] = {}
+        self._user_groups: Dict[str, List[CompiledGroup]] = {}
+        # Enabled permission count per tool name, across all groups ("*" included)
+        self._restricted: Counter = Counter()
+        self._built = False
+        self._dirty_groups: Set[str] = set()
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Incremented every time the index content changes."""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on next access."""
+        self._built = False
+
+    def mark_groups_dirty(self, group_ids: Iterable[str]) -> None:
+        """Schedule groups for an incremental reload on next access."""
+        self._dirty_groups.update(group_ids)
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """Build or incrementally refresh the index if needed."""
+        if self._built and not self._dirty_groups:
+            return
+
+        async with self._lock:
+            if not self._built:
+                self._dirty_groups.clear()
+                await self._rebuild(db)
+            elif self._dirty_groups:
+                dirty = self._dirty_groups
+                self._dirty_groups = set()
+                await self._reload_groups(db, dirty)
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        """Rebuild the whole index from the database."""
+        result = await db.execute(
+            select(Group)
+            .options(selectinload(Group.tool_permissions), selectinload(Group.memberships))
+            .execution_options(populate_existing=True)
+        )
+        groups = result.scalars().all()
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
+        self._groups = {}
+        self._user_group_ids = {}
+        self._user_groups = {}
+        self._restricted = Counter()
+        for group in groups:
+            self._add_group(self._compile_group(group))
 
-    async def _is_tool_restricted(self, tool_name: str, service_type: Optional[str] = None) -> bool:
-        """
-        Check if a tool is restricted (associated with any group).
-        A tool is restricted if any group has a permission for it.
-        """
-        # Check for exact tool match or wildcard permissions
-        result = await self.db.execute(
-            select(func.count(GroupToolPermission.id)).where(
-                and_(
-                    GroupToolPermission.enabled == True,
-                    # Match tool name or wildcard
-                    ((GroupToolPermission.tool_name == tool_name) | (GroupToolPermission.tool_name == "*")),
-                )
-            )
+        self._built = True
+        self._generation += 1
+        logger.debug(f"Permission index built: {len(self._groups)} groups, {len(self._user_group_ids)} users")
+
+    async def _reload_groups(self, db: AsyncSession, group_ids: Set[str]) -> None:
+        """Reload only the given groups."""
+        result = await db.execute(
+            select(Group)
+            .options(selectinload(Group.tool_permissions), selectinload(Group.memberships))
+            .where(Group.id.in_(group_ids))
+            .execution_options(populate_existing=True)
         )
-        count = result.scalar()
-        return count > 0
+        fresh = {str(group.id): self._compile_group(group) for group in result.scalars().all()}
 
-    async def check_permission(
-        self, central_user_id: str, tool_name: str, service_type: Optional[str] = None
-    ) -> PermissionCheckResult:
-        """
-        Check if a user has permission to access a specific tool.
+        for group_id in group_ids:
+            self._remove_group(group_id)
+            if group_id in fresh:
+                self._add_group(fresh[group_id])
 
-        Permission resolution:
-        1. If the tool is not restricted (not associated with any group), allow access
-        2. If the user has no groups, allow access to non-restricted tools
-        3. Get all active groups the user belongs to
-        4. Order by priority (highest first)
-        5. Check each group's tool permissions
-        6. Return access granted by the highest priority group with matching permission
-        """
-        # First check if the tool is restricted at all
-        tool_is_restricted = await self._is_tool_restricted(tool_name, service_type)
+        self._generation += 1
+        logger.debug(f"Permission index refreshed {len(group_ids)} group(s)")
+
+    @staticmethod
+    def _compile_group(group: Group) -> CompiledGroup:
+        compiled = CompiledGroup(
+            id=str(group.id), name=group.name, priority=group.priority or 0, enabled=bool(group.enabled)
+        )
+        for permission in group.tool_permissions:
+            if not permission.enabled:
+                continue
+            if permission.tool_name == "*":
+                compiled.wildcards.append(permission.service_type)
+            else:
+                compiled.tools.setdefault(permission.tool_name, []).append(permission.service_type)
+        compiled.members = {m.central_user_id for m in group.memberships if m.enabled}
+        return compiled
+
+    def _add_group(self, group: CompiledGroup) -> None:
+        self._groups[group.id] = group
+        for tool_name, scopes in group.tools.items():
+            self._restricted[tool_name] += len(scopes)
+        if group.wildcards:
+            self._restricted["*"] += len(group.wildcards)
+        for user_id in group.members:
+            self._user_group_ids.setdefault(user_id, set()).add(group.id)
+            self._user_groups.pop(user_id, None)
+
+    def _remove_group(self, group_id: str) -> None:
+        group = self._groups.pop(group_id, None)
+        if not group:
+            return
+        for tool_name, scopes in group.tools.items():
+            self._restricted[tool_name] -= len(scopes)
+            if self._restricted[tool_name] <= 0:
+                del self._restricted[tool_name]
+        if group.wildcards:
+            self._restricted["*"] -= len(group.wildcards)
+            if self._restricted["*"] <= 0:
+                del self._restricted["*"]
+        for user_id in group.members:
+            user_groups = self._user_group_ids.get(user_id)
+            if user_groups:
+                user_groups.discard(group_id)
+                if not user_groups:
+                    del self._user_group_ids[user_id]
+            self._user_groups.pop(user_id, None)
+
+    def is_tool_restricted(self, tool_name: str) -> bool:
+        """A tool is restricted if any group has an enabled permission for it (or a wildcard)."""
+        return tool_name in self._restricted or "*" in self._restricted
+
+    def has_memberships(self, central_user_id: str) -> bool:
+        """Whether the user has any enabled group membership."""
+        return central_user_id in self._user_group_ids
+
+    def user_groups(self, central_user_id: str) -> List[CompiledGroup]:
+        """Enabled groups of a user, highest priority first."""
+        groups = self._user_groups.get(central_user_id)
+        if groups is None:
+            groups = sorted(
+                (
+                    self._groups[group_id]
+                    for group_id in self._user_group_ids.get(central_user_id, ())
+                    if self._groups[group_id].enabled
+                ),
+                key=lambda g: g.priority,
+                reverse=True,
+            )
+            self._user_groups[central_user_id] = groups
+        return groups
 
-        if not tool_is_restricted:
+    def check(
+        self, central_user_id: str, tool_name: str, service_type: Optional[str] = None
+    ) -> "PermissionCheckResult":
+        """Check a permission against the index without touching the database."""
+        if not self.is_tool_restricted(tool_name):
             logger.debug(f"Tool {tool_name} is not restricted by any group, access granted")
             return PermissionCheckResult(has_access=True, granted_by_group=None, granted_by_group_id=None)
 
-        # Get user's active group memberships
-        memberships_result = await self.db.execute(
-            select(GroupMembership).where(
-                and_(GroupMembership.central_user_id == central_user_id, GroupMembership.enabled == True)
-            )
-        )
-        memberships = memberships_result.scalars().all()
-
-        if not memberships:
+        if not self.has_memberships(central_user_id):
             # User has no groups but tool is restricted - deny access
             logger.debug(f"User {central_user_id} has no group memberships and tool {tool_name} is restricted")
             return PermissionCheckResult(
                 has_access=False, denial_reason="User is not a member of any group with access to this tool"
             )
 
-        # Get all groups with their permissions, ordered by priority
-        group_ids = [m.group_id for m in memberships]
-        groups_result = await self.db.execute(
-            select(Group)
-            .options(selectinload(Group.tool_permissions))
-            .where(and_(Group.id.in_(group_ids), Group.enabled == True))
-            .order_by(Group.priority.desc())
-        )
-        groups = groups_result.scalars().all()
-
+        groups = self.user_groups(central_user_id)
         if not groups:
             logger.debug(f"No enabled groups found for user {central_user_id}")
             return PermissionCheckResult(has_access=False, denial_reason="User's groups are all disabled")
 
         # Check each group's permissions in priority order
         for group in groups:
-            for permission in group.tool_permissions:
-                if not permission.enabled:
-                    continue
-
-                if permission.matches_tool(tool_name, service_type):
-                    logger.debug(
-                        f"User {central_user_id} granted access to {tool_name} "
-                        f"by group {group.name} (priority {group.priority})"
-                    )
-                    return PermissionCheckResult(
-                        has_access=True, granted_by_group=group.name, granted_by_group_id=str(group.id)
-                    )
+            if group.matches_tool(tool_name, service_type):
+                logger.debug(
+                    f"User {central_user_id} granted access to {tool_name} "
+                    f"by group {group.name} (priority {group.priority})"
+                )
+                return PermissionCheckResult(has_access=True, granted_by_group=group.name, granted_by_group_id=group.id)
 
         logger.debug(f"User {central_user_id} denied access to {tool_name}: no matching permission")
         return PermissionCheckResult(has_access=False, denial_reason=f"No group grants access to tool '{tool_name}'")
 
-    async def get_user_allowed_tools(self, central_user_id: str) -> List[str]:
-        """Get all tools a user has access to based on their groups."""
-        # Get user's active group memberships
-        memberships_result = await self.db.execute(
-            select(GroupMembership).where(
-                and_(GroupMembership.central_user_id == central_user_id, GroupMembership.enabled == True)
-            )
-        )
-        memberships = memberships_result.scalars().all()
+    def allowed_tools(self, central_user_id: str, tools: Iterable[Tuple[str, Optional[str]]]) -> Set[str]:
+        """Filter ``(tool_name, service_type)`` pairs down to the tools a user may call."""
+        groups = self.user_groups(central_user_id)
+        allowed = set()
+        for tool_name, service_type in tools:
+            if not self.is_tool_restricted(tool_name) or any(g.matches_tool(tool_name, service_type) for g in groups):
+                allowed.add(tool_name)
+        return allowed
 
-        if not memberships:
-            return []
+    def get_stats(self) -> Dict[str, int]:
+        """Get index statistics."""
+        return {
+            "groups": len(self._groups),
+            "users": len(self._user_group_ids),
+            "restricted_tools": len(self._restricted),
+            "generation": self._generation,
+        }
 
-        # Get all groups with their permissions
-        group_ids = [m.group_id for m in memberships]
-        groups_result = await self.db.execute(
-            select(Group)
-            .options(selectinload(Group.tool_permissions))
-            .where(and_(Group.id.in_(group_ids), Group.enabled == True))
-        )
-        groups = groups_result.scalars().all()
+
+# Global instance
+permission_index = PermissionIndex()
+
+_PENDING_GROUPS_KEY = "permission_index_groups"
+_PENDING_FULL_KEY = "permission_index_full"
+
+
+def _collect_group_changes(session: Session, flush_context) -> None:
+    """Remember which groups were touched by a flush until the transaction commits."""
+    pending = session.info.setdefault(_PENDING_GROUPS_KEY, set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Group):
+            pending.add(str(obj.id))
+        elif isinstance(obj, (GroupMembership, GroupToolPermission)) and obj.group_id:
+            pending.add(str(obj.group_id))
+
+
+def _collect_bulk_changes(orm_execute_state) -> None:
+    """Bulk UPDATE/DELETE statements bypass the unit of work, so fall back to a full rebuild."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ in (Group, GroupMembership, GroupToolPermission):
+            orm_execute_state.session.info[_PENDING_FULL_KEY] = True
+
+
+def _apply_committed_changes(session: Session) -> None:
+    if session.info.pop(_PENDING_FULL_KEY, False):
+        permission_index.invalidate()
+    pending = session.info.pop(_PENDING_GROUPS_KEY, None)
+    if pending:
+        permission_index.mark_groups_dirty(pending)
+
+
+def _discard_pending_changes(session: Session, previous_transaction=None) -> None:
+    session.info.pop(_PENDING_GROUPS_KEY, None)
+    session.info.pop(_PENDING_FULL_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_group_changes)
+event.listen(Session, "do_orm_execute", _collect_bulk_changes)
+event.listen(Session, "after_commit", _apply_committed_changes)
+event.listen(Session, "after_soft_rollback", _discard_pending_changes)
+
+
+class PermissionService:
+    """Service for checking user permissions based on group memberships."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def check_permission(
+        self, central_user_id: str, tool_name: str, service_type: Optional[str] = None
+    ) -> PermissionCheckResult:
+        """
+        Check if a user has permission to access a specific tool.
+
+        Permission resolution:
+        1. If the tool is not restricted (not associated with any group), allow access
+        2. If the user has no groups, allow access to non-restricted tools
+        3. Get all active groups the user belongs to
+        4. Order by priority (highest first)
+        5. Check each group's tool permissions
+        6. Return access granted by the highest priority group with matching permission
+
+        Answered from the in-memory ``permission_index``; the database is only
+        read when the index needs to be (re)built.
+        """
+        await permission_index.ensure_fresh(self.db)
+        return permission_index.check(central_user_id, tool_name, service_type)
+
+    async def get_allowed_tools(self, central_user_id: str, tools: Iterable[Tuple[str, Optional[str]]]) -> Set[str]:
+        """Filter ``(tool_name, service_type)`` pairs down to the tools a user may call."""
+        await permission_index.ensure_fresh(self.db)
+        return permission_index.allowed_tools(central_user_id, tools)
+
+    async def get_user_allowed_tools(self, central_user_id: str) -> List[str]:
+        """Get all tools a user has access to based on their groups."""
+        await permission_index.ensure_fresh(self.db)
 
         # Collect all allowed tools
         allowed_tools = set()
-        has_wildcard = False
-
-        for group in groups:
-            for permission in group.tool_permissions:
-                if not permission.enabled:
-                    continue
-                if permission.tool_name == "*":
-                    has_wildcard = True
-                else:
-                    allowed_tools.add(permission.tool_name)
+        for group in permission_index.user_groups(central_user_id):
+            allowed_tools.update(group.permission_names)
 
-        if has_wildcard:
+        if "*" in allowed_tools:
             # User has access to all tools
             return ["*"]
 
@@ -23,6 +23,7 @@ from ..adapters.tautulli import TautulliAdapter
 from ..adapters.wikijs import WikiJSAdapter
 from ..adapters.zammad import ZammadAdapter
 from ..models.service_config import ServiceConfig, ServiceHealthHistory
+from .circuit_breaker import circuit_bypass
 
 logger = logging.getLogger(__name__)
 
@@ -81,9 +82,10 @@ class ServiceTester:
             )
 
         try:
-            # Test the connection using the adapter
-            async with adapter:
-                result = await adapter.test_connection()
+            # Test the connection using the adapter, even while its circuit breaker is open
+            with circuit_bypass():
+                async with adapter:
+                    result = await adapter.test_connection()
 
             # Update service with test results if database session is provided
             if db_session:
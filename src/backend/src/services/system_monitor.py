@@ -2,73 +2,28 @@
 
 import asyncio
 import random
-import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import psutil
 from loguru import logger
 
-try:
-    import docker
-
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
-    logger.warning("Docker library not available, Docker monitoring disabled")
+from .docker_monitor import docker_status_collector
+from .metrics_sampler import system_metrics_sampler
 
 
 class SystemMonitorService:
     """Service for collecting system metrics and status information."""
 
-    def __init__(self):
-        self.docker_client = None
-        if DOCKER_AVAILABLE:
-            try:
-                self.docker_client = docker.from_env()
-            except Exception as e:
-                logger.warning(f"Failed to connect to Docker: {e}")
-
     async def get_current_system_status(self) -> Dict[str, Any]:
-        """Get current system status including CPU, memory, disk usage."""
-        try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_used_mb = int(memory.used / 1024 / 1024)
-            memory_total_mb = int(memory.total / 1024 / 1024)
-            memory_percent = memory.percent
-
-            # Disk usage
-            disk = psutil.disk_usage("/")
-            disk_used_gb = round(disk.used / 1024 / 1024 / 1024, 2)
-            disk_total_gb = round(disk.total / 1024 / 1024 / 1024, 2)
-            disk_percent = round((disk.used / disk.total) * 100, 1)
-
-            # System uptime
-            boot_time = psutil.boot_time()
-            uptime_seconds = int(time.time() - boot_time)
-
-            # Network I/O
-            network = psutil.net_io_counters()
-            network_sent_mb = round(network.bytes_sent / 1024 / 1024, 2)
-            network_recv_mb = round(network.bytes_recv / 1024 / 1024, 2)
+        """Get current system status including CPU, memory, disk usage.
 
-            return {
-                "cpu_percent": cpu_percent,
-                "memory_used_mb": memory_used_mb,
-                "memory_total_mb": memory_total_mb,
-                "memory_percent": memory_percent,
-                "disk_used_gb": disk_used_gb,
-                "disk_total_gb": disk_total_gb,
-                "disk_percent": disk_percent,
-                "uptime_seconds": uptime_seconds,
-                "network_sent_mb": network_sent_mb,
-                "network_recv_mb": network_recv_mb,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+        Metrics are sampled in the background; this returns the latest sample.
+        """
+        try:
+            status = await system_metrics_sampler.get_latest()
+            status.pop("sampled_at", None)
+            return status
 
         except Exception as e:
             logger.error(f"Failed to get system status: {e}")
@@ -83,46 +38,17 @@ class SystemMonitorService:
                 "uptime_seconds": 0,
                 "network_sent_mb": 0.0,
                 "network_recv_mb": 0.0,
+                "load_average": [0.0, 0.0, 0.0],
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
     async def get_docker_status(self) -> Dict[str, Any]:
-        """Get Docker container status information."""
-        if not self.docker_client:
-            return {
-                "containers_running": 0,
-                "containers_stopped": 0,
-                "containers_paused": 0,
-                "images_count": 0,
-                "volumes_count": 0,
-            }
-
-        try:
-            containers = self.docker_client.containers.list(all=True)
-            images = self.docker_client.images.list()
-            volumes = self.docker_client.volumes.list()
-
-            running = sum(1 for c in containers if c.status == "running")
-            stopped = sum(1 for c in containers if c.status in ["exited", "stopped"])
-            paused = sum(1 for c in containers if c.status == "paused")
-
-            return {
-                "containers_running": running,
-                "containers_stopped": stopped,
-                "containers_paused": paused,
-                "images_count": len(images),
-                "volumes_count": len(volumes),
-            }
+        """Get Docker container status information.
 
-        except Exception as e:
-            logger.error(f"Failed to get Docker status: {e}")
-            return {
-                "containers_running": 0,
-                "containers_stopped": 0,
-                "containers_paused": 0,
-                "images_count": 0,
-                "volumes_count": 0,
-            }
+        Docker is queried in the background; this returns the cached status,
+        including CPU and memory of running containers.
+        """
+        return await docker_status_collector.get_status()
 
     async def get_process_list(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get list of running processes."""
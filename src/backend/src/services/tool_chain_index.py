@@ -0,0 +1,351 @@
+"""In-memory rule table for tool chains.
+
+Chain enrichment runs after every tool call, but most tools are not part of
+any chain. Chains are compiled once into plain objects keyed by
+``(source_service, source_tool, order)`` so a lookup is a dictionary access,
+and rebuilt lazily after committed changes to chain data (tracked through
+session events, which covers the tool chain API as well as backup import and
+reset).
+"""
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.models.tool_chain import (
+    ToolChain,
+    ToolChainAction,
+    ToolChainCondition,
+    ToolChainConditionGroup,
+    ToolChainStep,
+)
+
+TOOL_CHAIN_MODELS = (ToolChain, ToolChainStep, ToolChainConditionGroup, ToolChainCondition, ToolChainAction)
+
+
+@dataclass
+class CompiledCondition:
+    """Detached copy of a ToolChainCondition."""
+
+    operator: str
+    field: Optional[str]
+    value: Optional[str]
+
+
+@dataclass
+class CompiledConditionGroup:
+    """Detached copy of a ToolChainConditionGroup with its nested groups."""
+
+    id: str
+    operator: str
+    parent_group_id: Optional[str]
+    order: int
+    conditions: List[CompiledCondition] = field(default_factory=list)
+    child_groups: List["CompiledConditionGroup"] = field(default_factory=list)
+
+
+@dataclass
+class CompiledChain:
+    """Detached copy of the ToolChain fields used in suggestions."""
+
+    id: str
+    name: str
+    color: str
+    priority: int
+
+
+@dataclass
+class CompiledAction:
+    """Detached copy of a ToolChainAction with its nested actions and conditions."""
+
+    id: str
+    branch: str
+    action_type: str
+    target_service: Optional[str]
+    target_tool: Optional[str]
+    argument_mappings: Optional[dict]
+    save_to_context: Optional[dict]
+    message_template: Optional[str]
+    order: int
+    ai_comment: Optional[str]
+    enabled: bool
+    step_id: Optional[str]
+    parent_action_id: Optional[str]
+    condition_groups: List[CompiledConditionGroup] = field(default_factory=list)
+    child_actions: List["CompiledAction"] = field(default_factory=list)
+
+    @property
+    def then_actions(self) -> List["CompiledAction"]:
+        """Get child actions for THEN branch (for CONDITIONAL type)."""
+        return [a for a in self.child_actions if a.branch == "then"]
+
+    @property
+    def else_actions(self) -> List["CompiledAction"]:
+        """Get child actions for ELSE branch (for CONDITIONAL type)."""
+        return [a for a in self.child_actions if a.branch == "else"]
+
+
+@dataclass
+class CompiledStep:
+    """Detached copy of a ToolChainStep, exposing the same attributes as the model."""
+
+    id: str
+    chain: CompiledChain
+    order: int
+    position_type: str
+    source_service: str
+    source_tool: str
+    ai_comment: Optional[str]
+    condition_groups: List[CompiledConditionGroup] = field(default_factory=list)
+    then_actions: List[CompiledAction] = field(default_factory=list)
+    else_actions: List[CompiledAction] = field(default_factory=list)
+
+
+@dataclass
+class ChainTarget:
+    """An enabled action targeting a tool, with the step it belongs to."""
+
+    action: CompiledAction
+    step: CompiledStep
+
+
+class ToolChainIndex:
+    """Compiled rule table of enabled tool chains.
+
+    Only enabled chains and enabled steps are compiled; the compiled objects
+    can be passed to the evaluation helpers in ``tool_chain_service`` in place
+    of the ORM models.
+    """
+
+    def __init__(self):
+        self._generation = 0
+        self._built_generation = -1
+        self._lock = asyncio.Lock()
+        self._rules: Dict[Tuple[str, str, int], List[CompiledStep]] = {}
+        self._steps_by_tool: Dict[Tuple[str, str], List[CompiledStep]] = {}
+        self._steps_by_chain: Dict[str, List[CompiledStep]] = {}
+        self._targets: Dict[Tuple[str, str], List[ChainTarget]] = {}
+        self._chains_count = 0
+        self._rebuilds = 0
+
+    @property
+    def generation(self) -> int:
+        """Current generation, incremented on every invalidation."""
+        return self._generation
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the compiled table reflects the current generation."""
+        return self._built_generation == self._generation
+
+    def invalidate(self, reason: Optional[str] = None) -> int:
+        """Mark the table stale so the next lookup recompiles it.
+
+        Returns:
+            The new generation number
+        """
+        self._generation += 1
+        logger.debug(f"Tool chain index invalidated (generation {self._generation}){f': {reason}' if reason else ''}")
+        return self._generation
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """Recompile the table if chain data changed since the last build."""
+        if self.is_fresh:
+            return
+
+        async with self._lock:
+            if self.is_fresh:
+                return
+            generation = self._generation
+            await self._rebuild(session)
+            self._built_generation = generation
+
+    async def _rebuild(self, session: AsyncSession) -> None:
+        """Load all chain data with flat queries and assemble the rule table."""
+
+        async def load(model):
+            # Plain rows: nothing is added to (or read from) the session identity map
+            result = await session.execute(select(model.__table__))
+            return result.all()
+
+        chains = {
+            c.id: CompiledChain(id=str(c.id), name=c.name, color=c.color, priority=c.priority or 0)
+            for c in await load(ToolChain)
+            if c.enabled
+        }
+        steps = {
+            s.id: CompiledStep(
+                id=s.id,
+                chain=chains[s.chain_id],
+                order=s.order,
+                position_type=s.position_type,
+                source_service=s.source_service,
+                source_tool=s.source_tool,
+                ai_comment=s.ai_comment,
+            )
+            for s in await load(ToolChainStep)
+            if s.enabled and s.chain_id in chains
+        }
+
+        # Condition groups and their conditions
+        groups: Dict[str, CompiledConditionGroup] = {}
+        group_rows = sorted(await load(ToolChainConditionGroup), key=lambda g: g.order)
+        for g in group_rows:
+            groups[g.id] = CompiledConditionGroup(
+                id=g.id, operator=g.operator, parent_group_id=g.parent_group_id, order=g.order
+            )
+        for c in sorted(await load(ToolChainCondition), key=lambda c: c.order):
+            group = groups.get(c.group_id)
+            if group is not None:
+                group.conditions.append(CompiledCondition(operator=c.operator, field=c.field, value=c.value))
+
+        # Actions
+        actions: Dict[str, CompiledAction] = {}
+        action_rows = sorted(await load(ToolChainAction), key=lambda a: a.order)
+        for a in action_rows:
+            actions[a.id] = CompiledAction(
+                id=a.id,
+                branch=a.branch,
+                action_type=a.action_type,
+                target_service=a.target_service,
+                target_tool=a.target_tool,
+                argument_mappings=a.argument_mappings,
+                save_to_context=a.save_to_context,
+                message_template=a.message_template,
+                order=a.order,
+                ai_comment=a.ai_comment,
+                enabled=a.enabled,
+                step_id=a.step_id,
+                parent_action_id=a.parent_action_id,
+            )
+
+        # Wire up the trees (rows are already sorted by order)
+        for g in group_rows:
+            group = groups[g.id]
+            if g.parent_group_id in groups:
+                groups[g.parent_group_id].child_groups.append(group)
+            if g.step_id in steps:
+                steps[g.step_id].condition_groups.append(group)
+            if g.action_id in actions:
+                actions[g.action_id].condition_groups.append(group)
+
+        for action in actions.values():
+            if action.parent_action_id in actions:
+                actions[action.parent_action_id].child_actions.append(action)
+            if action.step_id in steps:
+                step = steps[action.step_id]
+                (step.then_actions if action.branch == "then" else step.else_actions).append(action)
+
+        # Index steps by source tool, ordered like the former query
+        ordered_steps = sorted(steps.values(), key=lambda s: (-s.chain.priority, s.order))
+        rules: Dict[Tuple[str, str, int], List[CompiledStep]] = defaultdict(list)
+        steps_by_tool: Dict[Tuple[str, str], List[CompiledStep]] = defaultdict(list)
+        steps_by_chain: Dict[str, List[CompiledStep]] = defaultdict(list)
+        for step in ordered_steps:
+            rules[(step.source_service, step.source_tool, step.order)].append(step)
+            steps_by_tool[(step.source_service, step.source_tool)].append(step)
+            steps_by_chain[step.chain.id].append(step)
+
+        # Index enabled actions by target tool, resolving nested actions to their step
+        targets: Dict[Tuple[str, str], List[ChainTarget]] = defaultdict(list)
+        for step in ordered_steps:
+            for action in self._walk_actions(step.then_actions + step.else_actions):
+                if action.enabled and action.target_service and action.target_tool:
+                    targets[(action.target_service, action.target_tool)].append(ChainTarget(action, step))
+
+        self._rules = dict(rules)
+        self._steps_by_tool = dict(steps_by_tool)
+        self._steps_by_chain = dict(steps_by_chain)
+        self._targets = dict(targets)
+        self._chains_count = len(chains)
+        self._rebuilds += 1
+        logger.debug(
+            f"Tool chain index built: {len(chains)} chains, {len(steps)} steps, "
+            f"{len(self._steps_by_tool)} source tools, {len(self._targets)} target tools"
+        )
+
+    @staticmethod
+    def _walk_actions(actions: List[CompiledAction]):
+        """Yield actions and all their nested child actions."""
+        stack = list(reversed(actions))
+        while stack:
+            action = stack.pop()
+            yield action
+            stack.extend(reversed(action.child_actions))
+
+    def has_rules(self, service_type: str, tool_name: str) -> bool:
+        """Whether a tool is the source or the target of any enabled chain step."""
+        key = (service_type, tool_name)
+        return key in self._steps_by_tool or key in self._targets
+
+    def get_steps(self, service_type: str, tool_name: str, only_first_step: bool = True) -> List[CompiledStep]:
+        """Get enabled steps triggered by a tool, ordered by chain priority then step order."""
+        if only_first_step:
+            return self._rules.get((service_type, tool_name, 0), [])
+        return self._steps_by_tool.get((service_type, tool_name), [])
+
+    def get_targets(self, service_type: str, tool_name: str) -> List[ChainTarget]:
+        """Get enabled actions targeting a tool."""
+        return self._targets.get((service_type, tool_name), [])
+
+    def get_chain_source_step(self, chain_id: str, service_type: str, tool_name: str) -> Optional[CompiledStep]:
+        """Get the first enabled step of a chain triggered by a tool."""
+        for step in self._steps_by_chain.get(chain_id, []):
+            if step.source_service == service_type and step.source_tool == tool_name:
+                return step
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "generation": self._generation,
+            "fresh": self.is_fresh,
+            "rebuilds": self._rebuilds,
+            "chains": self._chains_count,
+            "rules": len(self._rules),
+            "source_tools": len(self._steps_by_tool),
+            "target_tools": len(self._targets),
+        }
+
+
+# Global instance
+tool_chain_index = ToolChainIndex()
+
+_PENDING_KEY = "tool_chain_index_dirty"
+
+
+def _collect_chain_changes(session: Session, flush_context) -> None:
+    """Remember that chain data was flushed until the transaction commits."""
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, TOOL_CHAIN_MODELS):
+            session.info[_PENDING_KEY] = True
+            return
+
+
+def _collect_bulk_changes(orm_execute_state) -> None:
+    """Bulk UPDATE/DELETE statements bypass the unit of work."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ in TOOL_CHAIN_MODELS:
+            orm_execute_state.session.info[_PENDING_KEY] = True
+
+
+def _apply_committed_changes(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        tool_chain_index.invalidate("chain data committed")
+
+
+def _discard_pending_changes(session: Session, previous_transaction=None) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_chain_changes)
+event.listen(Session, "do_orm_execute", _collect_bulk_changes)
+event.listen(Session, "after_commit", _apply_committed_changes)
+event.listen(Session, "after_soft_rollback", _discard_pending_changes)
@@ -7,7 +7,6 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.models.tool_chain import (
     ActionType,
@@ -19,6 +18,8 @@ from src.models.tool_chain import (
     ToolChainConditionGroup,
     ToolChainStep,
 )
+from src.services.chain_flow_store import chain_flow_store
+from src.services.tool_chain_index import tool_chain_index
 
 
 def get_nested_value(data: Any, path: str) -> Any:
@@ -639,47 +640,10 @@ async def get_matching_steps(
     Returns:
         List of action suggestions
     """
-    # Build query conditions
-    conditions = [
-        ToolChainStep.source_service == service_type,
-        ToolChainStep.source_tool == tool_name,
-        ToolChainStep.enabled == True,
-        ToolChain.enabled == True,
-    ]
-
-    if only_first_step:
-        conditions.append(ToolChainStep.order == 0)
-
-    query = (
-        select(ToolChainStep)
-        .options(
-            selectinload(ToolChainStep.condition_groups).selectinload(ToolChainConditionGroup.conditions),
-            selectinload(ToolChainStep.condition_groups).selectinload(ToolChainConditionGroup.child_groups),
-            # Load THEN actions with nested conditionals
-            selectinload(ToolChainStep.then_actions).selectinload(ToolChainAction.child_actions),
-            selectinload(ToolChainStep.then_actions)
-            .selectinload(ToolChainAction.condition_groups)
-            .selectinload(ToolChainConditionGroup.conditions),
-            selectinload(ToolChainStep.then_actions)
-            .selectinload(ToolChainAction.condition_groups)
-            .selectinload(ToolChainConditionGroup.child_groups),
-            # Load ELSE actions with nested conditionals
-            selectinload(ToolChainStep.else_actions).selectinload(ToolChainAction.child_actions),
-            selectinload(ToolChainStep.else_actions)
-            .selectinload(ToolChainAction.condition_groups)
-            .selectinload(ToolChainConditionGroup.conditions),
-            selectinload(ToolChainStep.else_actions)
-            .selectinload(ToolChainAction.condition_groups)
-            .selectinload(ToolChainConditionGroup.child_groups),
-            selectinload(ToolChainStep.chain),
-        )
-        .join(ToolChain)
-        .where(and_(*conditions))
-        .order_by(ToolChain.priority.desc(), ToolChainStep.order)
-    )
-
-    db_result = await session.execute(query)
-    steps = db_result.scalars().all()
+    await tool_chain_index.ensure_fresh(session)
+    steps = tool_chain_index.get_steps(service_type, tool_name, only_first_step)
+    if not steps:
+        return []
 
     all_suggestions = []
 
@@ -792,70 +756,22 @@ async def get_tool_chain_position(
     Returns chain context info if the tool is a target, None otherwise.
     Handles both direct actions (with step_id) and nested actions (with parent_action_id).
     """
-    # First, find all actions that target this tool (regardless of nesting level)
-    action_query = (
-        select(ToolChainAction)
-        .options(
-            selectinload(ToolChainAction.step).selectinload(ToolChainStep.chain),
-            selectinload(ToolChainAction.parent_action)
-            .selectinload(ToolChainAction.step)
-            .selectinload(ToolChainStep.chain),
-        )
-        .where(
-            and_(
-                ToolChainAction.target_service == service_type,
-                ToolChainAction.target_tool == tool_name,
-                ToolChainAction.enabled == True,
-            )
-        )
-    )
-
-    action_result = await session.execute(action_query)
-    all_actions = action_result.scalars().all()
-
-    # Filter to only enabled chains/steps by traversing up to the step
-    actions = []
-    for action in all_actions:
-        # Get the step (either direct or through parent chain)
-        step = action.step
-        if not step and action.parent_action:
-            # Nested action - traverse up to find the step
-            parent = action.parent_action
-            while parent and not parent.step:
-                parent = parent.parent_action
-            if parent:
-                step = parent.step
-
-        if step and step.enabled:
-            chain = step.chain
-            if chain and chain.enabled:
-                # Store both the action and its resolved step
-                action._resolved_step = step
-                actions.append(action)
-
-    if not actions:
+    # Enabled actions targeting this tool (at any nesting level), resolved to their step
+    await tool_chain_index.ensure_fresh(session)
+    targets = tool_chain_index.get_targets(service_type, tool_name)
+    if not targets:
         return None
 
     # This tool is an action target - determine position
     chains_info = []
 
-    for action in actions:
-        step = getattr(action, "_resolved_step", action.step)
-        if not step:
-            continue
+    for target in targets:
+        action = target.action
+        step = target.step
         chain = step.chain
 
         # Find the step that uses this tool as SOURCE (the step we're about to execute)
-        source_step_query = select(ToolChainStep).where(
-            and_(
-                ToolChainStep.chain_id == chain.id,
-                ToolChainStep.source_service == service_type,
-                ToolChainStep.source_tool == tool_name,
-                ToolChainStep.enabled == True,
-            )
-        )
-        source_step_result = await session.execute(source_step_query)
-        source_step = source_step_result.scalar()
+        source_step = tool_chain_index.get_chain_source_step(chain.id, service_type, tool_name)
 
         if source_step:
             # Use the source step's position type
@@ -868,7 +784,7 @@ async def get_tool_chain_position(
 
         chains_info.append(
             {
-                "id": str(chain.id),
+                "id": chain.id,
                 "name": chain.name,
                 "color": chain.color,
                 "position": pos,
@@ -878,9 +794,6 @@ async def get_tool_chain_position(
             }
         )
 
-    if not chains_info:
-        return None
-
     # Use the first chain's position
     primary = chains_info[0]
     step_number = primary["previous_step_order"] + 2  # Next step number
@@ -902,10 +815,12 @@ async def check_recent_chain_flow(
     user_id: Optional[str] = None,
     time_window_seconds: int = 300,
 ) -> Optional[Dict[str, Any]]:
-    """Check if this tool was called as part of a chain flow by looking at recent history.
+    """Check if this tool was suggested by a previous tool of the same user/session.
 
-    Looks at the most recent MCP request FROM THE SAME USER/SESSION to see if it
-    was a tool that has this tool as an action target in a chain step.
+    Pending suggestions are recorded in the chain flow store when a result is
+    enriched and consumed here. When history fallback is enabled, callers the
+    store knows nothing about (e.g. right after a restart) are looked up in
+    recent MCP request history instead.
 
     Args:
         session: Database session
@@ -920,6 +835,23 @@ async def check_recent_chain_flow(
         Includes 'save_to_context' from the action that suggested this tool,
         and 'previous_result' to extract values from.
     """
+    chain_flow = chain_flow_store.consume(
+        tool_name, session_id=session_id, user_id=user_id, time_window_seconds=time_window_seconds
+    )
+    if chain_flow or not chain_flow_store.history_fallback or chain_flow_store.knows(session_id, user_id):
+        return chain_flow
+
+    return await _scan_recent_chain_history(session, tool_name, session_id, user_id, time_window_seconds)
+
+
+async def _scan_recent_chain_history(
+    session: AsyncSession,
+    tool_name: str,
+    session_id: Optional[str],
+    user_id: Optional[str],
+    time_window_seconds: int,
+) -> Optional[Dict[str, Any]]:
+    """Look for a recent MCP request FROM THE SAME USER/SESSION that suggested this tool."""
     from datetime import datetime, timedelta
 
     from src.models.mcp_request import McpRequest, McpRequestStatus
@@ -989,12 +921,12 @@ async def enrich_tool_result_with_chains(
     chain suggestions to the response.
 
     Chain flow detection (automatic):
-    - Checks recent MCP history to see if the previous tool suggested this one
+    - Checks the chain flow store to see if a previous tool suggested this one
     - If yes, this tool is part of a chain flow (middle or end position)
     - If not, only first steps (order=0) are evaluated
 
     Multi-user support:
-    - Uses session_id or user_id to filter history
+    - Uses session_id or user_id to scope chain flow state
 
     Args:
         session: Database session
@@ -1036,6 +968,11 @@ async def enrich_tool_result_with_chains(
     success = result.get("success", False)
 
     try:
+        # Fast path: the tool is neither the source nor the target of any chain step
+        await tool_chain_index.ensure_fresh(session)
+        if not tool_chain_index.has_rules(service_type, tool_name):
+            return result
+
         # Check if this tool is part of a chain flow
         chain_flow = await check_recent_chain_flow(
             session, service_type, tool_name, session_id=session_id, user_id=user_id
@@ -1134,6 +1071,9 @@ async def enrich_tool_result_with_chains(
                     result.update(next_block)
                     logger.info(f"Added {len(suggestions)} action suggestions to '{tool_name}' result")
 
+        # Remember the suggestions so the next call can detect the chain flow
+        chain_flow_store.record(tool_name, result, session_id=session_id, user_id=user_id)
+
     except Exception as e:
         logger.error(f"Error evaluating tool chains for '{tool_name}': {e}")
 
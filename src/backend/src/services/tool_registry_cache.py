@@ -0,0 +1,158 @@
+"""Process-wide cache for the MCP tool registry.
+
+Building a ToolRegistry requires loading every enabled ServiceConfig and
+instantiating each tool class. The registry only changes when services are
+created, updated, enabled, disabled or imported, so it is built once and
+rebuilt lazily after an explicit invalidation.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..mcp.tools.audiobookshelf_tools import AudiobookshelfTools
+from ..mcp.tools.authentik_tools import AuthentikTools
+from ..mcp.tools.base import BaseTool, ToolRegistry
+from ..mcp.tools.deluge_tools import DelugeTools
+from ..mcp.tools.jackett_tools import JackettTools
+from ..mcp.tools.komga_tools import KomgaTools
+from ..mcp.tools.openwebui_tools import OpenWebUITools
+from ..mcp.tools.overseerr_tools import OverseerrTools
+from ..mcp.tools.plex_tools import PlexTools
+from ..mcp.tools.prowlarr_tools import ProwlarrTools
+from ..mcp.tools.radarr_tools import RadarrTools
+from ..mcp.tools.romm_tools import RommTools
+from ..mcp.tools.sonarr_tools import SonarrTools
+from ..mcp.tools.system_tools import SystemTools
+from ..mcp.tools.tautulli_tools import TautulliTools
+from ..mcp.tools.wikijs_tools import WikiJSTools
+from ..mcp.tools.zammad_tools import ZammadTools
+from ..models.service_config import ServiceConfig
+
+logger = logging.getLogger(__name__)
+
+# Service type to tools class mapping (registration order is preserved)
+SERVICE_TOOL_CLASSES: Dict[str, Type[BaseTool]] = {
+    "plex": PlexTools,
+    "overseerr": OverseerrTools,
+    "zammad": ZammadTools,
+    "tautulli": TautulliTools,
+    "openwebui": OpenWebUITools,
+    "romm": RommTools,
+    "komga": KomgaTools,
+    "radarr": RadarrTools,
+    "sonarr": SonarrTools,
+    "prowlarr": ProwlarrTools,
+    "jackett": JackettTools,
+    "deluge": DelugeTools,
+    "authentik": AuthentikTools,
+    "audiobookshelf": AudiobookshelfTools,
+    "wikijs": WikiJSTools,
+}
+
+
+def build_tool_config(service: ServiceConfig) -> Dict[str, Any]:
+    """Build the tool configuration dict for a service."""
+    # Construct full URL with port if specified
+    base_url = service.base_url
+    if service.port:
+        # Remove trailing slash if present
+        base_url = base_url.rstrip("/")
+        base_url = f"{base_url}:{service.port}"
+    return {
+        "id": service.id,
+        "base_url": base_url,
+        "external_url": service.external_url,  # Public URL for user-facing links
+        "api_key": service.api_key,
+        "username": service.username,
+        "password": service.password,
+        "config": service.config or {},
+    }
+
+
+def build_tool_registry(services: Iterable[ServiceConfig]) -> ToolRegistry:
+    """Build a tool registry for the given enabled services."""
+    configs_by_type = {}
+    for service in services:
+        configs_by_type[service.service_type.lower()] = build_tool_config(service)
+
+    registry = ToolRegistry()
+    registry.register(SystemTools)
+
+    for service_type, tool_class in SERVICE_TOOL_CLASSES.items():
+        if service_type in configs_by_type:
+            registry.register(tool_class, configs_by_type[service_type])
+
+    return registry
+
+
+class ToolRegistryCache:
+    """Long-lived ToolRegistry rebuilt only after invalidation."""
+
+    def __init__(self):
+        self._registry: Optional[ToolRegistry] = None
+        self._generation: int = 0
+        self._built_generation: int = -1
+        self._enabled_services: List[str] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Current generation, incremented on every invalidation."""
+        return self._generation
+
+    @property
+    def is_built(self) -> bool:
+        """Whether a registry for the current generation is available."""
+        return self._registry is not None and self._built_generation == self._generation
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        """Get current cache status."""
+        return {
+            "generation": self._generation,
+            "built": self.is_built,
+            "enabled_services": list(self._enabled_services),
+            "tools_count": len(self._registry.tools) if self._registry else 0,
+        }
+
+    async def get(self, session: AsyncSession) -> ToolRegistry:
+        """Get the cached registry, rebuilding it if it was invalidated."""
+        if self.is_built:
+            return self._registry
+
+        async with self._lock:
+            # Another caller may have rebuilt while we were waiting
+            if self.is_built:
+                return self._registry
+
+            generation = self._generation
+            result = await session.execute(select(ServiceConfig).where(ServiceConfig.enabled == True))
+            services = result.scalars().all()
+            registry = build_tool_registry(services)
+
+            self._registry = registry
+            self._built_generation = generation
+            self._enabled_services = sorted({s.service_type.lower() for s in services})
+            logger.info(
+                f"Tool registry built (generation {generation}): "
+                f"{len(registry.tools)} tools for {len(self._enabled_services)} services"
+            )
+            return registry
+
+    def invalidate(self, reason: Optional[str] = None) -> int:
+        """Invalidate the cached registry so the next access rebuilds it.
+
+        Returns:
+            The new generation number
+        """
+        self._generation += 1
+        logger.info(f"Tool registry invalidated (generation {self._generation}){f': {reason}' if reason else ''}")
+        return self._generation
+
+
+# Global instance
+tool_registry_cache = ToolRegistryCache()
@@ -495,9 +495,8 @@ class UserMappingDetector:
                 if not test_result.success:
                     return {"success": False, "error": f"Authentik connection failed: {test_result.message}"}
 
-                # Get all users
-                users_data = await adapter.get_users(page_size=200)
-                users = users_data.get("users", [])
+                # Get all users, page by page
+                users = [user async for user in adapter.iter_users(page_size=200)]
 
                 return {"success": True, "users": users}
 
@@ -585,15 +584,8 @@ class UserMappingDetector:
             List of users from the service
         """
         try:
-            if hasattr(adapter, "get_users"):
-                users = await adapter.get_users()
-                if isinstance(users, list):
-                    return users
-                elif isinstance(users, dict) and "users" in users:
-                    return users["users"]
-
-            # If no user enumeration is available, return empty list
-            return []
+            # Paginated services are enumerated completely; no enumeration yields an empty list
+            return [user async for user in adapter.iter_users()]
 
         except Exception as e:
             logger.warning(f"Could not get users from service: {e}")
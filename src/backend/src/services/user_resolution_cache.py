@@ -0,0 +1,145 @@
+"""Cache for Open WebUI user resolution and central user mapping.
+
+Every tool call coming from Open WebUI resolves the calling user through the
+Open WebUI API and then looks up the matching central user. Both answers are
+stable for the lifetime of a session token, so they are cached in memory and
+invalidated whenever user mappings change.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.user_mapping import UserMapping
+from ..utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Fallback (JWT id only) resolutions are retried sooner
+FALLBACK_TTL_SECONDS = 30.0
+
+_NOT_FOUND = object()
+
+
+class UserResolutionCache:
+    """TTL caches for resolved Open WebUI users and their central user ids."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self._users: TTLCache[Dict[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._central_ids: TTLCache[Optional[str]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._invalidations = 0
+
+    def configure(self, maxsize: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        """Update cache size and default TTL."""
+        for cache in (self._users, self._central_ids):
+            if maxsize is not None:
+                cache.maxsize = maxsize
+            if ttl is not None:
+                cache.ttl = ttl
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        """Build a cache key for a session token.
+
+        The key is a hash of the whole token, so the raw token is never kept in
+        memory. JWT claims are not used: they are decoded without verifying the
+        signature, so a forged token could copy them.
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get_user(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached resolved user."""
+        user = self._users.get(key)
+        return dict(user) if user is not None else None
+
+    def set_user(
+        self,
+        key: str,
+        user: Dict[str, Any],
+        expires_at: Optional[float] = None,
+        fallback: bool = False,
+    ) -> None:
+        """Cache a resolved user.
+
+        Args:
+            key: Key from ``token_key``
+            user: Resolved user info
+            expires_at: Token expiry (unix timestamp); the entry never outlives it
+            fallback: Whether this is a degraded JWT-only resolution
+        """
+        ttl = FALLBACK_TTL_SECONDS if fallback else self._users.ttl
+        if expires_at:
+            ttl = min(ttl, expires_at - time.time())
+        self._users.set(key, dict(user), ttl=ttl)
+
+    async def get_central_user_id(self, session: AsyncSession, openwebui_user: Dict[str, Any]) -> Optional[str]:
+        """Find the central user id mapped to an Open WebUI user.
+
+        Looks up by email first, then by Open WebUI user id. Negative results
+        are cached too.
+        """
+        email = openwebui_user.get("email")
+        user_id = openwebui_user.get("id")
+        key = (email, user_id)
+
+        cached = self._central_ids.get(key, _NOT_FOUND)
+        if cached is not _NOT_FOUND:
+            return cached
+
+        central_user_id = None
+
+        # First try by email
+        if email:
+            result = await session.execute(
+                select(UserMapping.central_user_id).where(UserMapping.central_email == email).limit(1)
+            )
+            row = result.first()
+            if row:
+                central_user_id = row[0]
+
+        # If no mapping found by email, try by Open WebUI user ID
+        if not central_user_id and user_id:
+            result = await session.execute(
+                select(UserMapping.central_user_id).where(UserMapping.service_user_id == user_id).limit(1)
+            )
+            row = result.first()
+            if row:
+                central_user_id = row[0]
+
+        self._central_ids.set(key, central_user_id)
+        return central_user_id
+
+    def invalidate_mappings(self) -> None:
+        """Drop cached central user ids after user mappings changed."""
+        self._central_ids.clear()
+        self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._users.clear()
+        self.invalidate_mappings()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "users": self._users.get_stats(),
+            "central_user_ids": self._central_ids.get_stats(),
+            "mapping_invalidations": self._invalidations,
+        }
+
+
+# Global instance
+user_resolution_cache = UserResolutionCache()
+
+
+def _on_user_mapping_change(mapper, connection, target) -> None:
+    """Invalidate cached central user ids whenever a mapping row is written."""
+    user_resolution_cache.invalidate_mappings()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(UserMapping, _event_name, _on_user_mapping_change)
@@ -5,6 +5,7 @@ homelab services, ensuring consistent user management across the system.
 """
 
 import logging
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -281,12 +282,16 @@ class UserSyncService:
             # For now, we just verify the user exists in the target service
 
             if hasattr(adapter, "get_users"):
-                users = await adapter.get_users()
-                # Try to find the user by username or email
-                user_found = any(
-                    user.get("username") == mapping.service_username or user.get("email") == mapping.service_email
-                    for user in users
-                )
+                # Try to find the user by username or email, stopping at the first match
+                user_found = False
+                async with aclosing(adapter.iter_users()) as users:
+                    async for user in users:
+                        if (
+                            user.get("username") == mapping.service_username
+                            or user.get("email") == mapping.service_email
+                        ):
+                            user_found = True
+                            break
 
                 if user_found:
                     if mapping.status == MappingStatus.PENDING:
@@ -423,19 +428,17 @@ class UserSyncService:
                 if not test_result.success:
                     return {"success": False, "error": f"Authentik connection failed: {test_result.message}"}
 
-                # Get all users from Authentik
-                users_data = await adapter.get_users(page_size=100)
-                users = users_data.get("users", [])
-
                 # Find existing mappings
                 existing_mappings = await db.execute(
                     select(UserMapping).where(UserMapping.service_config_id == authentik_service_id)
                 )
                 existing_users = {mapping.service_user_id for mapping in existing_mappings.scalars().all()}
 
-                # Create suggestions for unmapped users
+                # Stream every Authentik user and create suggestions for unmapped ones
+                total_users = 0
                 suggestions = []
-                for user in users:
+                async for user in adapter.iter_users(page_size=100):
+                    total_users += 1
                     user_id = str(user.get("pk"))
                     if user_id not in existing_users:
                         suggestions.append(
@@ -452,7 +455,7 @@ class UserSyncService:
 
                 return {
                     "success": True,
-                    "total_users": len(users),
+                    "total_users": total_users,
                     "existing_mappings": len(existing_users),
                     "new_suggestions": len(suggestions),
                     "user_suggestions": suggestions,
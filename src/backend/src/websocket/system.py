@@ -129,7 +129,7 @@ class SystemWebSocketHandler:
                         "disk_percent": system_status.get("disk_percent", 0),
                         "network_sent_mb": system_status.get("network_sent_mb", 0),
                         "network_recv_mb": system_status.get("network_recv_mb", 0),
-                        "load_average": [0.1, 0.2, 0.15],  # Mock data
+                        "load_average": system_status.get("load_average", [0.0, 0.0, 0.0]),
                     }
 
                 if "docker" in metrics_types:
@@ -140,6 +140,7 @@ class SystemWebSocketHandler:
                         "containers_paused": docker_status.get("containers_paused", 0),
                         "images_count": docker_status.get("images_count", 0),
                         "volumes_count": docker_status.get("volumes_count", 0),
+                        "containers": docker_status.get("containers", []),
                     }
 
                 if "services" in metrics_types:
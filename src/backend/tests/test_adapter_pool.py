@@ -0,0 +1,118 @@
+"""Tests for the shared HTTP client and adapter pools."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.adapters import base as base_module
+from src.adapters import pool as pool_module
+from src.adapters.pool import AdapterPool, HttpClientPool
+from src.adapters.sonarr import SonarrAdapter
+from src.routers import mcp as mcp_router
+from src.services import tool_chain_service
+
+
+def make_config(service_id: str, api_key: str = "key") -> SimpleNamespace:
+    return SimpleNamespace(id=service_id, base_url="http://sonarr:8989", port=None, api_key=api_key, config={})
+
+
+@pytest.mark.asyncio
+async def test_release_service_retires_only_that_service():
+    """Releasing a service retires its clients and leaves other services pooled."""
+    clients = HttpClientPool()
+    first = clients.get_client("svc-1", "hash")
+    other = clients.get_client("svc-2", "hash")
+
+    assert clients.release_service("svc-1") == 1
+    assert clients.get_client("svc-1", "hash") is not first
+    assert clients.get_client("svc-2", "hash") is other
+    assert clients.get_stats()["retired"] == 1
+
+    await clients.close_all()
+    assert first.is_closed and other.is_closed
+
+
+@pytest.mark.asyncio
+async def test_reaped_clients_are_closed_and_awaited(monkeypatch):
+    """Clients past their grace period are closed by referenced tasks that close_all awaits."""
+    monkeypatch.setattr(pool_module, "RETIRE_GRACE_SECONDS", 0.0)
+    clients = HttpClientPool()
+    retired = clients.get_client("svc-1", "old")
+    clients.release_service("svc-1")
+
+    # Reaping happens on the next checkout
+    clients.get_client("svc-1", "new")
+    assert clients.get_stats()["closing"] == 1
+
+    await clients.close_all()
+    assert retired.is_closed
+    assert clients.get_stats()["closing"] == 0
+
+
+@pytest.mark.asyncio
+async def test_adapter_pool_release_service_drops_adapters_and_clients(monkeypatch):
+    """A config change drops the service's pooled adapters and retires its clients."""
+    clients = HttpClientPool()
+    monkeypatch.setattr(pool_module, "http_client_pool", clients)
+    monkeypatch.setattr(base_module, "http_client_pool", clients)
+    adapters = AdapterPool()
+
+    adapter = adapters.get(SonarrAdapter, make_config("svc-1"))
+    kept = adapters.get(SonarrAdapter, make_config("svc-2"))
+    await adapter._ensure_client()
+
+    assert adapters.release_service("svc-1") == 1
+    assert adapters.get(SonarrAdapter, make_config("svc-1")) is not adapter
+    assert adapters.get(SonarrAdapter, make_config("svc-2")) is kept
+    assert clients.get_stats()["retired"] == 1
+
+    await clients.close_all()
+
+
+@pytest.mark.asyncio
+async def test_tool_test_endpoint_adapters_are_released_with_their_service(monkeypatch):
+    """Adapters created by the test-tool endpoint are pooled under the service id."""
+    clients = HttpClientPool()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"id": 1, "path": "/movies", "freeSpace": 1024, "accessible": True}])
+
+    def get_client(service_key, config_hash, **client_kwargs):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client_kwargs["base_url"])
+
+    monkeypatch.setattr(clients, "get_client", get_client)
+    monkeypatch.setattr(pool_module, "http_client_pool", clients)
+    monkeypatch.setattr(base_module, "http_client_pool", clients)
+    adapters = AdapterPool()
+    monkeypatch.setattr(pool_module, "adapter_pool", adapters)
+
+    async def enrich(session, tool_name, result, input_params=None, session_id=None):
+        return result
+
+    monkeypatch.setattr(tool_chain_service, "enrich_tool_result_with_chains", enrich)
+    service = SimpleNamespace(
+        id="radarr-1",
+        service_type="radarr",
+        base_url="http://radarr",
+        port=7878,
+        external_url=None,
+        api_key="key",
+        username=None,
+        password=None,
+        config={},
+    )
+    session = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [service]
+
+    async def execute(statement):
+        return result
+
+    session.execute = execute
+
+    response = await mcp_router.test_tool(mcp_router.ToolTestRequest(tool_name="radarr_get_root_folders"), session)
+
+    assert response.success
+    assert adapters.release_service("radarr-1") == 1
@@ -0,0 +1,148 @@
+"""Tests for service circuit breakers."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from src.mcp.tools.base import BaseTool, ToolDefinition, ToolRegistry
+from src.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    CircuitState,
+    circuit_bypass,
+    circuit_manager,
+    get_service_breaker,
+)
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    config = CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60, success_threshold=1, timeout=None)
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return CircuitBreaker("test", config)
+
+
+async def fail() -> None:
+    raise ConnectionError("service down")
+
+
+@pytest.mark.asyncio
+async def test_half_open_lets_a_limited_number_of_probes_through():
+    """While half-open, calls beyond half_open_max_calls are rejected until a probe finishes."""
+    breaker = make_breaker(half_open_max_calls=1)
+    breaker.state = CircuitState.HALF_OPEN
+    release = asyncio.Event()
+
+    async def probe() -> str:
+        await release.wait()
+        return "ok"
+
+    first = asyncio.create_task(breaker.call(probe))
+    await asyncio.sleep(0)
+    assert breaker.is_rejecting()
+    with pytest.raises(CircuitBreakerError) as rejected:
+        await breaker.call(probe)
+    assert rejected.value.state == CircuitState.HALF_OPEN
+
+    release.set()
+    assert await first == "ok"
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.get_stats()["half_open_calls"] == 0
+    assert breaker.rejected_count == 1
+
+
+@pytest.mark.asyncio
+async def test_record_health_moves_breaker_between_states():
+    """Health checks open a failing breaker, half-open it when they pass and keep it open when they fail."""
+    breaker = make_breaker()
+
+    await breaker.record_health(False)
+    await breaker.record_health(False)
+    assert breaker.state == CircuitState.OPEN
+
+    opened_at = breaker.last_failure_time
+    await asyncio.sleep(0.001)
+    await breaker.record_health(False)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.last_failure_time > opened_at
+
+    await breaker.record_health(True)
+    assert breaker.state == CircuitState.HALF_OPEN
+    await breaker.record_health(True)
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_bypass_reaches_the_service_without_recording():
+    """Calls made under circuit_bypass go through an open breaker and leave it untouched."""
+    breaker = make_breaker()
+    await breaker.force_open()
+
+    async def succeed() -> str:
+        return "ok"
+
+    with pytest.raises(CircuitBreakerError):
+        await breaker.call(succeed)
+
+    with circuit_bypass():
+        assert not breaker.is_rejecting()
+        assert await breaker.call(succeed) == "ok"
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.call_count == 0
+    assert breaker.is_rejecting()
+
+
+class FakeRadarrTools(BaseTool):
+    """Records executions instead of calling Radarr."""
+
+    def __init__(self, service_config=None):
+        super().__init__(service_config)
+        self.calls: List[str] = []
+
+    @property
+    def definitions(self) -> List[ToolDefinition]:
+        return [
+            ToolDefinition(
+                name="radarr_fake_lookup",
+                description="Fake lookup",
+                parameters=[],
+                category="media",
+                is_mutation=True,
+                requires_service="radarr",
+            )
+        ]
+
+    async def execute(self, tool_name: str, arguments: dict) -> dict:
+        self.calls.append(tool_name)
+        return {"success": True, "result": "called"}
+
+
+@pytest.mark.asyncio
+async def test_tool_of_open_service_fails_fast_with_circuit_open():
+    """A tool fails fast when the adapter breaker (named with the separate port) is open."""
+    registry = ToolRegistry()
+    registry.register(FakeRadarrTools, {"base_url": "http://radarr", "port": 7878, "api_key": "key"})
+    tool = registry.get_tool("radarr_fake_lookup")
+    # The adapter appends the separately configured port to the base URL
+    breaker = get_service_breaker("radarr", "http://radarr:7878")
+    try:
+        await breaker.force_open()
+
+        result = await registry.execute("radarr_fake_lookup", {})
+
+        assert result["success"] is False
+        assert result["error_type"] == "circuit_open"
+        assert result["circuit"] == "radarr:http://radarr:7878"
+        assert result["retry_after"] > 0
+        assert tool.calls == []
+
+        await breaker.reset()
+        assert (await registry.execute("radarr_fake_lookup", {}))["success"]
+        assert tool.calls == ["radarr_fake_lookup"]
+    finally:
+        circuit_manager.remove_breaker(breaker.name)
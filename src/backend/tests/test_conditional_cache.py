@@ -0,0 +1,77 @@
+"""Tests for conditional GET revalidation in service adapters."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.adapters import base as base_module
+from src.adapters.conditional_cache import conditional_response_cache
+from src.adapters.sonarr import SonarrAdapter
+
+
+@pytest.fixture
+def sonarr_upstream(monkeypatch):
+    """Serve a Sonarr endpoint with an ETag and record the validators of each request."""
+    state = {"requests": [], "evict_on_revalidation": False}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validator = request.headers.get("if-none-match")
+        state["requests"].append(validator)
+        if validator == '"v1"':
+            if state["evict_on_revalidation"]:
+                conditional_response_cache.clear()
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"version": "4.0"}, headers={"ETag": '"v1"'})
+
+    def get_client(service_key, config_hash, **client_kwargs):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client_kwargs["base_url"])
+
+    monkeypatch.setattr(base_module.http_client_pool, "get_client", get_client)
+    conditional_response_cache.clear()
+    yield state
+    conditional_response_cache.clear()
+
+
+def make_adapter() -> SonarrAdapter:
+    config = SimpleNamespace(id="sonarr-1", base_url="http://sonarr:8989", port=None, api_key="key", config={})
+    return SonarrAdapter(config)
+
+
+@pytest.mark.asyncio
+async def test_not_modified_is_served_from_the_stored_response(sonarr_upstream):
+    """A 304 answer to a revalidated GET returns the stored body."""
+    adapter = make_adapter()
+
+    await adapter._make_request("GET", "/api/v3/system/status")
+    response = await adapter._make_request("GET", "/api/v3/system/status")
+
+    assert response.json() == {"version": "4.0"}
+    assert sonarr_upstream["requests"] == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_not_modified_after_eviction_is_retried_without_validators(sonarr_upstream):
+    """A 304 for a response evicted while the request was in flight triggers a plain GET."""
+    adapter = make_adapter()
+    await adapter._make_request("GET", "/api/v3/system/status")
+    sonarr_upstream["evict_on_revalidation"] = True
+
+    response = await adapter._make_request("GET", "/api/v3/system/status")
+
+    assert response.status_code == 200
+    assert response.json() == {"version": "4.0"}
+    assert sonarr_upstream["requests"] == [None, '"v1"', None]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_only_the_service_responses(sonarr_upstream):
+    """Invalidating a service by id makes its next GET unconditional."""
+    adapter = make_adapter()
+    await adapter._make_request("GET", "/api/v3/system/status")
+
+    assert conditional_response_cache.invalidate("other-service") == 0
+    assert conditional_response_cache.invalidate("sonarr-1") == 1
+
+    await adapter._make_request("GET", "/api/v3/system/status")
+    assert sonarr_upstream["requests"] == [None, None]
@@ -0,0 +1,173 @@
+"""Tests for the health check scheduler loop."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.adapters.base import ConnectionTestResult
+from src.services import health_scheduler as scheduler_module
+from src.services.health_scheduler import HealthCheckScheduler, ServiceSchedule
+
+
+class CountingSession:
+    """Async session stub returning the given services and counting queries."""
+
+    def __init__(self, counter, services=()):
+        self._counter = counter
+        self._services = list(services)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self._counter["queries"] += 1
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = self._services
+        return result
+
+
+@pytest.mark.asyncio
+async def test_scheduler_without_services_does_not_spin(monkeypatch):
+    """With no enabled services the scheduler loads them once, then sleeps."""
+    counter = {"queries": 0}
+    db_manager = MagicMock()
+    db_manager.session_factory = lambda: CountingSession(counter)
+    monkeypatch.setattr(scheduler_module, "get_db_manager", lambda: db_manager)
+
+    scheduler = HealthCheckScheduler()
+    await scheduler.start(interval_minutes=15)
+    await asyncio.sleep(0.5)
+    await scheduler.stop()
+
+    assert counter["queries"] == 1
+
+
+class FakeClock:
+    """Monotonic clock of the scheduler module, moved by hand."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(scheduler_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def checked(monkeypatch):
+    """Replace the service tester and result recording; collect the ids of checked services."""
+    ids = []
+
+    async def test_service_connection(service):
+        ids.append(service.id)
+        return ConnectionTestResult(success=True)
+
+    monkeypatch.setattr(
+        scheduler_module,
+        "ServiceTester",
+        SimpleNamespace(test_service_connection=test_service_connection, get_adapter_for_service=lambda s: None),
+    )
+    monkeypatch.setattr(HealthCheckScheduler, "_record_results", lambda self, results: asyncio.sleep(0))
+    return ids
+
+
+def make_scheduler(monkeypatch, services, max_probes_per_minute: int) -> HealthCheckScheduler:
+    db_manager = MagicMock()
+    db_manager.session_factory = lambda: CountingSession({"queries": 0}, services)
+    monkeypatch.setattr(scheduler_module, "get_db_manager", lambda: db_manager)
+    scheduler = HealthCheckScheduler()
+    scheduler.configure(max_probes_per_minute=max_probes_per_minute)
+    return scheduler
+
+
+def make_schedule(due_at: float, results=()) -> ServiceSchedule:
+    schedule = ServiceSchedule(due_at=due_at, interval=900.0)
+    for success in results:
+        schedule.record(success)
+    return schedule
+
+
+def test_adaptive_interval_grows_and_shrinks_within_caps():
+    """Healthy streaks double the interval up to the cap; failing and flapping services shrink it."""
+    scheduler = HealthCheckScheduler()
+    scheduler._interval_minutes = 15
+    base = 900.0
+    schedule = make_schedule(0.0)
+
+    intervals = []
+    for _ in range(40):
+        schedule.record(True)
+        intervals.append(scheduler._adaptive_interval(schedule))
+    assert intervals[scheduler_module.STABLE_STREAK - 2] == base
+    assert intervals[scheduler_module.STABLE_STREAK - 1] == base * 2
+    assert intervals[2 * scheduler_module.STABLE_STREAK - 1] == base * 4
+    assert max(intervals) == base * scheduler_module.MAX_STABLE_INTERVAL_FACTOR
+
+    schedule.record(False)
+    assert scheduler._adaptive_interval(schedule) == base * scheduler_module.FAILING_INTERVAL_FACTOR
+
+    flapping = make_schedule(0.0, [True, False, True, False, True])
+    assert flapping.state == "flapping"
+    assert scheduler._adaptive_interval(flapping) == base * scheduler_module.FLAPPING_INTERVAL_FACTOR
+
+    # Shrinking never goes below the floor, nor above a shorter configured interval
+    scheduler._interval_minutes = 2
+    assert scheduler._adaptive_interval(make_schedule(0.0, [False])) == scheduler_module.MIN_INTERVAL_SECONDS
+    scheduler._interval_minutes = 0.5
+    assert scheduler._adaptive_interval(make_schedule(0.0, [False])) == 30.0
+
+
+@pytest.mark.asyncio
+async def test_failing_and_flapping_services_are_checked_first(monkeypatch, clock, checked):
+    """With a short probe budget, failing and flapping services are checked before the others."""
+    services = [SimpleNamespace(id=name, name=name) for name in ("stable", "unknown", "failing", "flapping")]
+    scheduler = make_scheduler(monkeypatch, services, max_probes_per_minute=2)
+    scheduler._schedules = {
+        "stable": make_schedule(clock.now - 40, [True] * 8),
+        "unknown": make_schedule(clock.now - 30),
+        "failing": make_schedule(clock.now - 10, [True, False]),
+        "flapping": make_schedule(clock.now - 20, [True, False, True, False, True]),
+    }
+
+    await scheduler._run_due_checks()
+
+    assert checked == ["flapping", "failing"]
+    assert scheduler._schedules["unknown"].due_at == clock.now + 30
+    assert scheduler._schedules["stable"].due_at == clock.now + 60
+
+
+@pytest.mark.asyncio
+async def test_postponed_checks_are_spaced_by_the_probe_rate(monkeypatch, clock, checked):
+    """Checks over the probe budget are postponed one probe interval apart, then run as tokens refill."""
+    services = [SimpleNamespace(id=f"svc-{index}", name=f"svc-{index}") for index in range(15)]
+    scheduler = make_scheduler(monkeypatch, services, max_probes_per_minute=10)
+    scheduler._schedules = {
+        service.id: make_schedule(clock.now - 100 + index) for index, service in enumerate(services)
+    }
+
+    await scheduler._run_due_checks()
+
+    assert checked == [f"svc-{index}" for index in range(10)]
+    seconds_per_probe = 60 / 10
+    postponed = [scheduler._schedules[f"svc-{index}"].due_at for index in range(10, 15)]
+    assert postponed == [clock.now + position * seconds_per_probe for position in range(1, 6)]
+
+    # One probe interval later, one token has been refilled for the first postponed check
+    start = clock.now
+    clock.now += seconds_per_probe
+    await scheduler._run_due_checks()
+    assert checked[10:] == ["svc-10"]
+    assert [scheduler._schedules[f"svc-{index}"].due_at for index in range(11, 15)] == [
+        start + position * seconds_per_probe for position in range(2, 6)
+    ]
@@ -0,0 +1,49 @@
+"""Tests for the write-behind MCP audit writer."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.database import connection as connection_module
+from src.models import McpRequest
+from src.services import mcp_audit_writer as writer_module
+from src.services.mcp_audit_writer import McpAuditWriter
+
+
+@pytest_asyncio.fixture
+async def audit_sessions(monkeypatch):
+    """Point the writer at an in-memory database holding the mcp_requests table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(McpRequest.__table__.create)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(connection_module, "get_async_session_maker", lambda: session_maker)
+    yield session_maker
+    await engine.dispose()
+
+
+async def count_requests(session_maker) -> int:
+    async with session_maker() as session:
+        return await session.scalar(select(func.count()).select_from(McpRequest))
+
+
+@pytest.mark.asyncio
+async def test_only_the_bad_record_is_dropped_after_the_last_attempt(audit_sessions):
+    """A record that keeps failing its batch is isolated; the rest of the batch is written."""
+    writer = McpAuditWriter(flush_interval=0.01)
+    for index in range(4):
+        await writer.add(McpRequest(tool_name=f"tool_{index}"))
+    # Violates NOT NULL, so every bulk insert of the batch fails
+    bad_id = await writer.add(McpRequest(tool_name=None))
+
+    # Stopping drains the buffer through every retry of the batch
+    await writer.stop()
+
+    assert await count_requests(audit_sessions) == 4
+    stats = writer.get_stats()
+    assert stats["failed_batches"] == writer_module.MAX_FLUSH_ATTEMPTS
+    assert stats["written"] == 4
+    assert stats["queued"] == 0
+    assert stats["dropped"] == 1
+    assert bad_id in writer._dropped_ids
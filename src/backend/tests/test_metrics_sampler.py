@@ -0,0 +1,47 @@
+"""Tests for the background system metrics sampler."""
+
+import pytest
+
+from src.services import metrics_sampler as sampler_module
+from src.services.metrics_sampler import SystemMetricsSampler
+
+
+@pytest.fixture
+def cpu_windows(monkeypatch):
+    """Record the measurement window of each CPU reading."""
+    windows = []
+
+    def cpu_percent(interval=None):
+        windows.append(interval)
+        return 12.5
+
+    monkeypatch.setattr(sampler_module.psutil, "cpu_percent", cpu_percent)
+    return windows
+
+
+@pytest.mark.asyncio
+async def test_on_demand_sample_measures_a_cpu_window(cpu_windows):
+    """Without the background task, CPU usage is measured over a real window."""
+    sampler = SystemMetricsSampler(interval=0.0)
+
+    first = await sampler.get_latest()
+    second = await sampler.get_latest()
+
+    assert first["cpu_percent"] == second["cpu_percent"] == 12.5
+    assert cpu_windows == [sampler_module.ON_DEMAND_CPU_WINDOW] * 2
+
+
+@pytest.mark.asyncio
+async def test_background_samples_use_the_previous_reading(cpu_windows):
+    """Once the background task has a sample, readings cover the time since the previous one."""
+    sampler = SystemMetricsSampler(interval=60.0)
+    sampler.start()
+    try:
+        await sampler.sample()
+        await sampler.sample()
+    finally:
+        await sampler.stop()
+
+    # Only the first sample has no previous reading to measure from
+    assert cpu_windows[0] == sampler_module.ON_DEMAND_CPU_WINDOW
+    assert cpu_windows[-1] is None
@@ -0,0 +1,157 @@
+"""Tests for the prefetching page iterator."""
+
+import asyncio
+from contextlib import aclosing
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.adapters import base as base_module
+from src.adapters import pool as pool_module
+from src.adapters.pagination import Page, iter_pages
+from src.adapters.romm import RommAdapter
+
+
+class FakeCollection:
+    """Serves a collection of integers page by page and records the fetches."""
+
+    def __init__(self, size: int, page_size: int, report_total: bool = True, delay: float = 0.0):
+        self.size = size
+        self.page_size = page_size
+        self.report_total = report_total
+        self.delay = delay
+        self.started = []
+        self.completed = []
+
+    async def fetch_page(self, index: int) -> Page:
+        self.started.append(index)
+        await asyncio.sleep(self.delay)
+        self.completed.append(index)
+        start = index * self.page_size
+        items = list(range(start, min(start + self.page_size, self.size)))
+        return Page(items, self.size if self.report_total else None)
+
+
+@pytest.mark.asyncio
+async def test_streams_every_item_in_order():
+    """All pages are read, in order, with or without a reported total."""
+    for report_total in (True, False):
+        collection = FakeCollection(size=25, page_size=10, report_total=report_total)
+
+        items = [item async for item in iter_pages(collection.fetch_page, 10)]
+
+        assert items == list(range(25))
+
+
+@pytest.mark.asyncio
+async def test_prefetches_next_pages_while_consuming():
+    """Next pages are requested before the current page is fully consumed."""
+    collection = FakeCollection(size=100, page_size=10)
+    iterator = iter_pages(collection.fetch_page, 10, prefetch=2)
+
+    assert await anext(iterator) == 0
+    await asyncio.sleep(0)
+    assert collection.started == [0, 1, 2]
+
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_total_stops_without_fetching_past_the_end():
+    """A reported total keeps the iterator from requesting pages past the end."""
+    collection = FakeCollection(size=30, page_size=10)
+
+    items = [item async for item in iter_pages(collection.fetch_page, 10, prefetch=5)]
+
+    assert items == list(range(30))
+    assert sorted(collection.started) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_max_items_bounds_fetches():
+    """Iteration stops at max_items and no page beyond it is requested."""
+    collection = FakeCollection(size=1000, page_size=10)
+
+    items = [item async for item in iter_pages(collection.fetch_page, 10, prefetch=5, max_items=25)]
+
+    assert items == list(range(25))
+    assert max(collection.started) == 2
+
+
+@pytest.mark.asyncio
+async def test_max_buffered_items_limits_prefetch():
+    """Prefetching never buffers more pages than max_buffered_items allows."""
+    collection = FakeCollection(size=1000, page_size=10)
+    iterator = iter_pages(collection.fetch_page, 10, prefetch=10, max_buffered_items=30)
+
+    await anext(iterator)
+    await asyncio.sleep(0)
+    assert collection.started == [0, 1, 2]
+
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_early_close_cancels_pending_fetches():
+    """Closing the iterator early cancels the prefetched pages still in flight."""
+    collection = FakeCollection(size=1000, page_size=10, delay=0.05)
+
+    async with aclosing(iter_pages(collection.fetch_page, 10, prefetch=3)) as iterator:
+        async for item in iterator:
+            if item == 3:
+                break
+
+    # Prefetched pages would have completed by now had they not been cancelled
+    await asyncio.sleep(0.1)
+    assert collection.completed == [0]
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_propagate():
+    """A failing page fetch raises from the iterator and cancels the other fetches."""
+    collection = FakeCollection(size=1000, page_size=10, delay=0.01)
+
+    async def fetch_page(index: int) -> Page:
+        if index == 1:
+            raise RuntimeError("upstream failed")
+        return await collection.fetch_page(index)
+
+    items = []
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        async for item in iter_pages(fetch_page, 10, prefetch=3):
+            items.append(item)
+
+    assert items == list(range(10))
+    await asyncio.sleep(0.05)
+    assert 2 not in collection.completed
+
+
+@pytest.fixture
+def legacy_romm(monkeypatch):
+    """Serve 250 ROMs as a plain list, honouring the limit only (like older RomM)."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.url.params))
+        limit = int(request.url.params.get("limit", 250))
+        return httpx.Response(200, json=[{"id": rom_id, "name": f"ROM {rom_id}"} for rom_id in range(min(limit, 250))])
+
+    def get_client(service_key, config_hash, **client_kwargs):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client_kwargs["base_url"])
+
+    monkeypatch.setattr(pool_module.http_client_pool, "get_client", get_client)
+    monkeypatch.setattr(base_module.http_client_pool, "get_client", get_client)
+    yield requests
+
+
+@pytest.mark.asyncio
+async def test_romm_plain_list_returns_the_requested_limit(legacy_romm):
+    """Older RomM versions ignore the offset, so the whole limit is requested at once."""
+    config = SimpleNamespace(id="romm-1", base_url="http://romm:8080", port=None, api_key="token", config={})
+    adapter = RommAdapter(config)
+
+    roms = await adapter.get_roms(limit=150)
+
+    assert [rom["id"] for rom in roms] == list(range(150))
+    assert [params.get("limit") for params in legacy_romm] == ["100", "150"]
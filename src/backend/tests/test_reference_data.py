@@ -0,0 +1,46 @@
+"""Tests for the shared *arr reference data cache."""
+
+import httpx
+import pytest
+
+from src.adapters import pool as pool_module
+from src.adapters.reference_data import arr_reference_cache
+from src.mcp.tools.radarr_tools import RadarrTools
+from src.routers.mcp import refresh_reference_data
+
+
+@pytest.fixture
+def radarr_upstream(monkeypatch):
+    """Serve Radarr root folders from a mock transport and count the requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json=[{"id": 1, "path": "/movies", "freeSpace": 1024, "accessible": True}])
+
+    def get_client(service_key, config_hash, **client_kwargs):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=client_kwargs["base_url"])
+
+    monkeypatch.setattr(pool_module.http_client_pool, "get_client", get_client)
+    pool_module.adapter_pool.clear()
+    arr_reference_cache.invalidate()
+    yield requests
+    pool_module.adapter_pool.clear()
+    arr_reference_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_refresh_by_service_id_drops_entries_cached_by_tool_calls(radarr_upstream):
+    """Reference data fetched through an MCP tool is dropped by a per-service refresh."""
+    tools = RadarrTools({"id": "radarr-1", "base_url": "http://radarr:7878", "api_key": "key"})
+
+    result = await tools.execute("radarr_get_root_folders", {})
+    assert result["success"]
+    await tools.execute("radarr_get_root_folders", {})
+    assert radarr_upstream.count("/api/v3/rootfolder") == 1
+
+    response = await refresh_reference_data(service_id="radarr-1")
+    assert response["removed"] == 1
+
+    await tools.execute("radarr_get_root_folders", {})
+    assert radarr_upstream.count("/api/v3/rootfolder") == 2
@@ -0,0 +1,46 @@
+"""Tests for the read-only MCP tool result cache."""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+from src.mcp.tools.result_cache import ToolResultCache
+
+
+def make_definition(name: str = "plex_get_libraries") -> SimpleNamespace:
+    return SimpleNamespace(name=name, is_mutation=False, requires_service="plex", category="media")
+
+
+@pytest.mark.asyncio
+async def test_stale_refresh_survives_garbage_collection_and_is_awaited_on_close():
+    """Background refreshes are referenced until done and awaited by close()."""
+    cache = ToolResultCache(stale_ttl=60.0)
+    cache.configure(ttls={"plex_get_libraries": 0.01})
+    definition = make_definition()
+    tool = SimpleNamespace(config_fingerprint="fingerprint")
+    release = asyncio.Event()
+    calls = []
+
+    async def execute():
+        calls.append(len(calls))
+        if len(calls) > 1:
+            await release.wait()
+        return {"success": True, "result": len(calls)}
+
+    assert (await cache.run(definition, tool, {}, execute))["result"] == 1
+    await asyncio.sleep(0.02)
+
+    # Stale entry: served at once while a refresh runs in the background
+    assert (await cache.run(definition, tool, {}, execute))["result"] == 1
+    gc.collect()
+    assert cache.get_stats()["refreshing"] == 1
+
+    release.set()
+    await cache.close()
+
+    assert cache.get_stats()["refreshing"] == 0
+    assert cache.get_stats()["refreshes"] == 1
+    assert (await cache.run(definition, tool, {}, execute))["result"] == 2
+    await cache.close()
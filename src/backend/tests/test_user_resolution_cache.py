@@ -0,0 +1,28 @@
+"""Tests for the Open WebUI user resolution cache."""
+
+import base64
+import json
+
+from src.services.user_resolution_cache import UserResolutionCache
+
+
+def make_token(payload: dict, signature: str) -> str:
+    """Build an unsigned-looking JWT with the given payload and signature part."""
+
+    def encode(part: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.{signature}"
+
+
+def test_forged_token_with_copied_claims_misses_cache():
+    """A token copying another user's id and exp does not get their cached resolution."""
+    cache = UserResolutionCache()
+    claims = {"id": "victim", "exp": 4102444800}
+    genuine = make_token(claims, "genuine-signature")
+    forged = make_token(claims, "forged-signature")
+
+    cache.set_user(cache.token_key(genuine), {"id": "victim", "email": "victim@example.com"})
+
+    assert cache.get_user(cache.token_key(genuine))["email"] == "victim@example.com"
+    assert cache.get_user(cache.token_key(forged)) is None